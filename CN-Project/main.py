@@ -1,28 +1,392 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import math
+import tkinter.font as tkfont
+import heapq
+import queue
 import random
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
 import time
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib
-matplotlib.use('TkAgg')
+import types
+from functools import lru_cache
+from operator import itemgetter
+import numpy as np
+try:
+    from numba import njit  # optional: compiles the routing and packet-advance kernels when installed
+except ImportError:
+    njit = None
+try:
+    from scipy.sparse import csr_matrix  # optional: SciPy's compiled Dijkstra when installed
+    from scipy.sparse.csgraph import dijkstra as csgraph_dijkstra
+except ImportError:
+    csr_matrix = None
+# matplotlib is only needed by the analysis windows; _load_matplotlib() fills these in on first use
+matplotlib = plt = FigureCanvasTkAgg = None
+LineCollection = PolyCollection = to_rgba_array = Line2D = None
+
+
+def _load_matplotlib():
+    """Import matplotlib (TkAgg) on first use, so the main window starts without it"""
+    global matplotlib, plt, FigureCanvasTkAgg, LineCollection, PolyCollection, to_rgba_array, Line2D
+    if plt is not None:
+        return
+    import matplotlib
+    matplotlib.use('TkAgg')
+    # Drop sub-pixel vertices when drawing dense traces, and rasterize very long paths in chunks
+    matplotlib.rcParams.update({'path.simplify': True, 'path.simplify_threshold': 1.0, 'agg.path.chunksize': 10000})
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.colors import to_rgba_array
+    from matplotlib.lines import Line2D
+
+# Number of reusable packet cards shown in the details panel
+PACKET_CARD_COUNT = 15
+# Timeline events that are always recorded; the rest are sampled 1-in-N
+IMPORTANT_PACKET_EVENTS = frozenset({"created", "delivered", "dropped", "timeout", "fast_retransmit",
+                                     "exit_fast_recovery", "manual_created"})
+PACKET_EVENT_SAMPLE_EVERY = 10
+# Timeline event-log capacity; its columns are preallocated, so memory stays fixed however long the run
+PACKET_EVENT_LIMIT = 500
+# Learning-mode timeout tooltip per congestion algorithm: (title, closing line)
+TIMEOUT_TOOLTIPS = {
+    "reno": ("TCP Reno Timeout", "Restarting Slow Start."),
+    "tahoe": ("TCP Tahoe Timeout", "Returning to Slow Start."),
+}
+# Upper bounds of the low/medium/high congestion levels (anything above is critical)
+CONGESTION_LEVEL_BOUNDS = np.array([1.0, 3.0, 5.0])
+# Max memoized (source, destination) routes kept per topology version (least recently used go first)
+PATH_CACHE_LIMIT = 4096
+# Packet radius by whole cwnd: clamp(5 + cwnd/2, 5, 15); indices past the end clip to the last entry
+PACKET_SIZE_LUT = np.clip(5 + np.arange(64) // 2, 5, 15)
+# Status bar line shown while the simulation runs
+STATUS_FMT = "{algo} | Active: SS:{ss}, CA:{ca}, FR:{fr}, FRec:{frec} | Loss Rate: {loss:.1f}%"
+# Cap on full performance-figure redraws per second; Refresh clicks inside the window coalesce
+PERF_MAX_REDRAW_RATE = 20.0
+# Per-traffic-load congestion added per spawned packet and removed per decay tick
+TRAFFIC_CONGESTION = {"light": 0.5, "medium": 1.0, "heavy": 2.0}
+TRAFFIC_DECAY = {"light": 0.2, "medium": 0.2, "heavy": 0.1}
+# Routed-packet records kept for the routing analysis view
+PATH_HISTORY_LIMIT = 100
+# Longest series drawn per trace, about one point per pixel of a subplot; longer ones are stride-thinned
+PERF_MAX_PLOT_POINTS = 500
+# Hit-test radii, pre-squared so lookups never take a square root
+NODE_HIT_RADIUS_SQ = 30 * 30
+PACKET_HOVER_RADIUS_SQ = 20 * 20
+
+
+def _plot_points(n, max_points=PERF_MAX_PLOT_POINTS):
+    """Index selecting at most max_points of n evenly spaced samples, first and last included"""
+    if n <= max_points:
+        return slice(None)
+    return np.linspace(0, n - 1, max_points).astype(np.intp)
+
+
+def _centered_mean(values, window):
+    """Moving average over a centered window, averaging fewer samples where it overhangs the ends"""
+    n = len(values)
+    sums = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+    idx = np.arange(n)
+    lo = np.maximum(idx - window // 2, 0)
+    hi = np.minimum(idx + window // 2 + 1, n)
+    return (sums[hi] - sums[lo]) / (hi - lo)
+
+
+def _full_height_lines(xs):
+    """Vertical segments at xs spanning the axes, for a collection drawn in ax.get_xaxis_transform()"""
+    xs = np.asarray(xs, dtype=np.float64)
+    return np.column_stack((xs, np.zeros_like(xs), xs, np.ones_like(xs))).reshape(-1, 2, 2)
+
+
+def _full_height_spans(starts, ends):
+    """Rectangles from starts to ends spanning the axes, for a collection drawn in ax.get_xaxis_transform()"""
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    bottom, top = np.zeros_like(starts), np.ones_like(starts)
+    return np.column_stack((starts, bottom, ends, bottom, ends, top, starts, top)).reshape(-1, 4, 2)
+
+
+def _tcl_word(value):
+    """Quote one value (or a tuple, as a Tcl list) as a single word for a tk.eval script"""
+    if isinstance(value, (tuple, list)):
+        value = " ".join(_tcl_word(v) for v in value)
+    text = str(value)
+    if not text:
+        return "{}"
+    return "".join("\\n" if ch == "\n" else ("\\" + ch if ch in ' \t{}[]$";\\' else ch) for ch in text)
+
+
+def _dijkstra_csr_py(indptr, indices, weights, src, n):
+    """Single-source binary-heap Dijkstra over CSR adjacency arrays; returns (dist, prev)"""
+    # Plain lists index far faster than numpy scalars inside an interpreted loop
+    indptr, indices, weights = indptr.tolist(), indices.tolist(), weights.tolist()
+    inf = float('inf')
+    dist = [inf] * n
+    prev = [-1] * n
+    dist[src] = 0.0
+    heap = [(0.0, src)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue  # stale entry; u was settled at a shorter distance
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            alt = d + weights[k]
+            if alt < dist[v]:
+                dist[v] = alt
+                prev[v] = u
+                heapq.heappush(heap, (alt, v))
+    return np.array(dist), np.array(prev, dtype=np.int32)
+
+
+def _dijkstra_csr_heap(indptr, indices, weights, src, n):
+    """Binary-heap Dijkstra over CSR arrays, written as plain loops for numba"""
+    dist = np.full(n, np.inf)
+    prev = np.full(n, -1, dtype=np.int32)
+    dist[src] = 0.0
+    # Every heap entry is (float64, int64); numba rejects pushes whose item type differs from the seed's
+    heap = [(0.0, np.int64(src))]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for k in range(indptr[u], indptr[u + 1]):
+            v = np.int64(indices[k])
+            alt = d + weights[k]
+            if alt < dist[v]:
+                dist[v] = alt
+                prev[v] = u
+                heapq.heappush(heap, (alt, v))
+    return dist, prev
+
+
+def _dijkstra_csgraph(indptr, indices, weights, src, n):
+    """SciPy csgraph Dijkstra over the same CSR arrays, with 'no predecessor' mapped to -1"""
+    graph = csr_matrix((weights, indices, indptr), shape=(n, n))
+    dist, prev = csgraph_dijkstra(graph, indices=src, return_predecessors=True)
+    return dist, np.where(prev < 0, -1, prev).astype(np.int32)
+
+
+if csr_matrix is not None:
+    dijkstra_csr = _dijkstra_csgraph
+elif njit is not None:
+    dijkstra_csr = njit(cache=True)(_dijkstra_csr_heap)
+else:
+    dijkstra_csr = _dijkstra_csr_py
+
+
+def advance_hops(node_x, node_y, node_congestion, src, dst, progress, cwnd, size_lut):
+    """Packet positions, sizes and hop completion for one tick; advances progress in place"""
+    xs = node_x[src] + (node_x[dst] - node_x[src]) * progress
+    ys = node_y[src] + (node_y[dst] - node_y[src]) * progress
+    sizes = size_lut.take(cwnd.astype(np.intp), mode='clip')
+    speeds = np.maximum(0.01, 0.05 * (1 - node_congestion[src] * 0.05))
+    np.add(progress, speeds, out=progress)
+    done = progress >= 1.0
+    progress[done] = 0
+    return xs, ys, sizes, done
+
+
+def _advance_hops_loop(node_x, node_y, node_congestion, src, dst, progress, cwnd, size_lut):
+    """advance_hops as one fused loop, written for numba"""
+    n = progress.shape[0]
+    xs = np.empty(n)
+    ys = np.empty(n)
+    sizes = np.empty(n, dtype=size_lut.dtype)
+    done = np.zeros(n, dtype=np.bool_)
+    last = size_lut.shape[0] - 1
+    for i in range(n):
+        a, b, t = src[i], dst[i], progress[i]
+        xs[i] = node_x[a] + (node_x[b] - node_x[a]) * t
+        ys[i] = node_y[a] + (node_y[b] - node_y[a]) * t
+        sizes[i] = size_lut[min(max(int(cwnd[i]), 0), last)]
+        t += max(0.01, 0.05 * (1 - node_congestion[a] * 0.05))
+        if t >= 1.0:
+            t = 0.0
+            done[i] = True
+        progress[i] = t
+    return xs, ys, sizes, done
+
+
+if njit is not None:
+    advance_hops = njit(cache=True)(_advance_hops_loop)
+
+
+# Node type codes (index into the NODE_TYPE_* tables below)
+CLOUD, ROUTER, SWITCH, PC = 0, 1, 2, 3
+NODE_TYPE_NAMES = ('cloud', 'router', 'switch', 'pc')
+NODE_TYPE_ICONS = ('☁', '⚡', '⊞', '💻')
+NODE_TYPE_IDS = {name: code for code, name in enumerate(NODE_TYPE_NAMES)}
+
+
+class NodeStore:
+    """Structure-of-arrays backing for node position, type, congestion and latency"""
+    def __init__(self, count):
+        self.type = np.zeros(count, dtype=np.uint8)
+        self.x = np.zeros(count, dtype=np.float64)
+        self.y = np.zeros(count, dtype=np.float64)
+        self.congestion = np.zeros(count, dtype=np.float64)
+        self.latency = np.zeros(count, dtype=np.float64)
+
+
+class PerfHistory:
+    """Rolling (time, latency, throughput) samples as contiguous float64 columns"""
+    def __init__(self, capacity):
+        self.capacity = capacity
+        # Twice the window, so the live samples stay one contiguous slice between slides
+        self._buf = np.zeros((3, capacity * 2), dtype=np.float64)
+        self._start = 0
+        self._end = 0
+        self.throughput_sum = 0.0  # over the live window, for O(1) averages
+
+    def __len__(self):
+        return self._end - self._start
+
+    def append(self, stamp, latency, throughput):
+        if self._end == self._buf.shape[1]:
+            # Slide the live window back to the front; happens once every `capacity` appends
+            count = self._end - self._start
+            self._buf[:, :count] = self._buf[:, self._start:self._end]
+            self._start, self._end = 0, count
+        self._buf[:, self._end] = (stamp, latency, throughput)
+        self._end += 1
+        self.throughput_sum += throughput
+        if self._end - self._start > self.capacity:
+            self.throughput_sum -= self._buf[2, self._start]
+            self._start += 1
+
+    def clear(self):
+        self._start = self._end = 0
+        self.throughput_sum = 0.0
+
+    def mean_throughput(self):
+        count = self._end - self._start
+        return self.throughput_sum / count if count else 0
+
+    # Zero-copy views of the live window, oldest sample first
+    @property
+    def times(self):
+        return self._buf[0, self._start:self._end]
+
+    @property
+    def latencies(self):
+        return self._buf[1, self._start:self._end]
+
+    @property
+    def throughputs(self):
+        return self._buf[2, self._start:self._end]
+
+
+class PacketEventLog:
+    """Rolling packet event log stored column-wise, one contiguous array per field"""
+    FIELDS = ('time', 'packet_id', 'cwnd', 'phase', 'rtt', 'event_type', 'throughput', 'node_congestion')
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        # Twice the window, so the live events stay one contiguous slice between slides
+        size = capacity * 2
+        self._cols = {name: np.zeros(size, dtype=np.float64)
+                      for name in ('time', 'cwnd', 'rtt', 'throughput', 'node_congestion')}
+        self._cols['packet_id'] = np.zeros(size, dtype=np.int64)
+        self._cols['phase'] = np.empty(size, dtype=object)
+        self._cols['event_type'] = np.empty(size, dtype=object)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __getitem__(self, name):
+        """Zero-copy view of one column over the live window, oldest event first"""
+        return self._cols[name][self._start:self._end]
+
+    def append(self, *values):
+        """Add one event, given in FIELDS order"""
+        cols = self._cols
+        if self._end == self.capacity * 2:
+            # Slide the live window back to the front; happens once every `capacity` appends
+            count = self._end - self._start
+            for col in cols.values():
+                col[:count] = col[self._start:self._end]
+            self._start, self._end = 0, count
+        end = self._end
+        for name, value in zip(self.FIELDS, values):
+            cols[name][end] = value
+        self._end = end + 1
+        if self._end - self._start > self.capacity:
+            self._start += 1
+
+    def oldest(self, name):
+        return self._cols[name][self._start]
+
+    def clear(self):
+        self._start = self._end = 0
+
+    def packet_ids(self):
+        """Distinct packet ids, in the order of their oldest retained event"""
+        pids = self['packet_id']
+        _, first = np.unique(pids, return_index=True)
+        return pids[np.sort(first)]
+
+    def rows_for(self, packet_id):
+        """Positions (into the column views) of one packet's events, oldest first"""
+        return np.flatnonzero(self['packet_id'] == packet_id)
 
 
 class NetworkNode:
-    def __init__(self, x, y, node_type, name):
+    def __init__(self, x, y, node_type, name, latency=None, throughput=None):
+        # Until the simulator packs it into the shared store, a node owns a 1-slot store
+        self._store = NodeStore(1)
+        self.index = 0
         self.x = x
         self.y = y
-        self.type = node_type  # 'cloud', 'router', 'switch', 'pc'
+        # CLOUD/ROUTER/SWITCH/PC code; type names are still accepted for convenience
+        self.type = NODE_TYPE_IDS[node_type] if isinstance(node_type, str) else node_type
         self.name = name
         self.connections = []
         self.packets = []
-        self.latency = random.randint(5, 50)
-        self.throughput = random.randint(100, 1000)
+        self.latency = latency if latency is not None else random.randint(5, 50)
+        self.throughput = throughput if throughput is not None else random.randint(100, 1000)
         self.congestion = 0
         self.hop_count = 0  # NEW: Track hop count
 
+    @property
+    def x(self):
+        return self._store.x[self.index]
+
+    @x.setter
+    def x(self, value):
+        self._store.x[self.index] = value
+
+    @property
+    def y(self):
+        return self._store.y[self.index]
+
+    @y.setter
+    def y(self, value):
+        self._store.y[self.index] = value
+
+    @property
+    def congestion(self):
+        return self._store.congestion[self.index]
+
+    @congestion.setter
+    def congestion(self, value):
+        self._store.congestion[self.index] = value
+
+    @property
+    def type_name(self):
+        return NODE_TYPE_NAMES[self.type]
+
+    def bind_store(self, store, index):
+        """Move this node's state into slot `index` of a shared NodeStore"""
+        store.type[index] = self.type
+        store.x[index] = self.x
+        store.y[index] = self.y
+        store.congestion[index] = self.congestion
+        store.latency[index] = self.latency
+        self._store = store
+        self.index = index
+
     # NEW: Get congestion level category
     def get_congestion_level(self):
         """Returns congestion level: 'low', 'medium', 'high', 'critical'"""
@@ -35,14 +399,92 @@ class NetworkNode:
         else:
             return 'critical'
         
+class PacketTally:
+    """Running aggregates over the simulator's active packets"""
+    def __init__(self):
+        self.phase_counts = {"slow_start": 0, "congestion_avoidance": 0,
+                             "fast_retransmit": 0, "fast_recovery": 0}
+        self.active = 0
+        self.cwnd_sum = 0.0
+        self.lost_count = 0
+
+    def add(self, packet):
+        self.active += 1
+        self.phase_counts[packet.phase] += 1
+        self.cwnd_sum += packet.cwnd
+        self.lost_count += packet.lost
+        packet.tally = self
+
+    def remove(self, packet):
+        packet.tally = None
+        self.active -= 1
+        self.phase_counts[packet.phase] -= 1
+        self.lost_count -= packet.lost
+        # Re-anchor the float sum when nothing is in flight so rounding can't drift
+        self.cwnd_sum = self.cwnd_sum - packet.cwnd if self.active else 0.0
+
+class EventTally:
+    """Running cwnd/throughput/loss aggregates over the retained packet event log"""
+    def __init__(self):
+        self.count = 0
+        self.cwnd_sum = 0.0
+        self.throughput_sum = 0.0
+        self.dropped = 0
+        self._added = 0
+        self._removed = 0
+        self._cwnd_peaks = deque()  # (sequence, cwnd) with decreasing cwnd; the head is the window maximum
+
+    def add(self, cwnd, throughput, dropped):
+        self.count += 1
+        self.cwnd_sum += cwnd
+        self.throughput_sum += throughput
+        self.dropped += dropped
+        peaks = self._cwnd_peaks
+        while peaks and peaks[-1][1] <= cwnd:
+            peaks.pop()
+        peaks.append((self._added, cwnd))
+        self._added += 1
+
+    def remove(self, cwnd, throughput, dropped):
+        """Forget the oldest event (the log is FIFO, so only the head can leave)"""
+        self.count -= 1
+        self.dropped -= dropped
+        if self.count:
+            self.cwnd_sum -= cwnd
+            self.throughput_sum -= throughput
+        else:
+            # Re-anchor the float sums when the log empties so rounding can't drift
+            self.cwnd_sum = self.throughput_sum = 0.0
+        if self._cwnd_peaks and self._cwnd_peaks[0][0] == self._removed:
+            self._cwnd_peaks.popleft()
+        self._removed += 1
+
+    @property
+    def cwnd_max(self):
+        return self._cwnd_peaks[0][1] if self._cwnd_peaks else 0
+
 class Packet:
+    _PHASE_COLORS = {
+        "slow_start": "#28a745",          # Professional green
+        "congestion_avoidance": "#0066cc", # Professional blue
+        "fast_retransmit": "#ffc107",     # Amber
+        "fast_recovery": "#fd7e14"        # Orange
+    }
+
     def __init__(self, source, destination, path, packet_id=None):
+        self.reset(source, destination, path, packet_id)
+
+    def reset(self, source, destination, path, packet_id=None):
+        """(Re)initialize every field so pooled packets can be reused"""
+        self.tally = None  # Simulator's PacketTally while this packet is active
         self.source = source
         self.destination = destination
         self.path = path
         self.current_index = 0
         self.progress = 0
-        self.hop_count = len(path) - 1  # NEW: Calculate hops
+        self.path_len = len(path)  # Cached; path is fixed for the packet's lifetime
+        self.path_idx = None  # Node-store indices of path, set by the simulator on spawn
+        self.hop_count = self.path_len - 1  # NEW: Calculate hops
         self.total_latency = 0  # NEW: Track cumulative latency
         self.timestamp = time.time()  # NEW: Packet creation time
         self.completed = False  # NEW: Track if packet reached destination
@@ -59,25 +501,48 @@ class Packet:
         self.bytes_acked = 0  # Total bytes acknowledged
         self.lost = False  # Whether packet was lost
         self.retransmitted = False  # Whether packet was retransmitted
+        self.canvas_item_id = None  # Persistent canvas oval, moved with coords()
+        self.canvas_fill = None  # Fill last written to canvas_item_id
+        self.drawn_at = None  # (x, y, radius) last written to canvas_item_id
         
         # Phase-based color scheme
         self.color = self.get_phase_color()
         
     def get_phase_color(self):
         """Return color based on current congestion control phase"""
-        phase_colors = {
-            "slow_start": "#28a745",          # Professional green
-            "congestion_avoidance": "#0066cc", # Professional blue
-            "fast_retransmit": "#ffc107",     # Amber
-            "fast_recovery": "#fd7e14"        # Orange
-        }
-        return phase_colors.get(self.phase, "#ffffff")
+        return Packet._PHASE_COLORS.get(self.phase, "#ffffff")
 
     def set_phase(self, phase_name):
         """Helper to update packet phase and visual color"""
+        if phase_name == self.phase:
+            return  # e.g. update_cwnd already moved it to congestion_avoidance
+        if self.tally is not None:
+            counts = self.tally.phase_counts
+            counts[self.phase] -= 1
+            counts[phase_name] += 1
         self.phase = phase_name
         self.color = self.get_phase_color()
     
+    @property
+    def cwnd(self):
+        return self._cwnd
+
+    @cwnd.setter
+    def cwnd(self, value):
+        if self.tally is not None:
+            self.tally.cwnd_sum += value - self._cwnd
+        self._cwnd = value
+
+    @property
+    def lost(self):
+        return self._lost
+
+    @lost.setter
+    def lost(self, value):
+        if self.tally is not None:
+            self.tally.lost_count += bool(value) - self._lost
+        self._lost = bool(value)
+
     def update_cwnd(self, algorithm="reno"):
         """Update congestion window based on current phase and algorithm"""
         if self.phase == "slow_start":
@@ -95,6 +560,29 @@ class Packet:
             # Tahoe doesn't have fast recovery, so this shouldn't happen
 
 class CloudNetworkSimulator:
+    @property
+    def highlighted_path(self):
+        return self._highlighted_path
+
+    @highlighted_path.setter
+    def highlighted_path(self, path):
+        # Edge set is derived once per assignment so link styling is a set lookup per link
+        self._highlighted_path = path
+        self._highlighted_edges = frozenset(frozenset(pair) for pair in zip(path, path[1:]))
+
+    # Read-only views of the rolling performance samples
+    @property
+    def time_stamps(self):
+        return self.perf_history.times
+
+    @property
+    def latency_history(self):
+        return self.perf_history.latencies
+
+    @property
+    def throughput_history(self):
+        return self.perf_history.throughputs
+
     def __init__(self, root):
         self.root = root
         self.root.title("Cloud Network Simulator - TCP Congestion Control Analytics")
@@ -110,6 +598,7 @@ class CloudNetworkSimulator:
         # Data structures
         self.nodes = []
         self.connections = []
+        self._link_set = set()  # frozenset({a, b}) per link, for O(1) "already connected?" checks
         self.packets = []
         self.selected_node = None
         self.dragging_node = None
@@ -117,18 +606,76 @@ class CloudNetworkSimulator:
         self.simulation_running = False
         self.highlighted_path = []  # NEW: Store path to highlight
 
-        self.latency_history = []
-        self.throughput_history = []
-        self.time_stamps = []
+        # Shortest-path memo, dropped whenever nodes/links change
+        self._path_cache = {}
+        self._topology_version = 0
+        # SoA view of node state, re-packed on every topology change
+        self._node_store = NodeStore(0)
+        self.node_type = self._node_store.type
+        self.node_x = self._node_store.x
+        self.node_y = self._node_store.y
+        self.node_congestion = self._node_store.congestion
+        self.node_latency = self._node_store.latency
+        self._mean_node_latency = 0.0  # cached with the node arrays, which only change with the topology
+        self._node_index = {}
+        self._nodes_by_name = {}  # name -> node, rebuilt with the node arrays
+        self._adj = {}  # node index -> int32 array of neighbor indices
+        # CSR adjacency (rebuilt lazily per topology version) + per-source results
+        self._csr_version = -1
+        self._csr_indptr = np.zeros(1, dtype=np.int32)
+        self._csr_neighbors = np.zeros(0, dtype=np.int32)
+        self._csr_latency = np.zeros(0, dtype=np.float64)
+        self._sssp_cache = {}
+        # Finished Packet objects kept for reuse by spawn_packet
+        self._packet_pool = []
+        # Phase counts, cwnd sum and loss count over active packets, kept current by Packet
+        self._tally = PacketTally()
+        # Last drawn packet centres (parallel to _pkt_refs), used by hover hit-tests
+        self._pkt_refs = []
+        self._pkt_x = np.zeros(0, dtype=np.float64)
+        self._pkt_y = np.zeros(0, dtype=np.float64)
+        if njit is not None:
+            # Compile the hop kernel now instead of on the first simulation tick
+            origin, hop = np.zeros(1), np.zeros(1, dtype=np.intp)
+            advance_hops(origin, origin, origin, hop, hop, np.zeros(1), np.ones(1), PACKET_SIZE_LUT)
+        # Performance graph window, built once and refreshed in place
+        self._perf_window = None
+        self._perf_hidden = False  # a closed window is withdrawn and reused on the next open
+        self._perf_fig = None
+        self._perf_axes = ()
+        self._perf_lines = {}
+        self._perf_artists = {}  # graphs 3-6 artists, updated in place on refresh
+        self._perf_canvas = None
+        self._perf_stats_label = None
+        self._perf_backgrounds = {}  # axes -> pixels under the live traces, captured on each full draw
+        self._perf_refresh_after_id = None
+        self._perf_last_redraw = 0.0
+        # Packet timeline window, built once, hidden on close and refreshed in place on reopen
+        self._timeline_window = None
+        self._timeline_fig = None
+        self._timeline_canvas = None
+        self._timeline_axes = ()
+        self._timeline_artists = {}
+        self._timeline_refresh_after_id = None
+        # Path finder / settings / metrics windows: name -> (window, refresh), hidden on close and reused
+        self._tool_windows = {}
+
+        # Rolling performance window (oldest samples fall off automatically)
+        self.history_limit = 50
+        self.perf_history = PerfHistory(self.history_limit)
         self.performance_start_time = time.time()
+        self._tick_time = self.performance_start_time  # Clock sampled once per simulation step
 
         self.traffic_load = "medium"  # Options: "light", "medium", "heavy"
+        self._congestion_factor = TRAFFIC_CONGESTION[self.traffic_load]
+        self._decay_rate = TRAFFIC_DECAY[self.traffic_load]
         self.packet_generation_rate = 1000  # milliseconds
         
         # NEW: Manual Packet Mode
         self.manual_packet_mode = False
         self.manual_packets = []  # Store manually sent packets with details
         self.active_manual_packet_ids = set()  # Track which packets are from manual sends
+        self._packets_by_id = {}  # packet_id -> live Packet, kept in step with self.packets
         
         # Congestion Control Settings
         self.congestion_algorithm = "reno"  # Options: "reno", "tahoe"
@@ -137,7 +684,9 @@ class CloudNetworkSimulator:
         self.packet_counter = 0  # Global packet counter for unique IDs
         
         # Packet Timeline Tracking
-        self.packet_events = []  # Store: {time, packet_id, cwnd, phase, rtt, event_type, throughput}
+        self.packet_events = PacketEventLog(PACKET_EVENT_LIMIT)  # columns: time, packet_id, cwnd, phase, rtt, event_type, throughput, node_congestion
+        self._event_tally = EventTally()
+        self._sampled_event_accum = Counter()  # (event_type, phase) -> routine events since last kept
         self.manual_source_var = None
         self.manual_dest_var = None
         self.manual_source_dropdown = None
@@ -145,11 +694,46 @@ class CloudNetworkSimulator:
         self.manual_send_btn = None
         self.manual_packet_details = None  # NEW: Track manual packet details
         self.packet_details_timer = None
+        # Reusable packet cards for the details panel (built on first use)
+        self._packet_card_container = None
+        self._packet_card_pool = []
+        self._packet_card_empty = None
+        self._packet_card_overflow = None
+        self._packet_card_snapshot = None
+        # Manual-packet analysis panel, built once and reconfigured in place
+        self._manual_panel = None
+        self._manual_labels = {}
+        self._manual_shown = {}
+        self._manual_panel_packed = False
+        self._packet_details_stale = False
+        self._packets_dirty = True  # set whenever packet state changes; cleared when cards refresh
+        # Bounded queue for deferred UI work; items past the limit are dropped
+        self._work_q = queue.Queue(maxsize=256)
+        self._work_after_id = None
+        self._work_dropped = 0
+        # Latest pointer event plus the 30ms timer that hit-tests it
+        self._pending_motion = None
+        self._motion_after_id = None
         self.debug_logging = True
         # Double-buffer / draw control
         self.redraw_scheduled = False
+        self._redraw_after_id = None
         self.last_draw_time = 0
         self.min_draw_interval = 0.1  # seconds (100ms)
+        # Persistent canvas items, diffed against the topology instead of repainted
+        self._node_items = {}            # node -> (body_id, icon_id, label_id, badge_id, badge_text_id)
+        self._badge_shown = {}           # node -> (fill, text) last written to its congestion badge
+        self._conn_items = {}            # (node1, node2) -> {'line', 'bw', 'text', 'fill'}
+        self._link_entries = []          # _conn_items values, parallel to _link_ends rows
+        self._link_ends = np.zeros((0, 2), dtype=np.intp)
+        self._link_util_shown = np.zeros(0)
+        self._selection_item = None
+        self._items_topology_version = -1
+        self._items_layout_key = None
+        self._link_style_key = None
+        self._selection_draw_key = None
+        self._layout_version = 0
+        self._layers_dirty = True  # item stacking needs restoring (new topology/selection items)
 
         # Topology/layout
         self.topology_margin = 80
@@ -157,6 +741,12 @@ class CloudNetworkSimulator:
         # Performance controls
         self.max_packets = 50
         self.performance_mode = False
+        # Heavy-traffic frame skipping: only every Nth draw_network tick touches the canvas
+        self._frame_skip_counter = 0
+        self._draw_every_n = 1
+        # Token bucket pacing automatic packet generation (rate in packets/second)
+        self._token_bucket = {'tokens': 1.0, 'capacity': self.max_packets,
+                              'rate': 1000.0 / self.packet_generation_rate, 'last': time.time()}
 
          # NEW: Routing Analysis Variables
         self.routing_stats = {
@@ -164,7 +754,7 @@ class CloudNetworkSimulator:
             'avg_hop_count': 0,
             'min_hops': float('inf'),
             'max_hops': 0,
-            'path_history': []
+            'path_history': deque(maxlen=PATH_HISTORY_LIMIT)
         }
         
         # Professional light theme palette
@@ -240,6 +830,49 @@ class CloudNetworkSimulator:
                 "desc": "Temporarily inflates cwnd to keep pipeline full after retransmit."
             }
         }
+        # Phase -> theme color for graph plotting (includes the synthetic "dropped" phase)
+        self.phase_plot_colors = {key: meta["color"] for key, meta in self.phase_definitions.items()}
+        self.phase_plot_colors["dropped"] = self.colors['error']
+        # The same phases by integer code, with their RGBA rows and legend labels, for array-indexed plotting
+        self._plot_phases = tuple(self.phase_plot_colors)
+        self._plot_phase_code = {phase: code for code, phase in enumerate(self._plot_phases)}
+        self._plot_phase_rgba = None  # set when the timeline figure is first built
+        self._plot_phase_labels = tuple(phase.replace("_", " ").title() for phase in self._plot_phases)
+        # Phase -> display title, so hover/card text needn't re-derive it per refresh
+        self._phase_title = {key: meta["name"] for key, meta in self.phase_definitions.items()}
+        # Light theme for analysis figures, applied by matplotlib as their artists are created
+        self._plot_rc = {
+            'figure.facecolor': self.colors['bg_secondary'],
+            'axes.facecolor': self.colors['panel_bg'],
+            'axes.edgecolor': self.colors['border'],
+            'axes.labelcolor': self.colors['text_secondary'],
+            'axes.titlecolor': self.colors['text'],
+            'axes.grid': True,
+            'grid.color': self.colors['border'],
+            'grid.alpha': 0.5,
+            'xtick.color': self.colors['text'],
+            'ytick.color': self.colors['text'],
+            'legend.facecolor': self.colors['surface'],
+            'legend.edgecolor': self.colors['border'],
+            'legend.labelcolor': self.colors['text'],
+        }
+        # Node type code -> fill color
+        self.type_colors = tuple(self.colors[name] for name in NODE_TYPE_NAMES)
+        # Attribute view of the palette for per-frame drawing code
+        self._dc = types.SimpleNamespace(**self.colors)
+        # Bucket -> color tables so per-frame loops index instead of branching
+        self._util_colors = (self.colors['success'], self.colors['warning'], self.colors['error'])
+        self._cong_colors = (self.colors['success'], self.colors['warning'],
+                             self.colors['warning'], self.colors['error'])  # low/medium/high/critical
+        # Shared named fonts for widgets that are rebuilt often (cards, tooltips)
+        self._font_xs_bold = tkfont.Font(family="Segoe UI", size=8, weight="bold")
+        self._font_small = tkfont.Font(family="Segoe UI", size=9)
+        self._font_small_bold = tkfont.Font(family="Segoe UI", size=9, weight="bold")
+        self._font_small_italic = tkfont.Font(family="Segoe UI", size=9, slant="italic")
+        self._font_body = tkfont.Font(family="Segoe UI", size=10)
+        self._font_body_bold = tkfont.Font(family="Segoe UI", size=10, weight="bold")
+        self._font_body_italic = tkfont.Font(family="Segoe UI", size=10, slant="italic")
+        self._font_title = tkfont.Font(family="Segoe UI", size=13, weight="bold")
 
         # Apply global background
         self.root.configure(bg=self.colors['bg'])
@@ -370,6 +1003,8 @@ class CloudNetworkSimulator:
         
         self.right_panel_ref = right_panel  # Store reference for toggling visibility
         self._create_packet_details_panel(right_panel)
+        # Catch up on skipped canvas/panel work when the window is restored
+        self.root.bind("<Map>", self._on_root_map, add="+")
         
         # ===== STATUS BAR =====
         status_bar = tk.Frame(
@@ -392,8 +1027,24 @@ class CloudNetworkSimulator:
         self.status_label.pack(side=tk.LEFT, padx=20, pady=10)
         
         # Tooltip
-        self.tooltip_window = None
-        self.status_update_timer = None
+        self.tooltip_window = None  # Reused hover tooltip, withdrawn while hidden
+        self._tooltip_label = None
+        self._tooltip_shown = None
+        self._tooltip_visible = False
+        # Shared simulation timer (_sim_tick) and when each periodic task is next due
+        self._sim_tick_id = None
+        self._next_spawn_time = self._next_decay_time = self._next_status_time = 0.0
+        # Status bar text is throttled through set_status()
+        self._pending_status = None
+        self._status_flush_id = None
+        self._last_status_time = 0.0
+        self._shown_status = None
+        # Transient non-modal notice over the canvas (see show_banner)
+        self._banner = None
+        self._banner_after_id = None
+        # Stats panel repaint coalescing (see _request_stats_update)
+        self._stats_dirty = False
+        self._stats_after_id = None
         
         self.populate_node_options()
     
@@ -410,20 +1061,26 @@ class CloudNetworkSimulator:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
+        # Bound directly on the two widgets, so no pointer hit-test is needed per wheel tick
         def on_scroll(event):
-            widget = canvas.winfo_containing(event.x_root, event.y_root)
-            if widget is not None and widget in (canvas, scrollable):
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            return "break"
+
+        def on_scroll_x11(event):
+            canvas.yview_scroll(-1 if event.num == 4 else 1, "units")
+            return "break"
 
-        canvas.bind("<MouseWheel>", on_scroll)
-        scrollable.bind("<MouseWheel>", on_scroll)
+        for widget in (canvas, scrollable):
+            widget.bind("<MouseWheel>", on_scroll)
+            widget.bind("<Button-4>", on_scroll_x11)
+            widget.bind("<Button-5>", on_scroll_x11)
         
         # Section: Add Nodes
         self._add_section_title(scrollable, "Create Nodes")
-        node_types = [("☁ Cloud", "cloud", self.colors['cloud']),
-            ("⚡ Router", "router", self.colors['router']),
-            ("⊞ Switch", "switch", self.colors['switch']),
-                     ("💻 PC", "pc", self.colors['pc'])]
+        node_types = [("☁ Cloud", CLOUD, self.colors['cloud']),
+            ("⚡ Router", ROUTER, self.colors['router']),
+            ("⊞ Switch", SWITCH, self.colors['switch']),
+                     ("💻 PC", PC, self.colors['pc'])]
         
         for label, ntype, color in node_types:
             btn = tk.Button(
@@ -608,7 +1265,9 @@ class CloudNetworkSimulator:
         btn.bind("<Leave>", on_leave)
         return btn
     
-    def lighten_color(self, color, factor=0.15):
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def lighten_color(color, factor=0.15):
         """Lighten a hex color by given factor"""
         color = color.lstrip('#')
         r, g, b = tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
@@ -617,7 +1276,9 @@ class CloudNetworkSimulator:
         b = min(255, int(b + (255 - b) * factor))
         return f'#{r:02x}{g:02x}{b:02x}'
 
-    def darken_color(self, color, factor=0.15):
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def darken_color(color, factor=0.15):
         """Darken a hex color by given factor"""
         color = color.lstrip('#')
         r, g, b = tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
@@ -630,28 +1291,37 @@ class CloudNetworkSimulator:
         if self.debug_logging:
             print("[DEBUG]", *args)
 
-    def _style_axes(self, axes):
-        """Apply light theme styling to matplotlib axes"""
-        if not isinstance(axes, (list, tuple)):
-            axes = [axes]
-        for ax in axes:
-            ax.set_facecolor(self.colors['panel_bg'])
-            ax.tick_params(colors=self.colors['text'])
-            ax.xaxis.label.set_color(self.colors['text_secondary'])
-            ax.yaxis.label.set_color(self.colors['text_secondary'])
-            ax.title.set_color(self.colors['text'])
-            ax.grid(True, alpha=0.5, color=self.colors['border'])
-            for spine in ax.spines.values():
-                spine.set_color(self.colors['border'])
-            legend = ax.get_legend()
-            if legend:
-                legend.get_frame().set_facecolor(self.colors['surface'])
-                legend.get_frame().set_edgecolor(self.colors['border'])
-                for text in legend.get_texts():
-                    text.set_color(self.colors['text'])
+    def post_work(self, fn, *args):
+        """Queue fn(*args) for the work driver; returns False if it was dropped"""
+        try:
+            self._work_q.put_nowait((fn, args))
+        except queue.Full:
+            self._work_dropped += 1
+            return False
+        if self._work_after_id is None:
+            self._work_after_id = self.root.after(16, self._drive_work)
+        return True
+
+    def _drive_work(self, budget=32):
+        """Run up to `budget` queued work items, then yield back to Tk"""
+        self._work_after_id = None
+        for _ in range(budget):
+            try:
+                fn, args = self._work_q.get_nowait()
+            except queue.Empty:
+                return
+            fn(*args)
+        if not self._work_q.empty():
+            self._work_after_id = self.root.after(16, self._drive_work)
 
     def show_learning_tooltip(self, title, message):
         """Display contextual learning tooltip when learn mode is active"""
+        if not self.learn_mode:
+            return
+        # Retransmit storms can fire this many times per frame; open windows from the work queue
+        self.post_work(self._open_learning_tooltip, title, message)
+
+    def _open_learning_tooltip(self, title, message):
         if not self.learn_mode:
             return
         
@@ -669,7 +1339,7 @@ class CloudNetworkSimulator:
         tk.Label(
             learn_window,
             text=f"📚 {title}",
-            font=("Segoe UI", 13, "bold"),
+            font=self._font_title,
             bg=self.colors['surface'],
             fg=self.colors['accent']
         ).pack(pady=15)
@@ -677,7 +1347,7 @@ class CloudNetworkSimulator:
         tk.Label(
             learn_window,
             text=message,
-            font=("Segoe UI", 10),
+            font=self._font_body,
             bg=self.colors['surface'],
             fg=self.colors['text'],
             justify=tk.LEFT,
@@ -690,7 +1360,7 @@ class CloudNetworkSimulator:
             command=learn_window.destroy,
             bg=self.colors['accent'],
             fg="white",
-            font=("Segoe UI", 10, "bold"),
+            font=self._font_body_bold,
             relief=tk.FLAT,
             padx=20,
             pady=6
@@ -714,63 +1384,112 @@ class CloudNetworkSimulator:
         elif topology_type == "linear":
             self.create_linear_topology()
             
-        self.draw_network()
-        self.status_label.config(text=f"{topology_type.upper()} topology created with {len(self.nodes)} nodes")
+        self.schedule_redraw()
+        self.set_status(f"{topology_type.upper()} topology created with {len(self.nodes)} nodes")
         self.populate_node_options()
         
     # NEW: Update Packet Details Panel in Real-time
+    def _panel_visible(self):
+        """True when the packet details panel is actually on screen"""
+        return bool(self.right_panel_ref.winfo_viewable())
+
+    def _on_root_map(self, event):
+        """Redraw and refresh the details panel after the window becomes visible again"""
+        if event.widget is self.root:
+            self.schedule_redraw()
+        if self._packet_details_stale and self._panel_visible():
+            self._packet_details_stale = False
+            self.update_packet_details()
+
     def update_packet_details(self):
         """Update the right panel with active packet details"""
-        # Clear existing widgets
-        for widget in self.packet_details_frame.winfo_children():
-            widget.destroy()
-        
+        if not self._panel_visible():
+            # Nobody can see it; refresh once the panel is mapped again
+            self._packet_details_stale = True
+            return
+        if not self._packets_dirty and self._packet_card_snapshot is not None:
+            return
+        self._packets_dirty = False
+        self._ensure_packet_card_pool()
+
+        visible = self.packets[:PACKET_CARD_COUNT]
+        snapshot = (len(self.packets), tuple(
+            (p.packet_id, p.phase, p.cwnd, p.rtt, p.current_index, p.progress, p.completed, p.lost)
+            for p in visible
+        ))
+        if snapshot == self._packet_card_snapshot:
+            return
+
+        if self._packet_card_snapshot is None:
+            # Panel currently shows something else (manual view / placeholder)
+            self._clear_packet_details()
+            self._packet_card_container.pack(fill=tk.BOTH, expand=True)
+        self._packet_card_snapshot = snapshot
+
+        self._packet_card_overflow.pack_forget()
         if not self.packets:
-            tk.Label(
-                self.packet_details_frame,
-                text="No active packets",
-                bg=self.colors['surface'],
-                fg=self.colors['text_secondary'],
-                font=("Segoe UI", 10, "italic")
-            ).pack(pady=25, padx=10)
+            self._packet_card_empty.pack(pady=25, padx=10)
+        else:
+            self._packet_card_empty.pack_forget()
+
+        for i, card in enumerate(self._packet_card_pool):
+            if i < len(visible):
+                self._fill_packet_card(card, visible[i])
+                if not card['packed']:
+                    card['frame'].pack(fill=tk.X, padx=8, pady=6)
+                    card['packed'] = True
+            elif card['packed']:
+                card['frame'].pack_forget()
+                card['packed'] = False
+
+        if len(self.packets) > PACKET_CARD_COUNT:
+            self._packet_card_overflow.config(text=f"... and {len(self.packets) - PACKET_CARD_COUNT} more packets")
+            self._packet_card_overflow.pack(pady=12)
+
+    def _ensure_packet_card_pool(self):
+        """Create the packet card widgets once; later refreshes only reconfigure them"""
+        if self._packet_card_container is not None:
             return
-        
-        # Display each active packet
-        for i, packet in enumerate(self.packets[:15]):  # Show max 15 packets
-            card = tk.Frame(
-                self.packet_details_frame,
+
+        container = tk.Frame(self.packet_details_frame, bg=self.colors['surface'])
+        self._packet_card_container = container
+        self._packet_card_empty = tk.Label(
+            container,
+            text="No active packets",
+            bg=self.colors['surface'],
+            fg=self.colors['text_secondary'],
+            font=self._font_body_italic
+        )
+        self._packet_card_overflow = tk.Label(
+            container,
+            bg=self.colors['surface'],
+            fg=self.colors['text_secondary'],
+            font=self._font_small_italic
+        )
+
+        for _ in range(PACKET_CARD_COUNT):
+            frame = tk.Frame(
+                container,
                 bg=self.colors['surface'],
                 highlightbackground=self.colors['border'],
                 highlightthickness=1,
                 bd=0
             )
-            card.pack(fill=tk.X, padx=8, pady=6)
-
-            header_text = f"Packet {packet.packet_id}  •  {packet.source.name} → {packet.destination.name}"
-            tk.Label(
-                card,
-                text=header_text,
+            header_lbl = tk.Label(
+                frame,
                 bg=self.colors['surface'],
                 fg=self.colors['text'],
-                font=("Segoe UI", 10, "bold")
-            ).pack(anchor='w', padx=12, pady=(10, 4))
-
-            separator = tk.Frame(card, bg=self.colors['border'], height=1)
-            separator.pack(fill=tk.X, padx=12, pady=(0, 8))
+                font=self._font_body_bold
+            )
+            header_lbl.pack(anchor='w', padx=12, pady=(10, 4))
+            tk.Frame(frame, bg=self.colors['border'], height=1).pack(fill=tk.X, padx=12, pady=(0, 8))
 
-            info_frame = tk.Frame(card, bg=self.colors['surface'])
+            info_frame = tk.Frame(frame, bg=self.colors['surface'])
             info_frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=5)
 
-            stats = [
-                ("Phase", packet.phase.replace('_', ' ').title(), packet.color),
-                ("cwnd", f"{packet.cwnd:.1f} MSS", self.colors['accent']),
-                ("RTT", f"{packet.rtt:.1f} ms", self.colors['warning']),
-                ("Hops Rem.", str(len(packet.path) - packet.current_index - 1), self.colors['text_secondary']),
-                ("Status", "Delivered" if packet.completed else ("Lost" if packet.lost else "In Transit"),
-                 self.colors['success'] if packet.completed else (self.colors['error'] if packet.lost else self.colors['warning']))
-            ]
-
-            for label, value, color in stats:
+            values = {}
+            for key, label in (("phase", "Phase"), ("cwnd", "cwnd"), ("rtt", "RTT"),
+                               ("hops", "Hops Rem."), ("status", "Status")):
                 row = tk.Frame(info_frame, bg=self.colors['surface'])
                 row.pack(fill=tk.X, pady=2)
                 tk.Label(
@@ -778,41 +1497,87 @@ class CloudNetworkSimulator:
                     text=f"{label}:",
                     bg=self.colors['surface'],
                     fg=self.colors['text_secondary'],
-                    font=("Segoe UI", 9)
+                    font=self._font_small
                 ).pack(side=tk.LEFT)
-                tk.Label(
+                value_lbl = tk.Label(
                     row,
-                    text=value,
                     bg=self.colors['surface'],
-                    fg=color,
-                    font=("Segoe UI", 9, "bold")
-                ).pack(side=tk.RIGHT)
+                    font=self._font_small_bold
+                )
+                value_lbl.pack(side=tk.RIGHT)
+                values[key] = value_lbl
 
-            progress_pct = min(100, int((packet.current_index + packet.progress) / len(packet.path) * 100))
-            progress_frame = tk.Frame(card, bg=self.colors['surface'])
+            progress_frame = tk.Frame(frame, bg=self.colors['surface'])
             progress_frame.pack(fill=tk.X, padx=12, pady=(8, 10))
-
             progress_canvas = tk.Canvas(progress_frame, height=12, bg=self.colors['panel_bg'], highlightthickness=0, width=200)
             progress_canvas.pack(fill=tk.X)
-            max_width = 200
-            bar_width = int(progress_pct / 100 * max_width)
-            progress_canvas.create_rectangle(0, 0, bar_width, 12, fill=packet.color, outline="")
-            progress_canvas.create_text(
-                max_width / 2,
+            bar_id = progress_canvas.create_rectangle(0, 0, 0, 12, outline="")
+            pct_id = progress_canvas.create_text(
+                100,
                 6,
-                text=f"{progress_pct}%",
                 fill=self.colors['text_secondary'],
-                font=("Segoe UI", 8, "bold")
+                font=self._font_xs_bold
             )
-        
-        if len(self.packets) > 15:
-            tk.Label(
-                self.packet_details_frame,
-                text=f"... and {len(self.packets) - 15} more packets",
-                bg=self.colors['surface'],
-                fg=self.colors['text_secondary'],
-                font=("Segoe UI", 9, "italic")
-            ).pack(pady=12)
+
+            self._packet_card_pool.append({
+                'frame': frame,
+                'packed': False,
+                'shown': {},  # last values written to each widget
+                'header_lbl': header_lbl,
+                'phase_lbl': values['phase'],
+                'cwnd_lbl': values['cwnd'],
+                'rtt_lbl': values['rtt'],
+                'hops_lbl': values['hops'],
+                'status_lbl': values['status'],
+                'progress_canvas': progress_canvas,
+                'bar_id': bar_id,
+                'pct_id': pct_id
+            })
+
+    def _fill_packet_card(self, card, packet):
+        """Write a packet's current state into a pooled card"""
+        if packet.completed:
+            status, status_color = "Delivered", self._dc.success
+        elif packet.lost:
+            status, status_color = "Lost", self._dc.error
+        else:
+            status, status_color = "In Transit", self._dc.warning
+
+        progress_pct = min(100, int((packet.current_index + packet.progress) / packet.path_len * 100))
+        values = {
+            'header_lbl': (f"Packet {packet.packet_id}  •  {packet.source.name} → {packet.destination.name}", None),
+            'phase_lbl': (self._phase_title[packet.phase], packet.color),
+            'cwnd_lbl': (f"{packet.cwnd:.1f} MSS", self._dc.accent),
+            'rtt_lbl': (f"{packet.rtt:.1f} ms", self._dc.warning),
+            'hops_lbl': (str(packet.hop_count - packet.current_index), self._dc.text_secondary),
+            'status_lbl': (status, status_color),
+            'progress': (progress_pct, packet.color),
+        }
+        # Only push what changed since this card was last filled
+        shown = card['shown']
+        for key, value in values.items():
+            if shown.get(key) == value:
+                continue
+            shown[key] = value
+            if key == 'progress':
+                canvas = card['progress_canvas']
+                canvas.coords(card['bar_id'], 0, 0, int(progress_pct / 100 * 200), 12)
+                canvas.itemconfigure(card['bar_id'], fill=packet.color)
+                canvas.itemconfigure(card['pct_id'], text=f"{progress_pct}%")
+            elif value[1] is None:
+                card[key].config(text=value[0])
+            else:
+                card[key].config(text=value[0], fg=value[1])
+
+    def _clear_packet_details(self):
+        """Remove transient widgets from the details panel, keeping the card pool"""
+        for widget in self.packet_details_frame.winfo_children():
+            if widget is self._packet_card_container or widget is self._manual_panel:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+        self._packet_card_snapshot = None
+        self._manual_panel_packed = False
 
     def stop_packet_details_updates(self):
         """Stop scheduled packet detail refresh"""
@@ -863,8 +1628,9 @@ class CloudNetworkSimulator:
         except Exception:
             pass
 
-        self.draw_network()
-        self.status_label.config(text=f"{topology_type.upper()} topology created with {len(self.nodes)} nodes")
+        self.invalidate_topology()
+        self.schedule_redraw()
+        self.set_status(f"{topology_type.upper()} topology created with {len(self.nodes)} nodes")
         self.populate_node_options()
     
 
@@ -872,6 +1638,8 @@ class CloudNetworkSimulator:
     def set_traffic_load(self, load_level):
         """Change network traffic load: light, medium, or heavy"""
         self.traffic_load = load_level
+        self._congestion_factor = TRAFFIC_CONGESTION[load_level]
+        self._decay_rate = TRAFFIC_DECAY[load_level]
         
         # Update packet generation rate based on load
         if load_level == "light":
@@ -890,12 +1658,13 @@ class CloudNetworkSimulator:
             # Enable performance optimizations
             self.performance_mode = True
             self.max_packets = 50
-            try:
-                messagebox.showinfo("Performance Mode",
-                                    "Heavy traffic enabled — performance mode active.\n" +
-                                    "Visual updates reduced and packet limit enforced.")
-            except Exception:
-                pass
+            self.show_banner("Heavy traffic enabled — performance mode active. "
+                             "Visual updates reduced and packet limit enforced.",
+                             self.colors['error'])
+
+        self._token_bucket['rate'] = 1000.0 / self.packet_generation_rate
+        self._token_bucket['capacity'] = self.max_packets
+        self._draw_every_n = 3 if self.performance_mode else 1
         
         # Update button colors
         for load, btn in self.traffic_buttons.items():
@@ -904,14 +1673,14 @@ class CloudNetworkSimulator:
             else:
                 btn.config(bg=self.colors['surface_hover'], fg=self.colors['text'])
         
-        self.status_label.config(text=f"Traffic load set to: {load_level.upper()}")
+        self.set_status(f"Traffic load set to: {load_level.upper()}")
     
     # NEW: Set Congestion Control Algorithm
     def set_congestion_algorithm(self, algorithm):
         """Change congestion control algorithm: reno or tahoe"""
         self.congestion_algorithm = algorithm
-        self.status_label.config(text=f"Congestion algorithm set to: TCP {algorithm.upper()}")
-        self.update_real_time_stats()
+        self.set_status(f"Congestion algorithm set to: TCP {algorithm.upper()}")
+        self._request_stats_update()
     
     # NEW: Populate manual source/destination dropdowns
     def populate_node_options(self):
@@ -919,7 +1688,7 @@ class CloudNetworkSimulator:
         if not self.manual_source_dropdown or not self.manual_dest_dropdown:
             return
         
-        node_names = [node.name for node in self.nodes]
+        node_names = list(self._nodes_by_name)
         self.manual_source_dropdown['values'] = node_names
         self.manual_dest_dropdown['values'] = node_names
         
@@ -934,6 +1703,18 @@ class CloudNetworkSimulator:
             state = tk.NORMAL if len(node_names) >= 2 else tk.DISABLED
             self.manual_send_btn.config(state=state)
     
+    def _request_stats_update(self):
+        """Mark the stats panel dirty; repaint it at most once per 100 ms"""
+        self._stats_dirty = True
+        if self._stats_after_id is None:
+            self._stats_after_id = self.root.after(100, self._flush_stats)
+
+    def _flush_stats(self):
+        self._stats_after_id = None
+        if self._stats_dirty:
+            self._stats_dirty = False
+            self.update_real_time_stats()
+
     # NEW: Update Real-time Statistics
     def update_real_time_stats(self):
         """Update real-time statistics panel"""
@@ -942,9 +1723,8 @@ class CloudNetworkSimulator:
         
         active_packets = len(self.packets)
         if active_packets > 0:
-            avg_cwnd = sum(p.cwnd for p in self.packets) / active_packets
-            lost_packets = sum(1 for p in self.packets if p.lost)
-            loss_rate = (lost_packets / max(active_packets, 1)) * 100
+            avg_cwnd = self._tally.cwnd_sum / active_packets
+            loss_rate = (self._tally.lost_count / active_packets) * 100
         else:
             avg_cwnd = 0
             loss_rate = 0
@@ -962,33 +1742,20 @@ class CloudNetworkSimulator:
         self.stats_text.config(text=stats)
     
     def get_phase_counts(self):
-        """Return counts of packets per TCP phase"""
-        counts = {
-            "slow_start": 0,
-            "congestion_avoidance": 0,
-            "fast_retransmit": 0,
-            "fast_recovery": 0
-        }
-        for packet in self.packets:
-            if packet.phase in counts:
-                counts[packet.phase] += 1
-        return counts
+        """Return counts of packets per TCP phase (maintained incrementally by Packet.set_phase)"""
+        return self._tally.phase_counts
     
     # NEW: Handle Congestion Control for Packet
     def handle_congestion_control(self, packet, current_node):
         """Apply congestion control algorithm logic based on node congestion"""
-        current_time = time.time()
+        current_time = self._tick_time
         base_rtt = current_node.latency
         congestion_delay = current_node.congestion * 5  # 5ms delay per congestion unit
         packet.rtt = base_rtt + congestion_delay
         
         # CASE 1: Severe congestion -> timeout
         if current_node.congestion > 9:
-            if self.congestion_algorithm == "reno":
-                self.handle_timeout_reno(packet)
-            else:
-                self.handle_timeout_tahoe(packet)
-            packet.dup_ack_count = 0
+            self.handle_timeout(packet)
             self.record_packet_event(packet, "timeout")
             return
         
@@ -1062,53 +1829,41 @@ class CloudNetworkSimulator:
             f"Returning to Slow Start."
         )
     
-    # NEW: Handle Timeout for TCP Reno
-    def handle_timeout_reno(self, packet):
-        """TCP Reno: Timeout handling"""
+    # NEW: Handle Timeout (Reno and Tahoe react identically)
+    def handle_timeout(self, packet):
+        """TCP timeout handling: halve ssthresh and restart Slow Start"""
         packet.ssthresh = max(packet.cwnd / 2, 2)
         packet.cwnd = 1
         packet.set_phase("slow_start")
         packet.lost = True
         packet.dup_ack_count = 0
         
+        title, closing = TIMEOUT_TOOLTIPS[self.congestion_algorithm]
         self.show_learning_tooltip(
-            "TCP Reno Timeout",
+            title,
             f"Timeout detected.\n"
             f"ssthresh = {packet.ssthresh:.1f} MSS\n"
             f"cwnd reset to 1 MSS.\n"
-            f"Restarting Slow Start."
-        )
-    
-    # NEW: Handle Timeout for TCP Tahoe
-    def handle_timeout_tahoe(self, packet):
-        """TCP Tahoe: Timeout handling"""
-        packet.ssthresh = max(packet.cwnd / 2, 2)
-        packet.cwnd = 1
-        packet.set_phase("slow_start")
-        packet.lost = True
-        packet.dup_ack_count = 0
-        
-        self.show_learning_tooltip(
-            "TCP Tahoe Timeout",
-            f"Timeout detected.\n"
-            f"ssthresh = {packet.ssthresh:.1f} MSS\n"
-            f"cwnd reset to 1 MSS.\n"
-            f"Returning to Slow Start."
+            f"{closing}"
         )
     
     # NEW: Record Packet Event for Timeline
     def record_packet_event(self, packet, event_type):
         """Record packet event for timeline analysis (throttled).
 
-        Only record important events or sample a fraction to avoid flooding.
+        Only record important events; routine ones are kept 1-in-N per (event_type, phase).
         """
-        current_time = time.time() - self.performance_start_time
-
-        important_events = {"created", "delivered", "dropped", "timeout", "fast_retransmit", "exit_fast_recovery", "manual_created"}
+        self._packets_dirty = True
+        # Sample less-important events with a counter instead of an RNG draw per call
+        if event_type not in IMPORTANT_PACKET_EVENTS:
+            key = (event_type, packet.phase)
+            seen = self._sampled_event_accum[key] + 1
+            if seen < PACKET_EVENT_SAMPLE_EVERY:
+                self._sampled_event_accum[key] = seen
+                return
+            self._sampled_event_accum[key] = 0
 
-        # Sample less-important events
-        if event_type not in important_events and random.random() > 0.10:
-            return
+        current_time = self._tick_time - self.performance_start_time
 
         # Calculate throughput (simplified)
         if packet.rtt > 0:
@@ -1116,45 +1871,51 @@ class CloudNetworkSimulator:
         else:
             throughput = 0
 
-        event = {
-            'time': current_time,
-            'packet_id': packet.packet_id,
-            'cwnd': packet.cwnd,
-            'phase': packet.phase,
-            'rtt': packet.rtt,
-            'event_type': event_type,
-            'throughput': throughput,
-            'node_congestion': packet.path[packet.current_index].congestion if packet.current_index < len(packet.path) else 0
-        }
-        self.packet_events.append(event)
+        node_congestion = packet.path[packet.current_index].congestion if packet.current_index < packet.path_len else 0
+        self._append_packet_event(current_time, packet.packet_id, packet.cwnd, packet.phase, packet.rtt,
+                                  event_type, throughput, node_congestion)
 
-        # Keep only last 500 events to limit memory
-        if len(self.packet_events) > 500:
-            self.packet_events = self.packet_events[-500:]
+    def _append_packet_event(self, event_time, packet_id, cwnd, phase, rtt, event_type, throughput, node_congestion):
+        """Add an event to packet_events and its running aggregates, evicting the oldest past the limit"""
+        events = self.packet_events
+        if len(events) == events.capacity:
+            # The log is about to drop its oldest event
+            self._event_tally.remove(events.oldest('cwnd'), events.oldest('throughput'),
+                                     events.oldest('event_type') == 'dropped')
+        events.append(event_time, packet_id, cwnd, phase, rtt, event_type, throughput, node_congestion)
+        self._event_tally.add(cwnd, throughput, event_type == 'dropped')
+
+    def connect_nodes(self, node1, node2):
+        """Link two nodes unless already linked; returns True when a new link was added"""
+        key = frozenset((node1, node2))
+        if key in self._link_set:
+            return False
+        self._link_set.add(key)
+        node1.connections.append(node2)
+        node2.connections.append(node1)
+        self.connections.append((node1, node2))
+        return True
 
     def create_star_topology(self):
         """Star topology: central router with multiple PCs"""
         center_x, center_y = 600, 400
         
         # Central router
-        router = NetworkNode(center_x, center_y, "router", "ROUTER1")
+        router = NetworkNode(center_x, center_y, ROUTER, "ROUTER1")
         self.nodes.append(router)
         
         # Create PCs in a circle around router
         num_pcs = 6
         radius = 200
-        for i in range(num_pcs):
-            angle = (2 * math.pi * i) / num_pcs
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-            
-            pc = NetworkNode(x, y, "pc", f"PC{i+1}")
+        angles = np.linspace(0, 2 * np.pi, num_pcs, endpoint=False)
+        xs = (center_x + radius * np.cos(angles)).tolist()
+        ys = (center_y + radius * np.sin(angles)).tolist()
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            pc = NetworkNode(x, y, PC, f"PC{i+1}")
             self.nodes.append(pc)
             
             # Connect to router
-            router.connections.append(pc)
-            pc.connections.append(router)
-            self.connections.append((router, pc))
+            self.connect_nodes(router, pc)
     
     def create_mesh_topology(self):
         """Mesh topology: all nodes connected to all other nodes"""
@@ -1165,15 +1926,13 @@ class CloudNetworkSimulator:
         
         # Create routers
         for i, (x, y) in enumerate(positions):
-            router = NetworkNode(x, y, "router", f"ROUTER{i+1}")
+            router = NetworkNode(x, y, ROUTER, f"ROUTER{i+1}")
             self.nodes.append(router)
         
         # Connect all to all
         for i, node1 in enumerate(self.nodes):
             for node2 in self.nodes[i+1:]:
-                node1.connections.append(node2)
-                node2.connections.append(node1)
-                self.connections.append((node1, node2))
+                self.connect_nodes(node1, node2)
     
     def create_ring_topology(self):
         """Ring topology: nodes connected in a circle"""
@@ -1181,60 +1940,49 @@ class CloudNetworkSimulator:
         num_nodes = 8
         radius = 220
         
-        for i in range(num_nodes):
-            angle = (2 * math.pi * i) / num_nodes
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-            
-            node = NetworkNode(x, y, "router", f"ROUTER{i+1}")
+        angles = np.linspace(0, 2 * np.pi, num_nodes, endpoint=False)
+        xs = (center_x + radius * np.cos(angles)).tolist()
+        ys = (center_y + radius * np.sin(angles)).tolist()
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            node = NetworkNode(x, y, ROUTER, f"ROUTER{i+1}")
             self.nodes.append(node)
         
         # Connect in ring
         for i in range(len(self.nodes)):
             node1 = self.nodes[i]
             node2 = self.nodes[(i + 1) % len(self.nodes)]
-            
-            node1.connections.append(node2)
-            node2.connections.append(node1)
-            self.connections.append((node1, node2))
+            self.connect_nodes(node1, node2)
     
     def create_tree_topology(self):
         """Tree topology: hierarchical structure"""
         # Cloud at top
-        cloud = NetworkNode(600, 150, "cloud", "CLOUD1")
+        cloud = NetworkNode(600, 150, CLOUD, "CLOUD1")
         self.nodes.append(cloud)
         
         # Level 1: Routers
-        router1 = NetworkNode(400, 300, "router", "ROUTER1")
-        router2 = NetworkNode(800, 300, "router", "ROUTER2")
+        router1 = NetworkNode(400, 300, ROUTER, "ROUTER1")
+        router2 = NetworkNode(800, 300, ROUTER, "ROUTER2")
         self.nodes.extend([router1, router2])
         
-        cloud.connections.extend([router1, router2])
-        router1.connections.append(cloud)
-        router2.connections.append(cloud)
-        self.connections.extend([(cloud, router1), (cloud, router2)])
+        self.connect_nodes(cloud, router1)
+        self.connect_nodes(cloud, router2)
         
         # Level 2: Switches
         switches = []
         for i, x in enumerate([300, 500, 700, 900]):
-            switch = NetworkNode(x, 450, "switch", f"SWITCH{i+1}")
+            switch = NetworkNode(x, 450, SWITCH, f"SWITCH{i+1}")
             switches.append(switch)
             self.nodes.append(switch)
             
             parent = router1 if i < 2 else router2
-            parent.connections.append(switch)
-            switch.connections.append(parent)
-            self.connections.append((parent, switch))
+            self.connect_nodes(parent, switch)
         
         # Level 3: PCs
         for i, switch in enumerate(switches):
             for j in range(2):
-                pc = NetworkNode(switch.x - 50 + j*100, 600, "pc", f"PC{i*2+j+1}")
+                pc = NetworkNode(switch.x - 50 + j*100, 600, PC, f"PC{i*2+j+1}")
                 self.nodes.append(pc)
-                
-                switch.connections.append(pc)
-                pc.connections.append(switch)
-                self.connections.append((switch, pc))
+                self.connect_nodes(switch, pc)
     
     def create_linear_topology(self):
         """Linear topology: nodes connected in a line"""
@@ -1244,14 +1992,12 @@ class CloudNetworkSimulator:
         
         for i in range(num_nodes):
             x = start_x + i * spacing
-            node = NetworkNode(x, y, "router", f"ROUTER{i+1}")
+            node = NetworkNode(x, y, ROUTER, f"ROUTER{i+1}")
             self.nodes.append(node)
             
             if i > 0:
                 prev_node = self.nodes[i-1]
-                prev_node.connections.append(node)
-                node.connections.append(prev_node)
-                self.connections.append((prev_node, node))
+                self.connect_nodes(prev_node, node)
 
     def build_random_topology(self):
         """Reset and build a fresh tree topology"""
@@ -1265,6 +2011,7 @@ class CloudNetworkSimulator:
             self.log_debug(f"Canvas size: {canvas_w} x {canvas_h}")
 
             self.generate_random_tree_topology(canvas_size=(canvas_w, canvas_h))
+            self.invalidate_topology()
             node_count = len(self.nodes)
             self.log_debug(f"Nodes created: {node_count}")
             if node_count == 0:
@@ -1279,15 +2026,15 @@ class CloudNetworkSimulator:
             scaled_preview = [(node.name, round(node.x, 1), round(node.y, 1)) for node in self.nodes[:min(5, node_count)]]
             self.log_debug("Sample node coords (post-scale):", scaled_preview)
 
-            self.draw_network()
-            self.status_label.config(text="Generated random tree topology")
+            self.schedule_redraw()
+            self.set_status("Generated random tree topology")
             self.populate_node_options()
             self.update_packet_details()
         except Exception as exc:
             self.log_debug("Topology generation failed:", exc)
             messagebox.showerror("Build Topology", f"Failed to build topology:\n{exc}")
 
-    def generate_random_tree_topology(self, canvas_size=None):
+    def generate_random_tree_topology(self, canvas_size=None, seed=None):
         """Create a responsive multi-level tree that fits the canvas"""
         self.canvas.update_idletasks()
         if canvas_size:
@@ -1309,53 +2056,65 @@ class CloudNetworkSimulator:
         self.highlighted_path = []
         self.nodes.clear()
         self.connections.clear()
+        self._link_set.clear()
+
+        # Draw every node's link characteristics in one shot
+        rng = np.random.default_rng(seed)
+        total_nodes = sum(nodes_per_level)
+        latencies = rng.integers(5, 51, size=total_nodes).tolist()
+        throughputs = rng.integers(100, 1001, size=total_nodes).tolist()
 
         previous_level_nodes = []
+        type_totals = Counter()
         for lvl, count in enumerate(nodes_per_level):
             y = top_margin + lvl * level_spacing
             level_nodes = []
-            for idx in range(count):
-                x_ratio = (idx + 1) / (count + 1)
-                x = horizontal_margin + usable_width * x_ratio
+            xs = (horizontal_margin + usable_width * np.arange(1, count + 1) / (count + 1)).tolist()
+            for idx, x in enumerate(xs):
                 if lvl == 0:
-                    node_type = "cloud"
+                    node_type = CLOUD
                 elif lvl == levels - 1:
-                    node_type = "pc"
+                    node_type = PC
                 else:
-                    node_type = "router" if lvl == 1 else "switch"
-                name = f"{node_type.upper()}{len([n for n in self.nodes if n.type == node_type]) + 1}"
-                node = NetworkNode(x, y, node_type, name)
+                    node_type = ROUTER if lvl == 1 else SWITCH
+                type_totals[node_type] += 1
+                name = f"{NODE_TYPE_NAMES[node_type].upper()}{type_totals[node_type]}"
+                node_id = len(self.nodes)
+                node = NetworkNode(x, y, node_type, name,
+                                   latency=latencies[node_id], throughput=throughputs[node_id])
                 self.nodes.append(node)
                 level_nodes.append(node)
 
                 if previous_level_nodes:
                     parent = previous_level_nodes[idx % len(previous_level_nodes)]
-                    parent.connections.append(node)
-                    node.connections.append(parent)
-                    self.connections.append((parent, node))
+                    self.connect_nodes(parent, node)
             previous_level_nodes = level_nodes
         self.log_debug(f"Generated tree levels: {nodes_per_level}")
     
     def add_node(self, node_type):
+        if isinstance(node_type, str):
+            node_type = NODE_TYPE_IDS[node_type]
         x = random.randint(100, 800)
         y = random.randint(100, 600)
-        name = f"{node_type.upper()}{len([n for n in self.nodes if n.type == node_type]) + 1}"
+        # Count same-type nodes on the SoA type column instead of filtering the node list
+        name = f"{NODE_TYPE_NAMES[node_type].upper()}{np.count_nonzero(self.node_type == node_type) + 1}"
         node = NetworkNode(x, y, node_type, name)
         self.nodes.append(node)
-        self.draw_network()
-        self.status_label.config(text=f"Added {name}")
+        self.invalidate_topology()
+        self.schedule_redraw()
+        self.set_status(f"Added {name}")
         self.populate_node_options()
         
     def toggle_connection_mode(self):
         self.connection_mode = not self.connection_mode
         if self.connection_mode:
             self.conn_button.config(bg=self.colors['success'], text="✓ Connecting...")
-            self.status_label.config(text="Click two nodes to connect them")
+            self.set_status("Click two nodes to connect them")
         else:
             self.conn_button.config(bg=self.colors['accent_secondary'], text="🔗 Connect Nodes")
             self.selected_node = None
-            self.status_label.config(text="Ready")
-        self.draw_network()
+            self.set_status("Ready")
+        self.schedule_redraw()
         
     def on_canvas_click(self, event):
         clicked_node = self.get_node_at(event.x, event.y)
@@ -1363,15 +2122,13 @@ class CloudNetworkSimulator:
         if self.connection_mode and clicked_node:
             if self.selected_node is None:
                 self.selected_node = clicked_node
-                self.status_label.config(text=f"Selected {clicked_node.name}, click another node")
+                self.set_status(f"Selected {clicked_node.name}, click another node")
             elif self.selected_node != clicked_node:
-                if clicked_node not in self.selected_node.connections:
-                    self.selected_node.connections.append(clicked_node)
-                    clicked_node.connections.append(self.selected_node)
-                    self.connections.append((self.selected_node, clicked_node))
-                    self.status_label.config(text=f"Connected {self.selected_node.name} ↔ {clicked_node.name}")
+                if self.connect_nodes(self.selected_node, clicked_node):
+                    self.invalidate_topology()
+                    self.set_status(f"Connected {self.selected_node.name} ↔ {clicked_node.name}")
                 self.selected_node = None
-            self.draw_network()
+            self.schedule_redraw()
         elif clicked_node:
             self.dragging_node = clicked_node
             
@@ -1379,7 +2136,8 @@ class CloudNetworkSimulator:
         if self.dragging_node and not self.connection_mode:
             self.dragging_node.x = event.x
             self.dragging_node.y = event.y
-            self.draw_network()
+            self._layout_version += 1
+            self.schedule_redraw()
             
     def on_canvas_release(self, event):
         self.dragging_node = None
@@ -1392,21 +2150,26 @@ class CloudNetworkSimulator:
     # NEW: Handle canvas mouse motion for tooltips
     def on_canvas_motion(self, event):
         """Show tooltip when hovering over packet"""
-        # Find packet at mouse position
+        # Only the latest pointer position matters; hit-test it at most every 30ms
+        self._pending_motion = event
+        if self._motion_after_id is None:
+            self._motion_after_id = self.root.after(30, self._process_canvas_motion)
+
+    def _process_canvas_motion(self):
+        self._motion_after_id = None
+        event = self._pending_motion
+        self._pending_motion = None
+        if event is None:
+            return
+        # Find packet at mouse position, using the positions drawn on the last tick
         hovered_packet = None
-        min_dist = 20  # Maximum distance to show tooltip
-        
-        for packet in self.packets:
-            if packet.current_index < len(packet.path) - 1:
-                node1 = packet.path[packet.current_index]
-                node2 = packet.path[packet.current_index + 1]
-                x = node1.x + (node2.x - node1.x) * packet.progress
-                y = node1.y + (node2.y - node1.y) * packet.progress
-                
-                dist = math.sqrt((x - event.x)**2 + (y - event.y)**2)
-                if dist < min_dist:
-                    min_dist = dist
-                    hovered_packet = (packet, x, y)
+        if self._pkt_refs:
+            dx = self._pkt_x - event.x
+            dy = self._pkt_y - event.y
+            d2 = dx * dx + dy * dy
+            idx = int(d2.argmin())
+            if d2[idx] < PACKET_HOVER_RADIUS_SQ:
+                hovered_packet = (self._pkt_refs[idx], float(self._pkt_x[idx]), float(self._pkt_y[idx]))
         
         # Show tooltip if packet found
         if hovered_packet:
@@ -1417,14 +2180,15 @@ class CloudNetworkSimulator:
     
     # NEW: Hide tooltip when leaving canvas
     def on_canvas_leave(self, event):
+        self._pending_motion = None
+        if self._motion_after_id is not None:
+            self.root.after_cancel(self._motion_after_id)
+            self._motion_after_id = None
         self.hide_tooltip()
     
     # NEW: Show packet tooltip
     def show_packet_tooltip(self, packet, x, y):
         """Display tooltip with packet information"""
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-        
         # Get absolute canvas position
         canvas_x = self.canvas.winfo_rootx()
         canvas_y = self.canvas.winfo_rooty()
@@ -1442,206 +2206,400 @@ class CloudNetworkSimulator:
         if tooltip_y + 120 > screen_height:
             tooltip_y = screen_height - 140
         
-        self.tooltip_window = tk.Toplevel(self.root)
-        self.tooltip_window.overrideredirect(True)
-        self.tooltip_window.configure(
-            bg=self.colors['surface'],
-            highlightbackground=self.colors['border'],
-            highlightthickness=1
-        )
-        self.tooltip_window.geometry(f"+{int(tooltip_x)}+{int(tooltip_y)}")
-        
         # Tooltip content
-        hops_remaining = len(packet.path) - packet.current_index - 1
-        tooltip_text = f"Packet ID: {packet.packet_id}\n"
-        tooltip_text += f"cwnd: {packet.cwnd:.1f} MSS\n"
-        tooltip_text += f"Phase: {packet.phase.replace('_', ' ').title()}\n"
-        tooltip_text += f"RTT: {packet.rtt:.1f}ms\n"
-        tooltip_text += f"Hops remaining: {hops_remaining}"
-        
-        label = tk.Label(
-            self.tooltip_window,
-            text=tooltip_text,
-            bg=self.colors['surface'],
-            fg=self.colors['text'],
-            font=("Segoe UI", 9),
-            justify=tk.LEFT
-        )
-        label.pack(padx=5, pady=5)
+        hops_remaining = packet.hop_count - packet.current_index
+        tooltip_text = (f"Packet ID: {packet.packet_id}\n"
+                        f"cwnd: {packet.cwnd:.1f} MSS\n"
+                        f"Phase: {self._phase_title[packet.phase]}\n"
+                        f"RTT: {packet.rtt:.1f}ms\n"
+                        f"Hops remaining: {hops_remaining}")
+
+        # One borderless window is created on first hover, then only reconfigured
+        if self.tooltip_window is None:
+            self.tooltip_window = tk.Toplevel(self.root)
+            self.tooltip_window.withdraw()
+            self.tooltip_window.overrideredirect(True)
+            self.tooltip_window.configure(
+                bg=self.colors['surface'],
+                highlightbackground=self.colors['border'],
+                highlightthickness=1
+            )
+            self._tooltip_label = tk.Label(
+                self.tooltip_window,
+                bg=self.colors['surface'],
+                fg=self.colors['text'],
+                font=self._font_small,
+                justify=tk.LEFT
+            )
+            self._tooltip_label.pack(padx=5, pady=5)
+            self._tooltip_shown = None
+
+        geometry = f"+{int(tooltip_x)}+{int(tooltip_y)}"
+        shown = (tooltip_text, geometry)
+        if shown != self._tooltip_shown:
+            self._tooltip_label.config(text=tooltip_text)
+            self.tooltip_window.geometry(geometry)
+            self._tooltip_shown = shown
+        if not self._tooltip_visible:
+            self.tooltip_window.deiconify()
+            self._tooltip_visible = True
     
     # NEW: Hide tooltip
     def hide_tooltip(self):
         """Hide packet tooltip"""
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
+        if self._tooltip_visible:
+            self.tooltip_window.withdraw()
+            self._tooltip_visible = False
             
     def get_node_at(self, x, y):
-        for node in self.nodes:
-            dist = math.sqrt((node.x - x)**2 + (node.y - y)**2)
-            if dist < 30:
-                return node
-        return None
-        
-    def draw_network(self):
-        # Double-buffered, tag-based drawing
-        # Prevent concurrent redraws
+        if not self.nodes:
+            return None
+        # Nearest node by squared distance over the SoA coordinates
+        dx = self.node_x - x
+        dy = self.node_y - y
+        d2 = dx * dx + dy * dy
+        i = int(d2.argmin())
+        return self.nodes[i] if d2[i] < NODE_HIT_RADIUS_SQ else None
+        
+    def schedule_redraw(self):
+        """Queue a single coalesced redraw, at most once per min_draw_interval"""
         if self.redraw_scheduled:
             return
-
-        now = time.time()
-        if now - self.last_draw_time < self.min_draw_interval:
-            # schedule to try again later
-            if self.simulation_running or self.manual_packet_mode:
-                self.root.after(int(self.min_draw_interval * 1000), self.draw_network)
-            return
-
+        elapsed = time.time() - self.last_draw_time
+        delay = max(0, int((self.min_draw_interval - elapsed) * 1000))
         self.redraw_scheduled = True
-        self.last_draw_time = now
+        self._redraw_after_id = self.root.after(delay, self._do_draw)
 
-        try:
-            # delete only tagged objects to avoid full canvas clear flicker
-            try:
-                self.canvas.delete("connection")
-                self.canvas.delete("packet")
-                self.canvas.delete("node")
-                self.canvas.delete("label")
-                self.canvas.delete("bandwidth")
-            except Exception:
-                pass
+    def _do_draw(self):
+        self.redraw_scheduled = False
+        self._redraw_after_id = None
+        self.last_draw_time = time.time()
+        self.draw_network()
 
+    def draw_network(self):
+        # Tag-based drawing; event handlers call schedule_redraw() instead so
+        # bursts of changes collapse into one frame
+        skipped = False
+        try:
+            if not self.root.winfo_viewable():
+                # Minimized: keep packets moving but skip all canvas work
+                self._draw_packets(render=False)
+                return
+            self._frame_skip_counter += 1
+            if self.simulation_running and self.packets and self._frame_skip_counter % self._draw_every_n:
+                # Performance mode: advance packets, paint only every Nth frame. Only the packet loop
+                # skips; a frame requested while no packets are in flight always paints
+                self._draw_packets(render=False)
+                skipped = True
+                return
             # ensure canvas geometry is available
             self.canvas.update_idletasks()
             canvas_width = max(self.canvas.winfo_width(), 100)
             canvas_height = max(self.canvas.winfo_height(), 100)
-            if canvas_width <= 100 or canvas_height <= 100:
-                return
+            if canvas_width > 100 and canvas_height > 100:
+                if self._items_topology_version != self._topology_version:
+                    self._sync_topology_items()
+                layout_key = (self._topology_version, self._layout_version)
+                if layout_key != self._items_layout_key:
+                    self._layout_topology_items()
+                    self._items_layout_key = layout_key
+                link_style_key = (self._topology_version, self._highlighted_edges, self.simulation_running)
+                if link_style_key != self._link_style_key:
+                    self._style_connections()
+                    self._link_style_key = link_style_key
+                selection_key = layout_key + (self.selected_node,)
+                if selection_key != self._selection_draw_key:
+                    self._draw_selection()
+                    self._selection_draw_key = selection_key
 
-            # draw layers
-            self._draw_connections()
-            self._draw_packets()
-            self._draw_nodes()
+                # per-frame layers: link utilization, moving packets, congestion badges
+                self._draw_bandwidth_labels()
+                self._draw_packets()
+                self._draw_congestion_badges()
 
+                if self._layers_dirty:
+                    self._restack_layers()
         finally:
-            self.redraw_scheduled = False
+            # keep animating only while packets are in flight and the simulation runs; when idle or
+            # paused, the events that change pixels (spawns, congestion decay, edits) request their own frame.
+            # A skipped frame always gets a follow-up, so delivering the last packet there still gets painted
+            if (self.simulation_running and self.packets) or self.manual_packet_mode or skipped:
+                self.schedule_redraw()
 
-        if self.simulation_running or self.manual_packet_mode:
-            self.root.after(int(self.min_draw_interval * 1000), self.draw_network)
+    def _restack_layers(self):
+        """Restore stacking order: links < utilization labels < packets < nodes < badges"""
+        self.canvas.tag_lower("bandwidth")
+        self.canvas.tag_lower("connection")
+        self.canvas.tag_raise("node")
+        self.canvas.tag_raise("selection")
+        self.canvas.tag_raise("label")
+        self.canvas.tag_raise("badge")
+        self._layers_dirty = False
 
-            
     def toggle_simulation(self):
         self.simulation_running = not self.simulation_running
         self.manual_packet_mode = False  # Exit manual mode when toggling
         
         if self.simulation_running:
             self.sim_button.config(text="⏸ Pause", bg=self.colors['accent_dark'])
-            self.status_label.config(text="Simulation running...")
-            self.start_packet_generation()
-            self.decay_congestion()
-            self.update_status_bar()
-            # Separate update loops
-            self.update_bandwidth_labels()
-            self.draw_network()
+            self.set_status("Simulation running...")
+            # Don't let tokens accrued while paused turn into a burst
+            self._token_bucket['tokens'] = 1.0
+            self._token_bucket['last'] = time.time()
+            self._start_sim_tick()
+            # Link utilization labels are refreshed by draw_network on each painted frame
+            self.schedule_redraw()
         else:
             self.sim_button.config(text="▶ Simulate", bg=self.colors['accent'])
-            self.status_label.config(text="Paused")
-            if self.status_update_timer:
-                self.root.after_cancel(self.status_update_timer)
+            self.set_status("Paused")
+            self._stop_sim_tick()
             self.stop_packet_details_updates()
             self.update_packet_details()
+            # One last frame repaints link styling for the paused state; the loop then stops
+            self.schedule_redraw()
 
     # --- Drawing layer helpers ---
-    def _draw_connections(self):
-        for node1, node2 in self.connections:
-            color = self.colors['text_muted'] if not self.simulation_running else self.colors['accent']
-            width = 2
-            if self.highlighted_path and len(self.highlighted_path) > 1:
-                for i in range(len(self.highlighted_path) - 1):
-                    if ((node1 == self.highlighted_path[i] and node2 == self.highlighted_path[i+1]) or
-                        (node2 == self.highlighted_path[i] and node1 == self.highlighted_path[i+1])):
-                        color = self.colors['warning']
-                        width = 4
-                        break
-
-            self.canvas.create_line(node1.x, node1.y, node2.x, node2.y,
-                                   fill=color, width=width, dash=(5, 3) if width == 2 else None,
-                                   tags=("connection",))
+    def _sync_topology_items(self):
+        """Create canvas items for new nodes/links and delete those that went away"""
+        live_nodes = set(self.nodes)
+        for node in [n for n in self._node_items if n not in live_nodes]:
+            self.canvas.delete(*self._node_items.pop(node))
+            del self._badge_shown[node]
+        live_links = set(self.connections)
+        for key in [k for k in self._conn_items if k not in live_links]:
+            entry = self._conn_items.pop(key)
+            self.canvas.delete(entry['line'], entry['bw'])
 
-            if self.simulation_running:
-                max_bandwidth = 10
-                current_utilization = min((node1.congestion + node2.congestion) / 2, max_bandwidth)
-                utilization_percent = (current_utilization / max_bandwidth) * 100
-                label_color = (self.colors['success'] if utilization_percent < 50 else
-                               (self.colors['warning'] if utilization_percent < 80 else self.colors['error']))
-                mid_x = (node1.x + node2.x) / 2
-                mid_y = (node1.y + node2.y) / 2
-                bandwidth_text = f"{current_utilization:.1f} / {max_bandwidth} Gbps"
-                self.canvas.create_text(mid_x, mid_y - 10, text=bandwidth_text,
-                                       font=("Segoe UI", 8), fill=label_color, tags=("bandwidth",))
-
-    def _draw_packets(self):
+        # Describe every missing item first, then create them all in one Tcl round-trip
+        new_nodes = [node for node in self.nodes if node not in self._node_items]
+        new_links = [link for link in self.connections if link not in self._conn_items]
+        specs = []
+        for node in new_nodes:
+            x, y = node.x, node.y
+            specs += [
+                ("oval", (x-30, y-30, x+30, y+30),
+                 {'fill': self.type_colors[node.type], 'outline': "white", 'width': 2, 'tags': ("node",)}),
+                ("text", (x, y-5),
+                 {'text': NODE_TYPE_ICONS[node.type], 'font': ("Segoe UI", 20), 'fill': self._dc.text,
+                  'tags': ("node",)}),
+                ("text", (x, y+45),
+                 {'text': node.name, 'font': ("Segoe UI", 9, "bold"), 'fill': self._dc.text, 'tags': ("label",)}),
+                ("oval", (x+20, y-20, x+30, y-10),
+                 {'outline': "white", 'width': 2, 'state': tk.HIDDEN, 'tags': ("badge",)}),
+                ("text", (x+25, y-15),
+                 {'font': ("Segoe UI", 7, "bold"), 'fill': "white", 'state': tk.HIDDEN, 'tags': ("badge",)}),
+            ]
+        for node1, node2 in new_links:
+            specs += [
+                ("line", (node1.x, node1.y, node2.x, node2.y),
+                 {'fill': self._dc.text_muted, 'width': 2, 'dash': (5, 3), 'tags': ("connection",)}),
+                ("text", ((node1.x + node2.x) / 2, (node1.y + node2.y) / 2 - 10),
+                 {'text': "", 'font': ("Segoe UI", 8), 'state': tk.HIDDEN, 'tags': ("bandwidth",)}),
+            ]
+        ids = iter(self._create_items_batch(specs))
+        for node in new_nodes:
+            self._node_items[node] = tuple(next(ids) for _ in range(5))
+            self._badge_shown[node] = None
+        for link in new_links:
+            line, bw = next(ids), next(ids)
+            self._conn_items[link] = {'line': line, 'bw': bw, 'text': None, 'fill': None}
+
+        # Edge list as node-index pairs so link utilization is one array expression
+        self._link_entries = list(self._conn_items.values())
+        self._link_ends = np.array([(node1.index, node2.index) for node1, node2 in self._conn_items],
+                                   dtype=np.intp).reshape(-1, 2)
+        self._link_util_shown = np.full(len(self._link_entries), -1.0)
+
+        self._items_topology_version = self._topology_version
+        self._items_layout_key = None
+        self._layers_dirty = True
+        self._link_style_key = None
+
+    def _create_items_batch(self, specs):
+        """Create canvas items from (kind, coords, options) specs with a single tk.eval; returns their ids"""
+        if not specs:
+            return []
+        canvas = str(self.canvas)
+        commands = []
+        for kind, coords, options in specs:
+            words = [canvas, "create", kind]
+            words += [repr(float(c)) for c in coords]
+            for key, value in options.items():
+                words += ["-" + key, _tcl_word(value)]
+            commands.append("[" + " ".join(words) + "]")
+        result = self.canvas.tk.eval("list " + " ".join(commands))
+        return [int(item) for item in self.canvas.tk.splitlist(result)]
+
+    def _layout_topology_items(self):
+        """Move existing node and link items to the current node positions"""
+        coords = self.canvas.coords
+        for node, (body, icon, label, badge, badge_text) in self._node_items.items():
+            x, y = node.x, node.y
+            coords(body, x-30, y-30, x+30, y+30)
+            coords(icon, x, y-5)
+            coords(label, x, y+45)
+            coords(badge, x+20, y-20, x+30, y-10)
+            coords(badge_text, x+25, y-15)
+        for (node1, node2), entry in self._conn_items.items():
+            coords(entry['line'], node1.x, node1.y, node2.x, node2.y)
+            coords(entry['bw'], (node1.x + node2.x) / 2, (node1.y + node2.y) / 2 - 10)
+
+    def _style_connections(self):
+        """Apply idle/active/highlighted styling to link items"""
+        highlighted = self._highlighted_edges
+        base_color = self._dc.text_muted if not self.simulation_running else self._dc.accent
+        for (node1, node2), entry in self._conn_items.items():
+            if highlighted and frozenset((node1, node2)) in highlighted:
+                self.canvas.itemconfigure(entry['line'], fill=self._dc.warning, width=4, dash="")
+            else:
+                self.canvas.itemconfigure(entry['line'], fill=base_color, width=2, dash=(5, 3))
+        # utilization labels are only shown while the simulation runs
+        self.canvas.itemconfigure("bandwidth", state=tk.NORMAL if self.simulation_running else tk.HIDDEN)
+
+    def _draw_bandwidth_labels(self):
+        """Refresh per-link utilization labels in place, touching only those that changed"""
+        if not self.simulation_running or not self._link_entries:
+            return
+        max_bandwidth = 10
+        ends = self._link_ends
+        utilization = np.minimum((self.node_congestion[ends[:, 0]] + self.node_congestion[ends[:, 1]]) * 0.5,
+                                 max_bandwidth)
+        # Only links whose utilization moved since the last frame need new text
+        changed = np.flatnonzero(utilization != self._link_util_shown)
+        if not changed.size:
+            return
+        self._link_util_shown[changed] = utilization[changed]
+        changed_util = utilization[changed]
+        # 0/1/2 for <50% / <80% / >=80% of link capacity
+        buckets = (changed_util >= 0.5 * max_bandwidth).astype(np.intp) + (changed_util >= 0.8 * max_bandwidth)
+        for i, current_utilization, bucket in zip(changed.tolist(), changed_util.tolist(), buckets.tolist()):
+            entry = self._link_entries[i]
+            label_color = self._util_colors[bucket]
+            bandwidth_text = f"{current_utilization:.1f} / {max_bandwidth} Gbps"
+            if entry['text'] != bandwidth_text or entry['fill'] != label_color:
+                self.canvas.itemconfig(entry['bw'], text=bandwidth_text, fill=label_color)
+                entry['text'] = bandwidth_text
+                entry['fill'] = label_color
+
+    def _draw_packets(self, render=True):
+        self._tick_time = time.time()
+        node_x, node_y, node_congestion = self.node_x, self.node_y, self.node_congestion
         packets_to_remove = []
-        # iterate on a copy
-        for packet in list(self.packets):
-            if packet.current_index >= len(packet.path) - 1:
+        active = []
+        # nothing below adds or removes packets, so walk the live list without copying
+        for packet in self.packets:
+            if packet.current_index >= packet.hop_count:
                 packet.completed = True
                 self.record_packet_event(packet, "delivered")
                 packets_to_remove.append(packet)
+                if packet.canvas_item_id is not None:
+                    self.canvas.delete(packet.canvas_item_id)
+                    packet.canvas_item_id = None
                 continue
 
-            node1 = packet.path[packet.current_index]
-            node2 = packet.path[packet.current_index + 1]
-
             # handle congestion only at hop start
             if packet.progress == 0:
-                self.handle_congestion_control(packet, node1)
+                self.handle_congestion_control(packet, packet.path[packet.current_index])
+            active.append(packet)
 
-            x = node1.x + (node2.x - node1.x) * packet.progress
-            y = node1.y + (node2.y - node1.y) * packet.progress
+        if active:
+            # Gather per-packet hop state once, then do the arithmetic as array ops
+            n = len(active)
+            progress = np.fromiter((p.progress for p in active), dtype=np.float64, count=n)
+            src = np.fromiter((p.path[p.current_index].index for p in active), dtype=np.intp, count=n)
+            dst = np.fromiter((p.path[p.current_index + 1].index for p in active), dtype=np.intp, count=n)
+            cwnd = np.fromiter((p.cwnd for p in active), dtype=np.float64, count=n)
 
-            packet_size = max(5, min(15, int(5 + packet.cwnd * 0.5)))
+            xs, ys, sizes, done = advance_hops(node_x, node_y, node_congestion, src, dst,
+                                               progress, cwnd, PACKET_SIZE_LUT)
 
-            self.canvas.create_oval(x-packet_size, y-packet_size, x+packet_size, y+packet_size,
-                                   fill=packet.color, outline=self.colors['bg_secondary'], width=2,
-                                   tags=("packet", f"packet_{packet.packet_id}"))
+            # Remember where each packet was drawn for hover hit-testing
+            self._pkt_refs, self._pkt_x, self._pkt_y = active, xs, ys
 
-            speed_factor = max(0.01, 0.05 * (1 - node1.congestion * 0.05))
-            packet.progress += speed_factor
-            if packet.progress >= 1.0:
-                packet.progress = 0
-                packet.current_index += 1
-                self.record_packet_event(packet, "hop_completed")
+            for packet, x, y, packet_size, new_progress, hop_done in zip(
+                    active, xs.tolist(), ys.tolist(), sizes.tolist(), progress.tolist(), done.tolist()):
+                if render:
+                    if packet.canvas_item_id is None:
+                        packet.canvas_item_id = self.canvas.create_oval(
+                            x-packet_size, y-packet_size, x+packet_size, y+packet_size,
+                            fill=packet.color, outline=self._dc.bg_secondary, width=2,
+                            tags=("packet", f"packet_{packet.packet_id}"))
+                        # slot the new oval in under the nodes instead of restacking every layer
+                        self.canvas.tag_lower(packet.canvas_item_id, "node")
+                        packet.canvas_fill = packet.color
+                        packet.drawn_at = (x, y, packet_size)
+                    else:
+                        # sub-pixel moves (slow, congested hops) don't need a coords() round-trip
+                        last_x, last_y, last_size = packet.drawn_at
+                        if abs(x - last_x) + abs(y - last_y) >= 1 or packet_size != last_size:
+                            self.canvas.coords(packet.canvas_item_id,
+                                               x-packet_size, y-packet_size, x+packet_size, y+packet_size)
+                            packet.drawn_at = (x, y, packet_size)
+                        if packet.canvas_fill != packet.color:
+                            self.canvas.itemconfig(packet.canvas_item_id, fill=packet.color)
+                            packet.canvas_fill = packet.color
 
-        # remove delivered packets
-        if packets_to_remove:
-            self.packets = [p for p in self.packets if p not in packets_to_remove]
+                packet.progress = new_progress
+                if hop_done:
+                    packet.current_index += 1
+                    self.record_packet_event(packet, "hop_completed")
 
-    def _draw_nodes(self):
-        for node in self.nodes:
-            color = self.colors.get(node.type, self.colors['accent'])
+        if active:
+            self._packets_dirty = True
+        else:
+            self._clear_packet_positions()
 
-            if node == self.selected_node:
-                self.canvas.create_oval(node.x-35, node.y-35, node.x+35, node.y+35,
-                                       fill="", outline=self.colors['accent'], width=3, tags=("node",))
+        # remove delivered packets: the survivors are exactly `active`, already in order
+        if packets_to_remove:
+            self.packets[:] = active
+            self._recycle_packets(packets_to_remove)
 
-            self.canvas.create_oval(node.x-30, node.y-30, node.x+30, node.y+30,
-                                   fill=color, outline="white", width=2, tags=("node",))
+    def _clear_packet_positions(self):
+        self._pkt_refs = []
+        self._pkt_x = np.zeros(0, dtype=np.float64)
+        self._pkt_y = np.zeros(0, dtype=np.float64)
 
-            icons = {'cloud': '☁', 'router': '⚡', 'switch': '⊞', 'pc': '💻'}
-            self.canvas.create_text(node.x, node.y-5, text=icons.get(node.type, '?'),
-                                   font=("Segoe UI", 20), fill=self.colors['text'], tags=("node",))
+    def _recycle_packets(self, packets):
+        """Drop finished packets from the running tally and return them to the reuse pool"""
+        by_id = self._packets_by_id
+        for packet in packets:
+            by_id.pop(packet.packet_id, None)
+            if packet.tally is not None:
+                packet.tally.remove(packet)
+        room = self.max_packets - len(self._packet_pool)
+        if room > 0:
+            self._packet_pool.extend(packets[:room])
 
-            self.canvas.create_text(node.x, node.y+45, text=node.name,
-                                   font=("Segoe UI", 9, "bold"), fill=self.colors['text'], tags=("label",))
+    def _draw_selection(self):
+        node = self.selected_node
+        if self._selection_item is None:
+            self._selection_item = self.canvas.create_oval(0, 0, 0, 0, fill="", outline=self._dc.accent,
+                                                           width=3, state=tk.HIDDEN, tags=("selection",))
+            self._layers_dirty = True
+        if node is None:
+            self.canvas.itemconfigure(self._selection_item, state=tk.HIDDEN)
+        else:
+            self.canvas.coords(self._selection_item, node.x-35, node.y-35, node.x+35, node.y+35)
+            self.canvas.itemconfigure(self._selection_item, state=tk.NORMAL)
 
-            if node.congestion > 0:
-                congestion_level = node.get_congestion_level()
-                cong_color = (self.colors['success'] if congestion_level == 'low' else
-                              (self.colors['warning'] if congestion_level in ['medium', 'high'] else self.colors['error']))
-                self.canvas.create_oval(node.x+20, node.y-20, node.x+30, node.y-10,
-                                       fill=cong_color, outline="white", width=2, tags=("node",))
-                self.canvas.create_text(node.x+25, node.y-15, text=str(int(node.congestion)),
-                                       font=("Segoe UI", 7, "bold"), fill="white", tags=("node",))
+    def _draw_congestion_badges(self):
+        """Show, hide or recolor each node's persistent congestion badge when its value changes"""
+        itemconfigure = self.canvas.itemconfigure
+        congestion = self.node_congestion.tolist()
+        # Same thresholds as NetworkNode.get_congestion_level: <=1 low, <=3 medium, <=5 high, else critical
+        levels = np.searchsorted(CONGESTION_LEVEL_BOUNDS, self.node_congestion).tolist()
+        for node, items in self._node_items.items():
+            value = congestion[node.index]
+            shown = (self._cong_colors[levels[node.index]], str(int(value))) if value > 0 else None
+            if shown == self._badge_shown[node]:
+                continue
+            if shown is None:
+                itemconfigure(items[3], state=tk.HIDDEN)
+                itemconfigure(items[4], state=tk.HIDDEN)
+            else:
+                itemconfigure(items[3], fill=shown[0], state=tk.NORMAL)
+                itemconfigure(items[4], text=shown[1], state=tk.NORMAL)
+            self._badge_shown[node] = shown
 
     # --- Canvas / Topology helpers ---
     def get_canvas_bounds(self):
@@ -1666,10 +2624,11 @@ class CloudNetworkSimulator:
         if not self.nodes:
             return
 
-        min_x = min(node.x for node in self.nodes)
-        max_x = max(node.x for node in self.nodes)
-        min_y = min(node.y for node in self.nodes)
-        max_y = max(node.y for node in self.nodes)
+        # Freshly generated nodes aren't packed yet; pack them so the transform runs on the arrays
+        self._rebuild_soa()
+        xs, ys = self.node_x, self.node_y
+        min_x, max_x = float(xs.min()), float(xs.max())
+        min_y, max_y = float(ys.min()), float(ys.max())
 
         current_width = max_x - min_x if max_x > min_x else 1
         current_height = max_y - min_y if max_y > min_y else 1
@@ -1684,51 +2643,31 @@ class CloudNetworkSimulator:
         offset_x = bounds['center_x'] - (scaled_width / 2)
         offset_y = bounds['center_y'] - (scaled_height / 2)
 
-        for node in self.nodes:
-            node.x = ((node.x - min_x) * scale) + offset_x
-            node.y = ((node.y - min_y) * scale) + offset_y
-            # Clamp within bounds
-            node.x = min(max(bounds['min_x'], node.x), bounds['max_x'])
-            node.y = min(max(bounds['min_y'], node.y), bounds['max_y'])
+        # Transform and clamp in place; NetworkNode.x/y read straight from these arrays
+        xs -= min_x
+        xs *= scale
+        xs += offset_x
+        np.clip(xs, bounds['min_x'], bounds['max_x'], out=xs)
+        ys -= min_y
+        ys *= scale
+        ys += offset_y
+        np.clip(ys, bounds['min_y'], bounds['max_y'], out=ys)
+        self._layout_version += 1
 
         self.log_debug("Scaled topology to canvas bounds:", bounds)
 
-    # --- Bandwidth / UI helpers ---
-    def update_bandwidth_labels(self):
-        if not self.simulation_running:
-            return
-        try:
-            self.canvas.delete("bandwidth")
-        except Exception:
-            pass
-
-        for node1, node2 in self.connections:
-            max_bandwidth = 10
-            current_utilization = min((node1.congestion + node2.congestion) / 2, max_bandwidth)
-            utilization_percent = (current_utilization / max_bandwidth) * 100
-            label_color = (self.colors['success'] if utilization_percent < 50 else
-                           (self.colors['warning'] if utilization_percent < 80 else self.colors['error']))
-            mid_x = (node1.x + node2.x) / 2
-            mid_y = (node1.y + node2.y) / 2
-            self.canvas.create_text(mid_x, mid_y - 10, text=f"{current_utilization:.1f} / {max_bandwidth} Gbps",
-                                   font=("Segoe UI", 8), fill=label_color, tags=("bandwidth",))
-
-        if self.simulation_running:
-            self.root.after(500, self.update_bandwidth_labels)
-
     # --- Packet details update loop separate from canvas ---
     def schedule_packet_details_updates(self):
         if not self.manual_packet_mode:
             return
         # Update details for first active manual packet
-        if self.active_manual_packet_ids:
-            for packet in self.packets:
-                if packet.packet_id in self.active_manual_packet_ids:
-                    try:
-                        self._show_manual_packet_details(packet)
-                    except Exception:
-                        pass
-                    break
+        if self.active_manual_packet_ids and self._panel_visible():
+            packet = self._active_manual_packet()
+            if packet is not None:
+                try:
+                    self._show_manual_packet_details(packet)
+                except Exception:
+                    pass
 
         if self.manual_packet_mode:
             self.root.after(150, self.schedule_packet_details_updates)
@@ -1736,14 +2675,41 @@ class CloudNetworkSimulator:
     def stop_packet_details_updates(self):
         self.manual_packet_mode = False
         try:
-            for widget in self.packet_details_frame.winfo_children():
-                widget.destroy()
+            self._clear_packet_details()
             tk.Label(self.packet_details_frame, text="No active packets", bg=self.colors['surface'],
                      fg=self.colors['text_secondary'], font=("Segoe UI", 10, "italic")).pack(pady=30)
         except Exception:
             pass
     
     # NEW: Update status bar with algorithm and phase distribution
+    def set_status(self, text):
+        """Show text in the status bar; bursts collapse to one label update per 250 ms"""
+        self._pending_status = text
+        if self._status_flush_id is None:
+            delay = max(0, int((self._last_status_time + 0.25 - time.time()) * 1000))
+            self._status_flush_id = self.root.after(delay, self._flush_status)
+
+    def show_banner(self, text, color, duration_ms=3000):
+        """Overlay a self-dismissing notice on the canvas without blocking the event loop"""
+        if self._banner is None:
+            self._banner = tk.Label(self.canvas, fg="white", font=self._font_body_bold, padx=16, pady=8)
+        elif self._banner_after_id is not None:
+            self.root.after_cancel(self._banner_after_id)
+        self._banner.config(text=text, bg=color)
+        self._banner.place(relx=0.5, y=12, anchor='n')
+        self._banner_after_id = self.root.after(duration_ms, self._hide_banner)
+
+    def _hide_banner(self):
+        self._banner_after_id = None
+        self._banner.place_forget()
+
+    def _flush_status(self):
+        self._status_flush_id = None
+        self._last_status_time = time.time()
+        if self._pending_status != self._shown_status:
+            self.status_label.config(text=self._pending_status)
+            self._shown_status = self._pending_status
+
     def update_status_bar(self):
         """Update status bar with real-time algorithm and phase information"""
         if not self.simulation_running:
@@ -1755,42 +2721,96 @@ class CloudNetworkSimulator:
         
         # Calculate loss rate
         if len(self.packets) > 0:
-            lost_count = sum(1 for p in self.packets if p.lost)
-            loss_rate = (lost_count / len(self.packets)) * 100
+            loss_rate = (self._tally.lost_count / len(self.packets)) * 100
         else:
             loss_rate = 0
         
-        # Format status text
-        status_text = f"{algo_name} | Active: SS:{phase_counts['slow_start']}, "
-        status_text += f"CA:{phase_counts['congestion_avoidance']}, "
-        status_text += f"FR:{phase_counts['fast_retransmit']}, "
-        status_text += f"FRec:{phase_counts['fast_recovery']} | Loss Rate: {loss_rate:.1f}%"
-        
-        self.status_label.config(text=status_text)
-        
-        # Schedule next update
-        self.status_update_timer = self.root.after(1000, self.update_status_bar)
-            
+        self.set_status(STATUS_FMT.format(
+            algo=algo_name,
+            ss=phase_counts['slow_start'],
+            ca=phase_counts['congestion_avoidance'],
+            fr=phase_counts['fast_retransmit'],
+            frec=phase_counts['fast_recovery'],
+            loss=loss_rate
+        ))
+
+    def _start_sim_tick(self):
+        """Start the shared simulation timer; every periodic task is due immediately"""
+        if self._sim_tick_id is not None:
+            return
+        now = time.time()
+        self._next_spawn_time = self._next_decay_time = self._next_status_time = now
+        self._sim_tick()
+
+    def _stop_sim_tick(self):
+        if self._sim_tick_id is not None:
+            self.root.after_cancel(self._sim_tick_id)
+            self._sim_tick_id = None
+
+    def _sim_tick(self):
+        """One timer for packet generation, congestion decay and status refresh; sleeps until the next is due"""
+        self._sim_tick_id = None
+        if not self.simulation_running:
+            return
+        now = time.time()
+        # Spawns run on schedule, never early: the token bucket refills at exactly one token per
+        # period, so an early call would find it short and push the packet back a whole interval
+        if now >= self._next_spawn_time:
+            self.start_packet_generation()
+            # Step from the previous slot so the schedule doesn't drift
+            period = self.packet_generation_rate / 1000.0
+            self._next_spawn_time += period
+            if self._next_spawn_time <= now:
+                self._next_spawn_time = now + period  # fell a whole period behind: don't replay missed slots
+        horizon = now + 0.02  # run decay/status work due within 20ms now so it shares wakeups
+        if horizon >= self._next_decay_time:
+            self.decay_congestion()
+            self._next_decay_time = now + 0.5
+        if horizon >= self._next_status_time:
+            self.update_status_bar()
+            self._update_performance_traces()
+            self._next_status_time = now + 1.0
+        next_due = min(self._next_spawn_time, self._next_decay_time, self._next_status_time)
+        self._sim_tick_id = self.root.after(max(1, int((next_due - now) * 1000)), self._sim_tick)
+
     def start_packet_generation(self):
         if self.simulation_running and len(self.nodes) > 1:
             # Enforce max packet limit in performance mode
             if len(self.packets) < self.max_packets:
-                source = random.choice(self.nodes)
-                destination = random.choice([n for n in self.nodes if n != source])
-                self.spawn_packet(source, destination, manual=False)
+                if self._take_packet_token():
+                    # Pick two distinct nodes by index; skip over the source instead of filtering a list
+                    node_count = len(self.nodes)
+                    src_idx = random.randrange(node_count)
+                    dst_idx = random.randrange(node_count - 1)
+                    dst_idx += dst_idx >= src_idx
+                    source = self.nodes[src_idx]
+                    destination = self.nodes[dst_idx]
+                    self.spawn_packet(source, destination, manual=False)
             else:
+                # Backlogged: discard tokens so the bucket can't burst once packets drain
+                self._token_bucket['tokens'] = 0.0
+                self._token_bucket['last'] = time.time()
                 # Avoid spamming status too often
                 try:
-                    self.status_label.config(text=f"Packet limit ({self.max_packets}) reached - waiting for delivery")
+                    self.set_status(f"Packet limit ({self.max_packets}) reached - waiting for delivery")
                 except Exception:
                     pass
 
-            # Continue scheduling
-            self.root.after(self.packet_generation_rate, self.start_packet_generation)
+    def _take_packet_token(self):
+        """Refill the generation token bucket and consume one token if available"""
+        bucket = self._token_bucket
+        now = time.time()
+        bucket['tokens'] = min(bucket['capacity'], bucket['tokens'] + (now - bucket['last']) * bucket['rate'])
+        bucket['last'] = now
+        if bucket['tokens'] < 1.0 - 1e-9:  # tolerate rounding: a call on schedule accrues one token exactly
+            return False
+        bucket['tokens'] -= 1.0
+        return True
 
     # NEW: Generic packet creation helper (random + manual)
     def spawn_packet(self, source, destination, manual=False):
         """Create a packet between two nodes, respecting congestion settings"""
+        self._tick_time = time.time()
         path, total_latency = self.dijkstra_shortest_path(source, destination)
         if not path:
             if manual:
@@ -1802,31 +2822,34 @@ class CloudNetworkSimulator:
         if not manual and random.random() < self.packet_loss_rate / 100.0:
             self.record_packet_event_dropped(next_packet_id)
             self.packet_counter = next_packet_id
-            self.update_real_time_stats()
+            self._request_stats_update()
             return False
         
         self.packet_counter = next_packet_id
-        packet = Packet(source, destination, path, packet_id=self.packet_counter)
+        if self._packet_pool:
+            packet = self._packet_pool.pop()
+            packet.reset(source, destination, path, packet_id=self.packet_counter)
+        else:
+            packet = Packet(source, destination, path, packet_id=self.packet_counter)
         packet.total_latency = total_latency
+        packet.path_idx = np.fromiter((node.index for node in path), dtype=np.intp, count=len(path))
         self.packets.append(packet)
+        self._packets_by_id[packet.packet_id] = packet
+        self._tally.add(packet)
         
         # Record packet creation event
         event_type = "manual_created" if manual else "created"
         self.record_packet_event(packet, event_type)
         
-        # Update congestion based on traffic load
-        congestion_factor = 1
-        if self.traffic_load == "light":
-            congestion_factor = 0.5
-        elif self.traffic_load == "heavy":
-            congestion_factor = 2
-        
-        for node in path:
-            node.congestion = min(10, node.congestion + congestion_factor)
+        # Raise congestion along the path (factor cached per traffic load);
+        # one gather/scatter over the path's slots in the congestion array
+        congestion = self.node_congestion
+        congestion[packet.path_idx] = np.minimum(congestion[packet.path_idx] + self._congestion_factor, 10)
         
         # Track metrics + stats
         self.track_performance(total_latency, len(path))
-        self.update_real_time_stats()
+        self._request_stats_update()
+        self.schedule_redraw()
         return True
 
     # NEW: Manual packet trigger
@@ -1843,8 +2866,8 @@ class CloudNetworkSimulator:
             messagebox.showwarning("Invalid", "Select two different nodes.")
             return
         
-        source_node = next((n for n in self.nodes if n.name == source_name), None)
-        dest_node = next((n for n in self.nodes if n.name == dest_name), None)
+        source_node = self._nodes_by_name.get(source_name)
+        dest_node = self._nodes_by_name.get(dest_name)
         if not source_node or not dest_node:
             messagebox.showerror("Error", "Nodes not found.")
             return
@@ -1867,7 +2890,7 @@ class CloudNetworkSimulator:
                 
                 # Show detailed panel for this packet
                 self._show_manual_packet_details(manual_packet)
-                self.status_label.config(text=f"Manual Mode: {source_name} → {dest_name} (Press ▶ to resume auto)")
+                self.set_status(f"Manual Mode: {source_name} → {dest_name} (Press ▶ to resume auto)")
                 self.schedule_packet_details_updates()
         else:
             self.manual_packet_mode = False
@@ -1878,153 +2901,142 @@ class CloudNetworkSimulator:
     
     def _show_manual_packet_details(self, packet):
         """Display detailed analysis for a manual packet"""
-        # Clear and update packet details panel
-        for widget in self.packet_details_frame.winfo_children():
-            widget.destroy()
-        
-        # Title
-        tk.Label(self.packet_details_frame, text=f"Packet #{packet.packet_id}", 
-                font=("Segoe UI", 12, "bold"), bg=self.colors['surface'], 
-                fg=self.colors['accent']).pack(anchor='w', padx=10, pady=10)
-        
-        # Route info
-        route_text = f"{packet.source.name} → {packet.destination.name}"
-        tk.Label(self.packet_details_frame, text=route_text, font=("Segoe UI", 10),
-                bg=self.colors['surface'], fg=self.colors['text']).pack(anchor='w', padx=10)
-        
-        # Metrics container
-        metrics_frame = tk.Frame(self.packet_details_frame, bg=self.colors['panel_bg'], relief=tk.RAISED, bd=1)
+        if self._manual_panel is None:
+            self._build_manual_packet_panel()
+        if not self._manual_panel_packed:
+            self._clear_packet_details()
+            self._manual_panel.pack(fill=tk.BOTH, expand=True)
+            self._manual_panel_packed = True
+        self._update_manual_packet_panel(packet)
+
+    def _build_manual_packet_panel(self):
+        """Create the manual packet panel widgets once; updates only reconfigure them"""
+        panel = tk.Frame(self.packet_details_frame, bg=self.colors['surface'])
+        self._manual_panel = panel
+        labels = self._manual_labels
+
+        def section(title):
+            tk.Label(panel, text=title, font=("Segoe UI", 11, "bold"), bg=self.colors['surface'],
+                     fg=self.colors['accent']).pack(anchor='w', padx=10, pady=(15, 5))
+            frame = tk.Frame(panel, bg=self.colors['panel_bg'], relief=tk.RAISED, bd=1)
+            frame.pack(fill=tk.X, padx=10, pady=5)
+            return frame
+
+        def add_rows(frame, rows, font):
+            for key, label in rows:
+                row = tk.Frame(frame, bg=self.colors['panel_bg'])
+                row.pack(fill=tk.X, padx=8, pady=4)
+                tk.Label(row, text=label + ":", bg=self.colors['panel_bg'],
+                         fg=self.colors['text_secondary'], font=("Segoe UI", 9)).pack(side=tk.LEFT)
+                labels[key] = tk.Label(row, bg=self.colors['panel_bg'], font=font)
+                labels[key].pack(side=tk.RIGHT)
+
+        # Title and route
+        labels['title'] = tk.Label(panel, font=("Segoe UI", 12, "bold"), bg=self.colors['surface'],
+                                   fg=self.colors['accent'])
+        labels['title'].pack(anchor='w', padx=10, pady=10)
+        labels['route'] = tk.Label(panel, font=("Segoe UI", 10), bg=self.colors['surface'],
+                                   fg=self.colors['text'])
+        labels['route'].pack(anchor='w', padx=10)
+
+        metrics_frame = tk.Frame(panel, bg=self.colors['panel_bg'], relief=tk.RAISED, bd=1)
         metrics_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        # Create metric rows
-        metrics = [
-            ("Phase", lambda: packet.phase.replace('_', ' ').title(), packet.color),
-            ("cwnd (MSS)", lambda: f"{packet.cwnd:.2f}", self.colors['accent']),
-            ("RTT (ms)", lambda: f"{packet.rtt:.2f}", self.colors['warning']),
-            ("Hops Total", lambda: str(len(packet.path) - 1), self.colors['success']),
-            ("Hops Remaining", lambda: str(len(packet.path) - packet.current_index - 1), self.colors['text']),
-            ("Progress", lambda: f"{min(100, int((packet.current_index + packet.progress) / len(packet.path) * 100))}%", self.colors['accent']),
-            ("Status", lambda: "Delivered" if packet.completed else ("Lost" if packet.lost else "In Transit"), 
-             self.colors['success'] if packet.completed else (self.colors['error'] if packet.lost else self.colors['warning'])),
-        ]
-        
-        for label, value_fn, color in metrics:
-            row = tk.Frame(metrics_frame, bg=self.colors['panel_bg'])
-            row.pack(fill=tk.X, padx=8, pady=4)
-            
-            tk.Label(row, text=label + ":", bg=self.colors['panel_bg'], 
-                    fg=self.colors['text_secondary'], font=("Segoe UI", 9)).pack(side=tk.LEFT)
-            tk.Label(row, text=value_fn(), bg=self.colors['panel_bg'], 
-                    fg=color, font=("Segoe UI", 10, "bold")).pack(side=tk.RIGHT)
-        
-        # Bandwidth & Throughput Section
-        tk.Label(self.packet_details_frame, text="Network Analytics", 
-                font=("Segoe UI", 11, "bold"), bg=self.colors['surface'], 
-                fg=self.colors['accent']).pack(anchor='w', padx=10, pady=(15, 5))
-        
-        analytics_frame = tk.Frame(self.packet_details_frame, bg=self.colors['panel_bg'], relief=tk.RAISED, bd=1)
-        analytics_frame.pack(fill=tk.X, padx=10, pady=5)
-        
-        # Current node bandwidth
-        if packet.current_index < len(packet.path):
-            current_node = packet.path[packet.current_index]
-            next_node = packet.path[min(packet.current_index + 1, len(packet.path) - 1)]
-            
-            # Calculate throughput for this packet
-            link_throughput = (packet.cwnd * 1500 * 8) / (max(packet.rtt, 1) / 1000) / 1000000  # Mbps
-            
-            row = tk.Frame(analytics_frame, bg=self.colors['panel_bg'])
-            row.pack(fill=tk.X, padx=8, pady=4)
-            tk.Label(row, text="Current Link:", bg=self.colors['panel_bg'], 
-                    fg=self.colors['text_secondary'], font=("Segoe UI", 9)).pack(side=tk.LEFT)
-            tk.Label(row, text=f"{current_node.name} → {next_node.name}", bg=self.colors['panel_bg'], 
-                    fg=self.colors['accent'], font=("Segoe UI", 9, "bold")).pack(side=tk.RIGHT)
-            
-            row = tk.Frame(analytics_frame, bg=self.colors['panel_bg'])
-            row.pack(fill=tk.X, padx=8, pady=4)
-            tk.Label(row, text="Link Bandwidth:", bg=self.colors['panel_bg'], 
-                    fg=self.colors['text_secondary'], font=("Segoe UI", 9)).pack(side=tk.LEFT)
-            max_bw = 10  # Gbps
-            utilization = min(100, int((link_throughput / (max_bw * 1000)) * 100))
-            color = self.colors['success'] if utilization < 50 else (self.colors['warning'] if utilization < 80 else self.colors['error'])
-            tk.Label(row, text=f"{link_throughput:.2f} Mbps / {max_bw*1000} Mbps ({utilization}%)", 
-                    bg=self.colors['panel_bg'], fg=color, font=("Segoe UI", 9, "bold")).pack(side=tk.RIGHT)
-            
-            row = tk.Frame(analytics_frame, bg=self.colors['panel_bg'])
-            row.pack(fill=tk.X, padx=8, pady=4)
-            tk.Label(row, text="Link Latency:", bg=self.colors['panel_bg'], 
-                    fg=self.colors['text_secondary'], font=("Segoe UI", 9)).pack(side=tk.LEFT)
-            tk.Label(row, text=f"{current_node.latency}ms", bg=self.colors['panel_bg'], 
-                    fg=self.colors['text'], font=("Segoe UI", 9, "bold")).pack(side=tk.RIGHT)
-            
-            row = tk.Frame(analytics_frame, bg=self.colors['panel_bg'])
-            row.pack(fill=tk.X, padx=8, pady=4)
-            tk.Label(row, text="Congestion Level:", bg=self.colors['panel_bg'], 
-                    fg=self.colors['text_secondary'], font=("Segoe UI", 9)).pack(side=tk.LEFT)
-            cong_level = current_node.get_congestion_level()
-            cong_color = self.colors['success'] if cong_level == 'low' else (self.colors['warning'] if cong_level in ['medium', 'high'] else self.colors['error'])
-            tk.Label(row, text=cong_level.upper(), bg=self.colors['panel_bg'], 
-                    fg=cong_color, font=("Segoe UI", 9, "bold")).pack(side=tk.RIGHT)
-        
-        # Algorithm info
-        tk.Label(self.packet_details_frame, text="Algorithm Details", 
-                font=("Segoe UI", 11, "bold"), bg=self.colors['surface'], 
-                fg=self.colors['accent']).pack(anchor='w', padx=10, pady=(15, 5))
-        
-        algo_frame = tk.Frame(self.packet_details_frame, bg=self.colors['panel_bg'], relief=tk.RAISED, bd=1)
-        algo_frame.pack(fill=tk.X, padx=10, pady=5)
-        
-        algo_name = "TCP Reno" if self.congestion_algorithm == "reno" else "TCP Tahoe"
-        row = tk.Frame(algo_frame, bg=self.colors['panel_bg'])
-        row.pack(fill=tk.X, padx=8, pady=4)
-        tk.Label(row, text="Algorithm:", bg=self.colors['panel_bg'], 
-                fg=self.colors['text_secondary'], font=("Segoe UI", 9)).pack(side=tk.LEFT)
-        tk.Label(row, text=algo_name, bg=self.colors['panel_bg'], 
-                fg=self.colors['accent'], font=("Segoe UI", 9, "bold")).pack(side=tk.RIGHT)
-        
-        row = tk.Frame(algo_frame, bg=self.colors['panel_bg'])
-        row.pack(fill=tk.X, padx=8, pady=4)
-        tk.Label(row, text="ssthresh (MSS):", bg=self.colors['panel_bg'], 
-                fg=self.colors['text_secondary'], font=("Segoe UI", 9)).pack(side=tk.LEFT)
-        tk.Label(row, text=f"{packet.ssthresh:.2f}", bg=self.colors['panel_bg'], 
-                fg=self.colors['text'], font=("Segoe UI", 9, "bold")).pack(side=tk.RIGHT)
-        
-        row = tk.Frame(algo_frame, bg=self.colors['panel_bg'])
-        row.pack(fill=tk.X, padx=8, pady=4)
-        tk.Label(row, text="Dup ACKs:", bg=self.colors['panel_bg'], 
-                fg=self.colors['text_secondary'], font=("Segoe UI", 9)).pack(side=tk.LEFT)
-        tk.Label(row, text=str(packet.dup_ack_count), bg=self.colors['panel_bg'], 
-                fg=self.colors['text'], font=("Segoe UI", 9, "bold")).pack(side=tk.RIGHT)
-        
+        add_rows(metrics_frame, (
+            ('phase', "Phase"), ('cwnd', "cwnd (MSS)"), ('rtt', "RTT (ms)"), ('hops_total', "Hops Total"),
+            ('hops_left', "Hops Remaining"), ('progress', "Progress"), ('status', "Status"),
+        ), ("Segoe UI", 10, "bold"))
+
+        add_rows(section("Network Analytics"), (
+            ('link', "Current Link"), ('bandwidth', "Link Bandwidth"),
+            ('latency', "Link Latency"), ('congestion', "Congestion Level"),
+        ), ("Segoe UI", 9, "bold"))
+
+        add_rows(section("Algorithm Details"), (
+            ('algorithm', "Algorithm"), ('ssthresh', "ssthresh (MSS)"), ('dup_acks', "Dup ACKs"),
+        ), ("Segoe UI", 9, "bold"))
+
         # Progress bar
-        progress_pct = min(100, int((packet.current_index + packet.progress) / len(packet.path) * 100))
-        
-        tk.Label(self.packet_details_frame, text="Transmission Progress", 
-                font=("Segoe UI", 10, "bold"), bg=self.colors['surface'], 
-                fg=self.colors['text']).pack(anchor='w', padx=10, pady=(15, 8))
-        
-        progress_bg = tk.Canvas(self.packet_details_frame, height=20, width=300, bg=self.colors['panel_bg'], 
-                               highlightthickness=0)
-        progress_bg.pack(fill=tk.X, padx=10, pady=5)
-        max_bar_width = 300
-        progress_width = int(progress_pct / 100 * max_bar_width)
-        progress_bg.create_rectangle(0, 0, progress_width, 20, fill=packet.color, outline="")
-        progress_bg.create_text(max_bar_width / 2, 10, text=f"{progress_pct}%", fill=self.colors['text'], font=("Segoe UI", 9, "bold"))
+        tk.Label(panel, text="Transmission Progress", font=("Segoe UI", 10, "bold"),
+                 bg=self.colors['surface'], fg=self.colors['text']).pack(anchor='w', padx=10, pady=(15, 8))
+        self._progress_canvas = tk.Canvas(panel, height=20, width=300, bg=self.colors['panel_bg'],
+                                          highlightthickness=0)
+        self._progress_canvas.pack(fill=tk.X, padx=10, pady=5)
+        self._progress_rect = self._progress_canvas.create_rectangle(0, 0, 0, 20, outline="")
+        self._progress_text = self._progress_canvas.create_text(
+            150, 10, fill=self.colors['text'], font=("Segoe UI", 9, "bold"))
+
+    def _update_manual_packet_panel(self, packet):
+        """Write a manual packet's current state into the prebuilt panel"""
+        c = self._dc
+        progress_pct = min(100, int((packet.current_index + packet.progress) / packet.path_len * 100))
+        if packet.completed:
+            status, status_color = "Delivered", c.success
+        elif packet.lost:
+            status, status_color = "Lost", c.error
+        else:
+            status, status_color = "In Transit", c.warning
+
+        current_node = packet.path[min(packet.current_index, packet.hop_count)]
+        next_node = packet.path[min(packet.current_index + 1, packet.hop_count)]
+        link_throughput = (packet.cwnd * 1500 * 8) / (max(packet.rtt, 1) / 1000) / 1000000  # Mbps
+        max_bw = 10  # Gbps
+        utilization = min(100, int((link_throughput / (max_bw * 1000)) * 100))
+        util_color = c.success if utilization < 50 else (c.warning if utilization < 80 else c.error)
+        cong_level = current_node.get_congestion_level()
+        cong_color = c.success if cong_level == 'low' else (c.warning if cong_level in ['medium', 'high'] else c.error)
+
+        values = {
+            'title': (f"Packet #{packet.packet_id}", None),
+            'route': (f"{packet.source.name} → {packet.destination.name}", None),
+            'phase': (self._phase_title[packet.phase], packet.color),
+            'cwnd': (f"{packet.cwnd:.2f}", c.accent),
+            'rtt': (f"{packet.rtt:.2f}", c.warning),
+            'hops_total': (str(packet.hop_count), c.success),
+            'hops_left': (str(packet.hop_count - packet.current_index), c.text),
+            'progress': (f"{progress_pct}%", c.accent),
+            'status': (status, status_color),
+            'link': (f"{current_node.name} → {next_node.name}", c.accent),
+            'bandwidth': (f"{link_throughput:.2f} Mbps / {max_bw*1000} Mbps ({utilization}%)", util_color),
+            'latency': (f"{current_node.latency}ms", c.text),
+            'congestion': (cong_level.upper(), cong_color),
+            'algorithm': ("TCP Reno" if self.congestion_algorithm == "reno" else "TCP Tahoe", c.accent),
+            'ssthresh': (f"{packet.ssthresh:.2f}", c.text),
+            'dup_acks': (str(packet.dup_ack_count), c.text),
+            'bar': (progress_pct, packet.color),
+        }
+        # Only push what changed since the last refresh
+        shown = self._manual_shown
+        for key, value in values.items():
+            if shown.get(key) == value:
+                continue
+            shown[key] = value
+            if key == 'bar':
+                self._progress_canvas.coords(self._progress_rect, 0, 0, int(progress_pct / 100 * 300), 20)
+                self._progress_canvas.itemconfigure(self._progress_rect, fill=packet.color)
+                self._progress_canvas.itemconfigure(self._progress_text, text=f"{progress_pct}%")
+            elif value[1] is None:
+                self._manual_labels[key].config(text=value[0])
+            else:
+                self._manual_labels[key].config(text=value[0], fg=value[1])
     
+    def _active_manual_packet(self):
+        """Oldest manual packet still in flight, found by id rather than scanning self.packets"""
+        by_id = self._packets_by_id
+        live = [pid for pid in self.active_manual_packet_ids if pid in by_id]
+        return by_id[min(live)] if live else None
+
     # NEW: Update detailed packet view in loop
     def update_manual_packet_display(self):
         """Continuously update manual packet details"""
         if self.manual_packet_mode and self.active_manual_packet_ids:
-            for packet in self.packets:
-                if packet.packet_id in self.active_manual_packet_ids:
-                    self._show_manual_packet_details(packet)
-                    break
-            else:
+            packet = self._active_manual_packet()
+            if packet is None:
                 self.active_manual_packet_ids.clear()
+            elif self._panel_visible():
+                self._show_manual_packet_details(packet)
         elif self.manual_packet_mode:
             # Manual packets finished
-            for widget in self.packet_details_frame.winfo_children():
-                widget.destroy()
+            self._clear_packet_details()
             tk.Label(
                 self.packet_details_frame,
                 text="Manual packet completed ✓",
@@ -2047,36 +3059,25 @@ class CloudNetworkSimulator:
     # NEW: Record dropped packet event
     def record_packet_event_dropped(self, packet_id):
         """Record event for dropped packet"""
-        current_time = time.time() - self.performance_start_time
-        event = {
-            'time': current_time,
-            'packet_id': packet_id,
-            'cwnd': 0,
-            'phase': "dropped",
-            'rtt': 0,
-            'event_type': "dropped",
-            'throughput': 0,
-            'node_congestion': 0
-        }
-        self.packet_events.append(event)
+        current_time = self._tick_time - self.performance_start_time
+        self._append_packet_event(current_time, packet_id, 0, "dropped", 0, "dropped", 0, 0)
     # NEW: Track performance over time
     def track_performance(self, latency, hops):
         """Track latency and throughput metrics over time"""
         current_time = time.time() - self.performance_start_time
-        self.time_stamps.append(current_time)
-        self.latency_history.append(latency)
+        history = self.perf_history
         
         # Calculate throughput (simplified: packets per second * avg packet size)
         # Assuming 1500 bytes per packet, throughput in Mbps
-        if len(self.time_stamps) > 1:
-            time_diff = self.time_stamps[-1] - self.time_stamps[-2]
+        if len(history):
+            time_diff = current_time - history.times[-1]
             if time_diff > 0:
                 throughput = (1500 * 8) / (time_diff * 1000000)  # Convert to Mbps
-                self.throughput_history.append(throughput)
             else:
-                self.throughput_history.append(self.throughput_history[-1] if self.throughput_history else 0)
+                throughput = history.throughputs[-1]
         else:
-            self.throughput_history.append(0)
+            throughput = 0
+        history.append(current_time, latency, throughput)
             
          # NEW: Update routing statistics
         self.routing_stats['total_packets'] += 1
@@ -2091,243 +3092,400 @@ class CloudNetworkSimulator:
         total_hops = self.routing_stats['avg_hop_count'] * (self.routing_stats['total_packets'] - 1) + hop_count
         self.routing_stats['avg_hop_count'] = total_hops / self.routing_stats['total_packets']
         
-        # Store path in history (keep last 100)
+        # Store path in history (bounded deque drops the oldest)
         self.routing_stats['path_history'].append({
             'hops': hop_count,
             'latency': latency,
             'time': time.time() - self.performance_start_time
         })
-        
-        if len(self.routing_stats['path_history']) > 100:
-            self.routing_stats['path_history'].pop(0)
-
-        # Keep only last 50 data points
-        if len(self.time_stamps) > 50:
-            self.time_stamps.pop(0)
-            self.latency_history.pop(0)
-            self.throughput_history.pop(0)
-
 
     # NEW: Decay congestion over time (natural decrease)
     def decay_congestion(self):
         """Gradually reduce congestion on all nodes"""
         if self.simulation_running:
-            for node in self.nodes:
-                if node.congestion > 0:
-                    # Decay rate based on traffic load
-                    decay_rate = 0.1 if self.traffic_load == "heavy" else 0.2
-                    node.congestion = max(0, node.congestion - decay_rate)
-            
-            # Call again after 500ms
-            self.root.after(500, self.decay_congestion)
+            if self.node_congestion.any():
+                # Decay rate is cached per traffic load by set_traffic_load
+                np.maximum(self.node_congestion - self._decay_rate, 0, out=self.node_congestion)
+                self.schedule_redraw()  # badges and link labels change with congestion
 
     # NEW: Show Performance Graphs Window
     def show_performance_graphs(self):
-        if not self.latency_history or len(self.latency_history) < 2:
+        if len(self.perf_history) < 2:
             messagebox.showinfo("No Data", "Start the simulation to collect performance data")
             return
+
+        # Window already built (open or hidden): update the cached figure in place
+        if self._perf_window is not None and self._perf_window.winfo_exists():
+            self._perf_hidden = False
+            self._perf_window.deiconify()
+            self._perf_window.lift()
+            self._request_perf_refresh()
+            return
         
+        # Shared palette entries, looked up once for the whole build
+        c_bg, c_text, c_text2, c_border, c_surface = itemgetter(
+            'bg', 'text', 'text_secondary', 'border', 'surface')(self.colors)
+
         graph_window = tk.Toplevel(self.root)
         graph_window.title("Network Performance Graphs")
         graph_window.geometry("1400x1000")
-        graph_window.configure(bg=self.colors['bg'])
+        graph_window.configure(bg=c_bg)
         
         # Title
         title = tk.Label(graph_window, text="📈 Network Performance Analysis", 
                         font=("Segoe UI", 16, "bold"),
-                        bg=self.colors['bg'], fg=self.colors['text'])
+                        bg=c_bg, fg=c_text)
         title.pack(pady=15)
         
        
         # Create matplotlib figure with 6 subplots (2x3 grid)
-        fig = plt.figure(figsize=(13, 9))
-        fig.patch.set_facecolor(self.colors['bg_secondary'])
-        
-        # Original 4 graphs
-        ax1 = plt.subplot(2, 3, 1)
-        ax2 = plt.subplot(2, 3, 2)
-        ax3 = plt.subplot(2, 3, 3)
-        ax4 = plt.subplot(2, 3, 4)
-        # New graphs
-        ax5 = plt.subplot(2, 3, 5)
-        ax6 = plt.subplot(2, 3, 6)
-        
-        # Graph 1: Latency over Time
-        ax1.plot(self.time_stamps, self.latency_history, color='#0066cc', linewidth=2, marker='o', markersize=4)
-        ax1.set_xlabel('Time (seconds)', color=self.colors['text_secondary'], fontsize=11)
-        ax1.set_ylabel('Latency (ms)', color=self.colors['text_secondary'], fontsize=11)
-        ax1.set_title('Network Latency Over Time', color=self.colors['text'], fontsize=13, fontweight='bold')
+        _load_matplotlib()
+        with plt.rc_context(self._plot_rc):
+            fig = plt.figure(figsize=(13, 9))
+            # Original 4 graphs
+            ax1 = fig.add_subplot(2, 3, 1)
+            ax2 = fig.add_subplot(2, 3, 2)
+            ax3 = fig.add_subplot(2, 3, 3)
+            ax4 = fig.add_subplot(2, 3, 4)
+            # New graphs
+            ax5 = fig.add_subplot(2, 3, 5)
+            ax6 = fig.add_subplot(2, 3, 6)
+        
+        # Graph 1: Latency over Time (line data filled in by _refresh_performance_graphs)
+        latency_line, = ax1.plot([], [], color='#0066cc', linewidth=2, marker='o', markersize=4, animated=True)
+        ax1.set_xlabel('Time (seconds)', color=c_text2, fontsize=11)
+        ax1.set_ylabel('Latency (ms)', color=c_text2, fontsize=11)
+        ax1.set_title('Network Latency Over Time', color=c_text, fontsize=13, fontweight='bold')
         
         # Graph 2: Throughput over Time
-        ax2.plot(self.time_stamps, self.throughput_history, color='#28a745', linewidth=2, marker='s', markersize=4)
-        ax2.set_xlabel('Time (seconds)', color=self.colors['text_secondary'], fontsize=11)
-        ax2.set_ylabel('Throughput (Mbps)', color=self.colors['text_secondary'], fontsize=11)
-        ax2.set_title('Network Throughput Over Time', color=self.colors['text'], fontsize=13, fontweight='bold')
-        
-        # Graph 3: Hop Count Distribution
-        hop_counts = [packet.hop_count for packet in self.packets if hasattr(packet, 'hop_count')]
-        if not hop_counts:
-            # Use path lengths from history
-            hop_counts = list(range(1, min(len(self.nodes), 10)))
-            hop_frequencies = [random.randint(1, 10) for _ in hop_counts]
-        else:
-            hop_frequencies = [hop_counts.count(i) for i in range(max(hop_counts) + 1)]
-            hop_counts = list(range(max(hop_counts) + 1))
-        
-        ax3.bar(hop_counts, hop_frequencies, color='#6610f2', alpha=0.9, edgecolor=self.colors['surface'], linewidth=1)
-        ax3.set_xlabel('Number of Hops', color=self.colors['text_secondary'], fontsize=11)
-        ax3.set_ylabel('Frequency', color=self.colors['text_secondary'], fontsize=11)
-        ax3.set_title('Hop Count Distribution', color=self.colors['text'], fontsize=13, fontweight='bold')
-        ax3.grid(True, alpha=0.3, color=self.colors['border'], axis='y')
-        
-        # NEW: Graph 4: Congestion Heatmap
-        congestion_data = [node.congestion for node in self.nodes]
-        node_names = [node.name for node in self.nodes]
-        
-        colors_map = [
-            self.colors['success'] if c <= 1 else
-            self.colors['warning'] if c <= 3 else
-            self.colors['phase_fast_recovery'] if c <= 5 else
-            self.colors['error']
-            for c in congestion_data
-        ]
-        
-        ax4.barh(node_names[:10], congestion_data[:10], color=colors_map[:10], alpha=0.85, edgecolor=self.colors['surface'])
-        ax4.set_xlabel('Congestion Level', color=self.colors['text_secondary'], fontsize=11)
-        ax4.set_ylabel('Node', color=self.colors['text_secondary'], fontsize=11)
-        ax4.set_title('Node Congestion Levels', color=self.colors['text'], fontsize=13, fontweight='bold')
-        ax4.grid(True, alpha=0.3, color=self.colors['border'], axis='x')
-        
-        # NEW: Graph 5: Congestion Window Evolution
-        if self.packet_events:
-            # Get multiple packets for overlay
-            unique_packet_ids = list(set([e.get('packet_id') for e in self.packet_events if 'packet_id' in e]))[:5]  # Limit to 5 packets
-            
-            for pid in unique_packet_ids:
-                packet_evts = [e for e in self.packet_events if e.get('packet_id') == pid]
-                if packet_evts:
-                    times = [e.get('time', 0) for e in packet_evts]
-                    cwnds = [e.get('cwnd', 0) for e in packet_evts]
-                    if times and cwnds:
-                        ax5.plot(times, cwnds, linewidth=2, alpha=0.7, label=f'Packet {pid}')
-            
-            # Mark phase transitions
-            for pid in unique_packet_ids[:1]:  # Mark transitions for first packet
-                packet_evts = [e for e in self.packet_events if e.get('packet_id') == pid]
-                if len(packet_evts) > 1:
-                    prev_phase = packet_evts[0].get('phase', '')
-                    for i, evt in enumerate(packet_evts[1:], 1):
-                        current_phase = evt.get('phase', '')
-                        if current_phase != prev_phase:
-                            ax5.axvline(x=evt.get('time', 0), color='#fbbf24', linestyle='--', 
-                                       linewidth=1, alpha=0.5)
-                        prev_phase = current_phase
-        
-        ax5.set_xlabel('Time (seconds)', color=self.colors['text_secondary'], fontsize=11)
-        ax5.set_ylabel('cwnd (MSS)', color=self.colors['text_secondary'], fontsize=11)
-        ax5.set_title('Congestion Window Evolution', color=self.colors['text'], fontsize=13, fontweight='bold')
-        legend5 = ax5.legend(loc='upper left', fontsize=8)
-        if legend5:
-            legend5.get_frame().set_facecolor(self.colors['surface'])
-            legend5.get_frame().set_edgecolor(self.colors['border'])
-            for text in legend5.get_texts():
-                text.set_color(self.colors['text'])
-        
-        # NEW: Graph 6: Algorithm Comparison (if data available)
-        # This would show comparison if user switched algorithms
-        # For now, show current algorithm performance metrics
-        algo_name = "Reno" if self.congestion_algorithm == "reno" else "Tahoe"
-        
-        # Calculate metrics
-        if self.packet_events:
-            cwnds = [e.get('cwnd', 0) for e in self.packet_events if 'cwnd' in e]
-            throughputs = [e.get('throughput', 0) for e in self.packet_events if 'throughput' in e]
-            avg_cwnd = sum(cwnds) / len(cwnds) if cwnds else 0
-            max_cwnd = max(cwnds) if cwnds else 0
-            avg_throughput = sum(throughputs) / len(throughputs) if throughputs else 0
-            loss_count = sum(1 for e in self.packet_events if e.get('event_type') == 'dropped')
-            loss_rate = (loss_count / len(self.packet_events)) * 100 if self.packet_events else 0
-        else:
-            avg_cwnd = 0
-            max_cwnd = 0
-            avg_throughput = 0
-            loss_rate = 0
-        
-        metrics = ['Avg cwnd', 'Max cwnd', 'Avg Throughput\n(Mbps)', 'Loss Rate\n(%)']
-        values = [avg_cwnd, max_cwnd, avg_throughput, loss_rate]
-        colors_bar = ['#3b82f6', '#8b5cf6', '#10b981', '#ef4444']
-        
-        bars = ax6.bar(metrics, values, color=colors_bar, alpha=0.85, edgecolor=self.colors['surface'], linewidth=1)
-        ax6.set_ylabel('Value', color=self.colors['text_secondary'], fontsize=11)
-        ax6.set_title(f'Algorithm Performance: {algo_name}', color=self.colors['text'], fontsize=13, fontweight='bold')
-        ax6.grid(True, alpha=0.3, color=self.colors['border'], axis='y')
-        
-        # Add value labels on bars
-        for bar, val in zip(bars, values):
-            height = bar.get_height()
-            ax6.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{val:.1f}', ha='center', va='bottom', color=self.colors['text'], fontsize=9)
+        throughput_line, = ax2.plot([], [], color='#28a745', linewidth=2, marker='s', markersize=4, animated=True)
+        ax2.set_xlabel('Time (seconds)', color=c_text2, fontsize=11)
+        ax2.set_ylabel('Throughput (Mbps)', color=c_text2, fontsize=11)
+        ax2.set_title('Network Throughput Over Time', color=c_text, fontsize=13, fontweight='bold')
+
+        # Graphs 3-6: labels are static; _refresh_performance_graphs updates their artists in place
+        ax3.set_xlabel('Number of Hops', color=c_text2, fontsize=11)
+        ax3.set_ylabel('Frequency', color=c_text2, fontsize=11)
+        ax3.set_title('Hop Count Distribution', color=c_text, fontsize=13, fontweight='bold')
+        ax3.grid(True, alpha=0.3, color=c_border, axis='y')
+
+        ax4.set_xlabel('Congestion Level', color=c_text2, fontsize=11)
+        ax4.set_ylabel('Node', color=c_text2, fontsize=11)
+        ax4.set_title('Node Congestion Levels', color=c_text, fontsize=13, fontweight='bold')
+        ax4.grid(True, alpha=0.3, color=c_border, axis='x')
 
-        self._style_axes([ax1, ax2, ax3, ax4, ax5, ax6])
+        ax5.set_xlabel('Time (seconds)', color=c_text2, fontsize=11)
+        ax5.set_ylabel('cwnd (MSS)', color=c_text2, fontsize=11)
+        ax5.set_title('Congestion Window Evolution', color=c_text, fontsize=13, fontweight='bold')
+        # All overlaid cwnd traces share one collection; the proxy lines only feed the legend
+        cwnd_colors = plt.cm.tab10.colors[:5]
+        cwnd_traces = LineCollection([], linewidths=2, alpha=0.7, colors=cwnd_colors)
+        ax5.add_collection(cwnd_traces)
+        cwnd_proxies = [Line2D([], [], color=color, linewidth=2, alpha=0.7) for color in cwnd_colors]
+        # Phase changes of the first packet, as one collection of full-height lines
+        phase_marks = LineCollection([], colors='#fbbf24', linestyles='--', linewidths=1, alpha=0.5,
+                                     transform=ax5.get_xaxis_transform())
+        ax5.add_collection(phase_marks, autolim=False)
+
+        metric_bars = ax6.bar(['Avg cwnd', 'Max cwnd', 'Avg Throughput\n(Mbps)', 'Loss Rate\n(%)'], [0, 0, 0, 0],
+                              color=['#3b82f6', '#8b5cf6', '#10b981', '#ef4444'], alpha=0.85,
+                              edgecolor=c_surface, linewidth=1)
+        metric_labels = [ax6.text(bar.get_x() + bar.get_width()/2., 0, '', ha='center', va='bottom',
+                                  color=c_text, fontsize=9) for bar in metric_bars]
+        ax6.set_ylabel('Value', color=c_text2, fontsize=11)
+        ax6.set_title('Algorithm Performance', color=c_text, fontsize=13, fontweight='bold')
+        ax6.grid(True, alpha=0.3, color=c_border, axis='y')
 
         fig.subplots_adjust(hspace=0.35, wspace=0.28, left=0.06, right=0.98, top=0.93, bottom=0.08)
         
         # Embed matplotlib figure in tkinter window
-        canvas_frame = tk.Frame(graph_window, bg=self.colors['bg'])
+        canvas_frame = tk.Frame(graph_window, bg=c_bg)
         canvas_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         canvas = FigureCanvasTkAgg(fig, master=canvas_frame)
-        canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # Every full draw (refresh, resize) re-captures the backgrounds the live traces blit onto
+        canvas.mpl_connect('draw_event', self._on_perf_draw)
         
         # Statistics Frame
         stats_frame = tk.Frame(graph_window, bg=self.colors['panel_bg'])
         stats_frame.pack(fill=tk.X, padx=20, pady=10)
         
-        # Calculate statistics
-        avg_latency = sum(self.latency_history) / len(self.latency_history)
-        max_latency = max(self.latency_history)
-        min_latency = min(self.latency_history)
-        avg_throughput = sum(self.throughput_history) / len(self.throughput_history) if self.throughput_history else 0
-        
-        stats_text = f"📊 Statistics: Avg Latency: {avg_latency:.2f}ms | Min: {min_latency:.2f}ms | Max: {max_latency:.2f}ms | Avg Throughput: {avg_throughput:.2f}Mbps"
-        
-        stats_label = tk.Label(stats_frame, text=stats_text,
-                              bg=self.colors['panel_bg'], fg=self.colors['text'],
+        stats_label = tk.Label(stats_frame, text="",
+                              bg=self.colors['panel_bg'], fg=c_text,
                               font=("Segoe UI", 10, "bold"))
         stats_label.pack(pady=10)
         
         # Buttons
-        btn_frame = tk.Frame(graph_window, bg=self.colors['bg'])
+        btn_frame = tk.Frame(graph_window, bg=c_bg)
         btn_frame.pack(pady=10)
         
-        def refresh_graphs():
-            graph_window.destroy()
-            self.show_performance_graphs()
-        
         def export_data():
-            import csv
             from datetime import datetime
-            if not self.time_stamps:
+            if not len(self.perf_history):
                 messagebox.showinfo("No Data", "No performance data to export yet.")
                 return
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"network_performance_{timestamp}.csv"
             try:
-                with open(filename, 'w', newline='') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(['Time (s)', 'Latency (ms)', 'Throughput (Mbps)'])
-                    for i in range(len(self.time_stamps)):
-                        latency = self.latency_history[i] if i < len(self.latency_history) else 0
-                        throughput = self.throughput_history[i] if i < len(self.throughput_history) else 0
-                        writer.writerow([f"{self.time_stamps[i]:.2f}", f"{latency:.2f}", f"{throughput:.2f}"])
+                # Whole columns in one call; CRLF rows as csv.writer produced
+                np.savetxt(filename,
+                           np.column_stack((self.time_stamps, self.latency_history, self.throughput_history)),
+                           fmt='%.2f', delimiter=',', newline='\r\n',
+                           header='Time (s),Latency (ms),Throughput (Mbps)', comments='')
                 messagebox.showinfo("Export Complete", f"Performance data exported to:\n{filename}")
             except Exception as exc:
                 messagebox.showerror("Export Failed", f"Unable to export data:\n{exc}")
         
-        self.create_button(btn_frame, "🔄 Refresh", refresh_graphs, self.colors['accent']).pack(side=tk.LEFT, padx=5)
+        self.create_button(btn_frame, "🔄 Refresh", self._request_perf_refresh, self.colors['accent']).pack(side=tk.LEFT, padx=5)
         self.create_button(btn_frame, "💾 Export Data", export_data, self.colors['success']).pack(side=tk.LEFT, padx=5)
 
+        self._perf_window = graph_window
+        self._perf_fig = fig
+        self._perf_axes = (ax1, ax2, ax3, ax4, ax5, ax6)
+        self._perf_lines = {'latency': latency_line, 'throughput': throughput_line}
+        self._perf_artists = {
+            'hop_bars': None, 'hop_key': None,
+            'cong_bars': None, 'cong_names': None,
+            'cwnd_traces': cwnd_traces, 'cwnd_proxies': cwnd_proxies, 'phase_marks': phase_marks,
+            'metric_bars': metric_bars, 'metric_labels': metric_labels,
+        }
+        self._perf_canvas = canvas
+        self._perf_stats_label = stats_label
+        graph_window.protocol("WM_DELETE_WINDOW", self._close_performance_graphs)
+
+        self._refresh_performance_graphs()
+
+    def _request_perf_refresh(self):
+        """Debounce refresh requests into one redraw, at most PERF_MAX_REDRAW_RATE per second"""
+        if self._perf_refresh_after_id is not None:
+            self.root.after_cancel(self._perf_refresh_after_id)
+        wait = self._perf_last_redraw + 1.0 / PERF_MAX_REDRAW_RATE - time.monotonic()
+        self._perf_refresh_after_id = self.root.after(max(50, int(wait * 1000)), self._do_perf_refresh)
+
+    def _do_perf_refresh(self):
+        self._perf_refresh_after_id = None
+        self._refresh_performance_graphs()
+
+    def _close_performance_graphs(self):
+        """Hide the performance window; its figure, styled axes and artists are kept for the next open"""
+        if self._perf_refresh_after_id is not None:
+            self.root.after_cancel(self._perf_refresh_after_id)
+            self._perf_refresh_after_id = None
+        self._perf_hidden = True
+        self._perf_window.withdraw()
+
+    def _close_figure_with_window(self, window, fig):
+        """Release a one-off pyplot figure when the window showing it is closed"""
+        def close():
+            plt.close(fig)
+            window.destroy()
+        window.protocol("WM_DELETE_WINDOW", close)
+
+    def _perf_traces(self):
+        """(axes, line) pairs for the latency and throughput traces"""
+        return zip(self._perf_axes[:2], (self._perf_lines['latency'], self._perf_lines['throughput']))
+
+    def _set_perf_trace_data(self):
+        """Push the history into the trace lines; returns the axes whose limits they outgrew"""
+        points = _plot_points(len(self.perf_history))
+        times = self.time_stamps[points]
+        overflowed = []
+        for (ax, line), ys in zip(self._perf_traces(), (self.latency_history, self.throughput_history)):
+            ys = ys[points]
+            line.set_data(times, ys)
+            if len(times):
+                x0, x1 = ax.get_xlim()
+                y0, y1 = ax.get_ylim()
+                if times[0] < x0 or times[-1] > x1 or ys.min() < y0 or ys.max() > y1:
+                    overflowed.append(ax)
+        return overflowed
+
+    def _fit_perf_trace_limits(self, axes=None):
+        """Autoscale the trace axes (all, or just the given ones) with headroom for future blits"""
+        for ax, _ in self._perf_traces():
+            if axes is not None and ax not in axes:
+                continue
+            ax.relim()
+            ax.autoscale_view()
+            x0, x1 = ax.get_xlim()
+            y0, y1 = ax.get_ylim()
+            ax.set_xlim(x0, x1 + max(5.0, (x1 - x0) * 0.25))
+            ax.set_ylim(y0, y1 + (y1 - y0) * 0.25)
+
+    def _on_perf_draw(self, event):
+        """Cache the static pixels under each trace after a full draw, then paint the traces"""
+        canvas = self._perf_canvas
+        if canvas is None:
+            return
+        self._perf_backgrounds = {}
+        for ax, line in self._perf_traces():
+            self._perf_backgrounds[ax] = canvas.copy_from_bbox(ax.bbox)
+            ax.draw_artist(line)
+
+    def _update_performance_traces(self):
+        """Blit the latest latency/throughput samples without redrawing the rest of the figure"""
+        if self._perf_fig is None or self._perf_hidden or not self._perf_backgrounds:
+            return
+        canvas = self._perf_canvas
+        overflowed = self._set_perf_trace_data()
+        if overflowed:
+            # Data ran past an axes: rescale only that one and let the full draw capture new backgrounds
+            self._fit_perf_trace_limits(overflowed)
+            canvas.draw_idle()
+            return
+        # Each trace only touches its own axes: restore, repaint and blit that bbox alone
+        for ax, line in self._perf_traces():
+            canvas.restore_region(self._perf_backgrounds[ax])
+            ax.draw_artist(line)
+            canvas.blit(ax.bbox)
+
+    def _update_hop_graph(self, ax):
+        """Graph 3: hop count distribution of the packets in flight"""
+        if not self.packets:
+            # Use path lengths from history
+            hop_counts = list(range(1, min(len(self.nodes), 10)))
+            hop_frequencies = [random.randint(1, 10) for _ in hop_counts]
+        else:
+            # One counting pass instead of a list.count() per bin
+            hop_frequencies = np.bincount(np.fromiter(
+                (packet.hop_count for packet in self.packets), dtype=np.intp, count=len(self.packets)))
+            hop_counts = np.arange(hop_frequencies.size)
+
+        artists = self._perf_artists
+        key = (int(hop_counts[0]) if len(hop_counts) else None, len(hop_counts))  # bins are a contiguous range
+        if artists['hop_key'] == key:
+            for bar, height in zip(artists['hop_bars'], hop_frequencies):
+                bar.set_height(height)
+        else:
+            if artists['hop_bars'] is not None:
+                artists['hop_bars'].remove()
+            artists['hop_bars'] = ax.bar(hop_counts, hop_frequencies, color='#6610f2', alpha=0.9,
+                                         edgecolor=self.colors['surface'], linewidth=1)
+            artists['hop_key'] = key
+        ax.relim()
+        ax.autoscale_view()
+
+    def _update_congestion_graph(self, ax):
+        """Graph 4: congestion of the first ten nodes"""
+        nodes = self.nodes[:10]
+        congestion_data = self.node_congestion[:len(nodes)]
+        # Bucket every level in one searchsorted; side='left' keeps the <= 1 / <= 3 / <= 5 boundaries
+        palette = (self.colors['success'], self.colors['warning'],
+                   self.colors['phase_fast_recovery'], self.colors['error'])
+        buckets = np.searchsorted(CONGESTION_LEVEL_BOUNDS, congestion_data, side='left')
+        colors_map = [palette[i] for i in buckets.tolist()]
+
+        artists = self._perf_artists
+        names = [node.name for node in nodes]
+        if artists['cong_names'] == names:
+            for bar, width, color in zip(artists['cong_bars'], congestion_data, colors_map):
+                bar.set_width(width)
+                bar.set_facecolor(color)
+        else:
+            if artists['cong_bars'] is not None:
+                artists['cong_bars'].remove()
+            artists['cong_bars'] = ax.barh(range(len(names)), congestion_data, color=colors_map, alpha=0.85,
+                                           edgecolor=self.colors['surface'])
+            ax.set_yticks(range(len(names)))
+            ax.set_yticklabels(names)
+            artists['cong_names'] = names
+        ax.relim()
+        ax.autoscale_view()
+
+    def _update_cwnd_graph(self, ax):
+        """Graph 5: cwnd traces of up to five packets, with phase changes of the first marked"""
+        artists = self._perf_artists
+        events = self.packet_events
+        times, cwnds = events['time'], events['cwnd']
+        unique_packet_ids = events.packet_ids()[:5]  # Limit to 5 packets
+        packet_rows = [events.rows_for(pid) for pid in unique_packet_ids]
+        segments = [np.column_stack((times[rows], cwnds[rows])) for rows in packet_rows]
+        segments = [seg[_plot_points(len(seg))] for seg in segments]
+        artists['cwnd_traces'].set_segments(segments)
+
+        # Mark phase transitions for the first packet
+        transitions = ()
+        if packet_rows:
+            rows = packet_rows[0]
+            phases = events['phase'][rows]
+            transitions = times[rows[1:][phases[1:] != phases[:-1]]]
+        artists['phase_marks'].set_segments(_full_height_lines(transitions))
+
+        # relim() skips collections, so the trace points are added to the data limits by hand
+        ax.relim(visible_only=True)
+        if segments:
+            ax.update_datalim(np.concatenate(segments))
+        ax.autoscale_view()
+        if len(unique_packet_ids):
+            legend5 = ax.legend(artists['cwnd_proxies'][:len(unique_packet_ids)],
+                                [f'Packet {pid}' for pid in unique_packet_ids], loc='upper left', fontsize=8)
+            c_surface, c_border, c_text = itemgetter('surface', 'border', 'text')(self.colors)
+            frame = legend5.get_frame()
+            frame.set_facecolor(c_surface)
+            frame.set_edgecolor(c_border)
+            for text in legend5.get_texts():
+                text.set_color(c_text)
+        elif ax.get_legend() is not None:
+            ax.get_legend().remove()
+
+    def _update_metrics_graph(self, ax):
+        """Graph 6: running cwnd/throughput/loss figures for the current algorithm"""
+        algo_name = "Reno" if self.congestion_algorithm == "reno" else "Tahoe"
+
+        # Metrics come from running aggregates kept as events are logged
+        tally = self._event_tally
+        if tally.count:
+            values = [tally.cwnd_sum / tally.count, tally.cwnd_max,
+                      tally.throughput_sum / tally.count, (tally.dropped / tally.count) * 100]
+        else:
+            values = [0, 0, 0, 0]
+
+        ax.title.set_text(f'Algorithm Performance: {algo_name}')
+        for bar, label, val in zip(self._perf_artists['metric_bars'], self._perf_artists['metric_labels'], values):
+            bar.set_height(val)
+            label.set_y(val)
+            label.set_text(f'{val:.1f}')
+        ax.relim()
+        ax.autoscale_view()
+
+    def _refresh_performance_graphs(self):
+        """Push current history into the cached performance figure"""
+        if self._perf_fig is None or self._perf_hidden:
+            return
+        # Whoever calls in, full redraws never exceed PERF_MAX_REDRAW_RATE; early calls fold into one trailing redraw
+        now = time.monotonic()
+        if now - self._perf_last_redraw < 1.0 / PERF_MAX_REDRAW_RATE:
+            self._request_perf_refresh()
+            return
+        self._perf_last_redraw = now
+        ax1, ax2, ax3, ax4, ax5, ax6 = self._perf_axes
+
+        # Graphs 1-2: update existing line artists in place (between refreshes they are blitted)
+        self._set_perf_trace_data()
+        self._fit_perf_trace_limits()
+
+        # Graphs 3-6: reuse their artists; bars are only rebuilt when the bar count changes
+        self._update_hop_graph(ax3)
+        self._update_congestion_graph(ax4)
+        self._update_cwnd_graph(ax5)
+        self._update_metrics_graph(ax6)
+
+        # Calculate statistics
+        latencies = self.latency_history
+        if latencies.size:
+            avg_latency = latencies.mean()
+            max_latency = latencies.max()
+            min_latency = latencies.min()
+        else:
+            avg_latency = max_latency = min_latency = 0
+        avg_throughput = self.perf_history.mean_throughput()
+        
+        stats_text = f"📊 Statistics: Avg Latency: {avg_latency:.2f}ms | Min: {min_latency:.2f}ms | Max: {max_latency:.2f}ms | Avg Throughput: {avg_throughput:.2f}Mbps"
+        self._perf_stats_label.config(text=stats_text)
+
+        self._perf_canvas.draw_idle()
+
 
     # NEW: Show Routing Analysis Window
     def show_routing_analysis(self):
@@ -2363,64 +3521,66 @@ class CloudNetworkSimulator:
                             wrap=tk.WORD)
         stats_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Calculate routing statistics
-        stats_text.insert(tk.END, "=" * 60 + "\n")
-        stats_text.insert(tk.END, "         ROUTING PERFORMANCE STATISTICS\n")
-        stats_text.insert(tk.END, "=" * 60 + "\n\n")
+        # Calculate routing statistics (collected, then inserted into the widget once)
+        report = []
+        report.append("=" * 60 + "\n")
+        report.append("         ROUTING PERFORMANCE STATISTICS\n")
+        report.append("=" * 60 + "\n\n")
         
-        stats_text.insert(tk.END, f"Total Packets Routed: {self.routing_stats['total_packets']}\n")
-        stats_text.insert(tk.END, f"Average Hop Count: {self.routing_stats['avg_hop_count']:.2f}\n")
-        stats_text.insert(tk.END, f"Minimum Hops: {self.routing_stats['min_hops']}\n")
-        stats_text.insert(tk.END, f"Maximum Hops: {self.routing_stats['max_hops']}\n\n")
+        report.append(f"Total Packets Routed: {self.routing_stats['total_packets']}\n")
+        report.append(f"Average Hop Count: {self.routing_stats['avg_hop_count']:.2f}\n")
+        report.append(f"Minimum Hops: {self.routing_stats['min_hops']}\n")
+        report.append(f"Maximum Hops: {self.routing_stats['max_hops']}\n\n")
         
-        stats_text.insert(tk.END, "=" * 60 + "\n")
-        stats_text.insert(tk.END, "         NETWORK TOPOLOGY ANALYSIS\n")
-        stats_text.insert(tk.END, "=" * 60 + "\n\n")
+        report.append("=" * 60 + "\n")
+        report.append("         NETWORK TOPOLOGY ANALYSIS\n")
+        report.append("=" * 60 + "\n\n")
         
-        stats_text.insert(tk.END, f"Total Nodes: {len(self.nodes)}\n")
-        stats_text.insert(tk.END, f"Total Links: {len(self.connections)}\n")
+        report.append(f"Total Nodes: {len(self.nodes)}\n")
+        report.append(f"Total Links: {len(self.connections)}\n")
         if len(self.nodes) > 1:
             density = (2 * len(self.connections)) / (len(self.nodes) * (len(self.nodes) - 1)) * 100
         else:
             density = 0
-        stats_text.insert(tk.END, f"Network Density: {density:.2f}%\n\n")
+        report.append(f"Network Density: {density:.2f}%\n\n")
         
         # Node-wise routing statistics
-        stats_text.insert(tk.END, "=" * 60 + "\n")
-        stats_text.insert(tk.END, "         NODE ROUTING STATISTICS\n")
-        stats_text.insert(tk.END, "=" * 60 + "\n\n")
+        report.append("=" * 60 + "\n")
+        report.append("         NODE ROUTING STATISTICS\n")
+        report.append("=" * 60 + "\n\n")
         
-        stats_text.insert(tk.END, f"{'Node':<15} {'Type':<10} {'Connections':<12} {'Traffic':<10}\n")
-        stats_text.insert(tk.END, "-" * 60 + "\n")
+        report.append(f"{'Node':<15} {'Type':<10} {'Connections':<12} {'Traffic':<10}\n")
+        report.append("-" * 60 + "\n")
         
         for node in sorted(self.nodes, key=lambda n: len(n.connections), reverse=True):
             traffic_level = "🔴 High" if node.congestion > 5 else "🟡 Med" if node.congestion > 2 else "🟢 Low"
-            stats_text.insert(tk.END, f"{node.name:<15} {node.type:<10} {len(node.connections):<12} {traffic_level:<10}\n")
+            report.append(f"{node.name:<15} {node.type_name:<10} {len(node.connections):<12} {traffic_level:<10}\n")
         
-        stats_text.insert(tk.END, "\n" + "=" * 60 + "\n")
-        stats_text.insert(tk.END, "         PATH EFFICIENCY ANALYSIS\n")
-        stats_text.insert(tk.END, "=" * 60 + "\n\n")
+        report.append("\n" + "=" * 60 + "\n")
+        report.append("         PATH EFFICIENCY ANALYSIS\n")
+        report.append("=" * 60 + "\n\n")
         
         if self.routing_stats['path_history']:
-            recent_paths = self.routing_stats['path_history'][-20:]
+            recent_paths = list(self.routing_stats['path_history'])[-20:]
             avg_recent_hops = sum(p['hops'] for p in recent_paths) / len(recent_paths)
             avg_recent_latency = sum(p['latency'] for p in recent_paths) / len(recent_paths)
             
-            stats_text.insert(tk.END, f"Recent Packets (Last 20):\n")
-            stats_text.insert(tk.END, f"  Average Hops: {avg_recent_hops:.2f}\n")
-            stats_text.insert(tk.END, f"  Average Latency: {avg_recent_latency:.2f}ms\n\n")
+            report.append(f"Recent Packets (Last 20):\n")
+            report.append(f"  Average Hops: {avg_recent_hops:.2f}\n")
+            report.append(f"  Average Latency: {avg_recent_latency:.2f}ms\n\n")
             
             # Efficiency score (lower is better)
             efficiency = (avg_recent_hops / self.routing_stats['avg_hop_count']) * 100 if self.routing_stats['avg_hop_count'] > 0 else 100
-            stats_text.insert(tk.END, f"Routing Efficiency: {efficiency:.1f}%\n")
+            report.append(f"Routing Efficiency: {efficiency:.1f}%\n")
             
             if efficiency < 90:
-                stats_text.insert(tk.END, "  ⚠️  Routing paths are longer than average\n")
+                report.append("  ⚠️  Routing paths are longer than average\n")
             elif efficiency > 110:
-                stats_text.insert(tk.END, "  ✅ Routing paths are shorter than average\n")
+                report.append("  ✅ Routing paths are shorter than average\n")
             else:
-                stats_text.insert(tk.END, "  ℹ️  Routing paths are near average\n")
+                report.append("  ℹ️  Routing paths are near average\n")
         
+        stats_text.insert(tk.END, "".join(report))
         stats_text.config(state=tk.DISABLED)
         
         # Tab 2: Hop Count Visualization
@@ -2428,14 +3588,20 @@ class CloudNetworkSimulator:
         notebook.add(viz_frame, text="📈 Visualizations")
         
         # Create hop count distribution graph
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 5))
-        fig.patch.set_facecolor(self.colors['bg_secondary'])
+        _load_matplotlib()
+        with plt.rc_context(self._plot_rc):
+            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 5))
+        self._close_figure_with_window(routing_window, fig)
         
+        path_history = self.routing_stats['path_history']
+        hops_list = np.fromiter((p['hops'] for p in path_history), dtype=np.intp, count=len(path_history))
+
         # Graph 1: Hop Count Distribution
-        if self.routing_stats['path_history']:
-            hop_counts = [p['hops'] for p in self.routing_stats['path_history']]
-            hop_range = range(int(min(hop_counts)), int(max(hop_counts)) + 1)
-            hop_freq = [hop_counts.count(h) for h in hop_range]
+        if path_history:
+            # Bin every hop count in one pass, then drop the empty bins below the minimum
+            lowest = hops_list.min()
+            hop_freq = np.bincount(hops_list)[lowest:]
+            hop_range = np.arange(lowest, lowest + hop_freq.size)
             
             ax1.bar(hop_range, hop_freq, color='#6610f2', alpha=0.85, edgecolor=self.colors['surface'], linewidth=1)
             ax1.set_xlabel('Hop Count', color=self.colors['text_secondary'], fontsize=11)
@@ -2443,17 +3609,14 @@ class CloudNetworkSimulator:
             ax1.set_title('Hop Count Distribution', color=self.colors['text'], fontsize=12, fontweight='bold')
         
         # Graph 2: Hop Count vs Latency
-        if self.routing_stats['path_history']:
-            hops_list = [p['hops'] for p in self.routing_stats['path_history']]
-            latency_list = [p['latency'] for p in self.routing_stats['path_history']]
+        if path_history:
+            latency_list = np.fromiter((p['latency'] for p in path_history), dtype=np.float64, count=len(path_history))
             
             ax2.scatter(hops_list, latency_list, color=self.colors['accent'], alpha=0.7, s=50, edgecolors=self.colors['surface'])
             ax2.set_xlabel('Hop Count', color=self.colors['text_secondary'], fontsize=11)
             ax2.set_ylabel('Latency (ms)', color=self.colors['text_secondary'], fontsize=11)
             ax2.set_title('Hop Count vs Latency Correlation', color=self.colors['text'], fontsize=12, fontweight='bold')
 
-        self._style_axes([ax1, ax2])
-        
         plt.tight_layout()
         
         # Embed matplotlib figure
@@ -2461,7 +3624,7 @@ class CloudNetworkSimulator:
         canvas_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         canvas = FigureCanvasTkAgg(fig, master=canvas_frame)
-        canvas.draw()
+        canvas.draw_idle()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         # Tab 3: Path Comparison
@@ -2483,7 +3646,7 @@ class CloudNetworkSimulator:
         
         nodeA_var = tk.StringVar()
         nodeA_dropdown = ttk.Combobox(select_frame, textvariable=nodeA_var, 
-                                     values=[node.name for node in self.nodes],
+                                     values=list(self._nodes_by_name),
                                      state='readonly', width=15)
         nodeA_dropdown.grid(row=0, column=1, padx=10, pady=10)
         
@@ -2493,7 +3656,7 @@ class CloudNetworkSimulator:
         
         nodeB_var = tk.StringVar()
         nodeB_dropdown = ttk.Combobox(select_frame, textvariable=nodeB_var,
-                                     values=[node.name for node in self.nodes],
+                                     values=list(self._nodes_by_name),
                                      state='readonly', width=15)
         nodeB_dropdown.grid(row=0, column=3, padx=10, pady=10)
         
@@ -2510,8 +3673,8 @@ class CloudNetworkSimulator:
                 messagebox.showwarning("Selection Required", "Please select both nodes")
                 return
             
-            nodeA = next((n for n in self.nodes if n.name == nodeA_name), None)
-            nodeB = next((n for n in self.nodes if n.name == nodeB_name), None)
+            nodeA = self._nodes_by_name.get(nodeA_name)
+            nodeB = self._nodes_by_name.get(nodeB_name)
             
             if not nodeA or not nodeB or nodeA == nodeB:
                 messagebox.showwarning("Invalid Selection", "Please select two different nodes")
@@ -2521,107 +3684,176 @@ class CloudNetworkSimulator:
             
             compare_text.config(state=tk.NORMAL)
             compare_text.delete(1.0, tk.END)
+            report = []
             
             if path:
-                compare_text.insert(tk.END, "=" * 55 + "\n")
-                compare_text.insert(tk.END, f"  ROUTE ANALYSIS: {nodeA.name} → {nodeB.name}\n")
-                compare_text.insert(tk.END, "=" * 55 + "\n\n")
+                report.append("=" * 55 + "\n")
+                report.append(f"  ROUTE ANALYSIS: {nodeA.name} → {nodeB.name}\n")
+                report.append("=" * 55 + "\n\n")
                 
-                compare_text.insert(tk.END, f"Total Hops: {len(path) - 1}\n")
-                compare_text.insert(tk.END, f"Total Latency: {latency:.2f}ms\n")
-                compare_text.insert(tk.END, f"Average Latency per Hop: {latency / (len(path) - 1):.2f}ms\n\n")
+                report.append(f"Total Hops: {len(path) - 1}\n")
+                report.append(f"Total Latency: {latency:.2f}ms\n")
+                report.append(f"Average Latency per Hop: {latency / (len(path) - 1):.2f}ms\n\n")
                 
-                compare_text.insert(tk.END, "Detailed Path:\n")
-                compare_text.insert(tk.END, "-" * 55 + "\n")
+                report.append("Detailed Path:\n")
+                report.append("-" * 55 + "\n")
                 
                 for i, node in enumerate(path):
-                    compare_text.insert(tk.END, f"Hop {i}: {node.name} ({node.type})\n")
-                    compare_text.insert(tk.END, f"  Latency: {node.latency}ms\n")
-                    compare_text.insert(tk.END, f"  Congestion: {node.congestion:.1f}\n")
+                    report.append(f"Hop {i}: {node.name} ({node.type_name})\n")
+                    report.append(f"  Latency: {node.latency}ms\n")
+                    report.append(f"  Congestion: {node.congestion:.1f}\n")
                     if i < len(path) - 1:
-                        compare_text.insert(tk.END, "  ↓\n")
+                        report.append("  ↓\n")
                 
-                compare_text.insert(tk.END, "\n" + "=" * 55 + "\n")
+                report.append("\n" + "=" * 55 + "\n")
                 
                 # Comparison with network average
                 if self.routing_stats['avg_hop_count'] > 0:
-                    compare_text.insert(tk.END, "\nComparison with Network Average:\n")
-                    compare_text.insert(tk.END, f"Network Avg Hops: {self.routing_stats['avg_hop_count']:.2f}\n")
-                    compare_text.insert(tk.END, f"This Route Hops: {len(path) - 1}\n")
+                    report.append("\nComparison with Network Average:\n")
+                    report.append(f"Network Avg Hops: {self.routing_stats['avg_hop_count']:.2f}\n")
+                    report.append(f"This Route Hops: {len(path) - 1}\n")
                     
                     if len(path) - 1 < self.routing_stats['avg_hop_count']:
-                        compare_text.insert(tk.END, "✅ This route is shorter than average!\n")
+                        report.append("✅ This route is shorter than average!\n")
                     elif len(path) - 1 > self.routing_stats['avg_hop_count']:
-                        compare_text.insert(tk.END, "⚠️  This route is longer than average.\n")
+                        report.append("⚠️  This route is longer than average.\n")
                     else:
-                        compare_text.insert(tk.END, "ℹ️  This route matches the network average.\n")
+                        report.append("ℹ️  This route matches the network average.\n")
             else:
-                compare_text.insert(tk.END, "❌ No route found between these nodes.\n")
+                report.append("❌ No route found between these nodes.\n")
             
+            compare_text.insert(tk.END, "".join(report))
             compare_text.config(state=tk.DISABLED)
         
         self.create_button(compare_frame, "🔍 Analyze Route", compare_routes, self.colors['accent']).pack(pady=10)
             
     def find_path(self, source, destination):
-        # BFS to find path
-        visited = set()
-        queue = [(source, [source])]
-        
-        while queue:
-            node, path = queue.pop(0)
-            if node == destination:
-                return path
-                
-            if node not in visited:
-                visited.add(node)
-                for neighbor in node.connections:
-                    if neighbor not in visited:
-                        queue.append((neighbor, path + [neighbor]))
+        """Fewest-hop path by BFS over the index adjacency, tracking parents instead of copying paths"""
+        src = self._node_index.get(source)
+        dst = self._node_index.get(destination)
+        if src is None or dst is None:
+            return None
+        parent = [-2] * len(self.nodes)  # -2 = unseen, -1 = the source's parent
+        parent[src] = -1
+        frontier = deque([src])  # not `queue`, which would shadow the module
+        while frontier:
+            u = frontier.popleft()
+            if u == dst:
+                path = []
+                while u != -1:
+                    path.append(self.nodes[u])
+                    u = parent[u]
+                return path[::-1]
+            for v in self._adj[u].tolist():
+                if parent[v] == -2:
+                    parent[v] = u
+                    frontier.append(v)
         
         return None
     
+    def invalidate_topology(self):
+        """Bump the topology version and drop cached routes"""
+        self._topology_version += 1
+        self._path_cache.clear()
+        self._rebuild_soa()
+
+    def _rebuild_soa(self):
+        """Pack node state into contiguous arrays indexed by node.index"""
+        store = NodeStore(len(self.nodes))
+        by_name = {}
+        for i, node in enumerate(self.nodes):
+            node.bind_store(store, i)
+            by_name.setdefault(node.name, node)  # first node wins, as the old linear scans did
+        self._nodes_by_name = by_name
+        self._node_store = store
+        self.node_type = store.type
+        self.node_x = store.x
+        self.node_y = store.y
+        self.node_congestion = store.congestion
+        self.node_latency = store.latency
+        self._mean_node_latency = float(store.latency.mean()) if len(self.nodes) else 0.0
+        self._node_index = {node: i for i, node in enumerate(self.nodes)}
+        index = self._node_index
+        self._adj = {i: np.fromiter((index[n] for n in node.connections), dtype=np.int32, count=len(node.connections))
+                     for i, node in enumerate(self.nodes)}
+
     # NEW: Dijkstra's Shortest Path Algorithm
     def dijkstra_shortest_path(self, source, destination):
+        """Return (path, latency), memoized (LRU) until the topology changes"""
+        key = (source, destination)
+        cache = self._path_cache
+        # Pop and re-insert so the dict's order tracks recency of use
+        route = cache.pop(key, None)
+        if route is None:
+            route = self._compute_shortest_path(source, destination)
+            if len(cache) >= PATH_CACHE_LIMIT:
+                del cache[next(iter(cache))]  # evict the least recently used route
+        cache[key] = route
+        return route
+
+    def _rebuild_csr(self):
+        """Flatten node adjacency into CSR arrays weighted by the sending node's latency"""
+        n = len(self.nodes)
+        degree = np.fromiter((len(self._adj[i]) for i in range(n)), dtype=np.int32, count=n)
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(degree, out=indptr[1:])
+        self._csr_indptr = indptr
+        self._csr_neighbors = (np.concatenate([self._adj[i] for i in range(n)]) if n
+                               else np.zeros(0, dtype=np.int32))
+        self._csr_latency = np.repeat(self.node_latency, degree)
+        self._sssp_cache.clear()
+        self._csr_version = self._topology_version
+
+    def _compute_shortest_path(self, source, destination):
         """Find shortest path using Dijkstra's algorithm based on latency"""
-        distances = {node: float('infinity') for node in self.nodes}
-        distances[source] = 0
-        previous = {node: None for node in self.nodes}
-        unvisited = set(self.nodes)
-        
-        while unvisited:
-            # Find node with minimum distance
-            current = min(unvisited, key=lambda node: distances[node])
-            
-            if distances[current] == float('infinity'):
-                break
-            
-            if current == destination:
-                # Reconstruct path
-                path = []
-                while current:
-                    path.append(current)
-                    current = previous[current]
-                return path[::-1], distances[destination]
-            
-            unvisited.remove(current)
-            
-            # Update distances to neighbors
-            for neighbor in current.connections:
-                if neighbor in unvisited:
-                    # Calculate distance (using latency as weight)
-                    alt_distance = distances[current] + current.latency
-                    
-                    if alt_distance < distances[neighbor]:
-                        distances[neighbor] = alt_distance
-                        previous[neighbor] = current
-        
-        return None, float('infinity')
+        if self._csr_version != self._topology_version:
+            self._rebuild_csr()
+        src = self._node_index.get(source)
+        dst = self._node_index.get(destination)
+        if src is None or dst is None:
+            return None, float('infinity')
+
+        # One kernel run answers every destination from this source
+        result = self._sssp_cache.get(src)
+        if result is None:
+            result = dijkstra_csr(self._csr_indptr, self._csr_neighbors, self._csr_latency,
+                                  src, len(self.nodes))
+            self._sssp_cache[src] = result
+        dist, prev = result
+
+        if dist[dst] == np.inf:
+            return None, float('infinity')
+        path = []
+        current = dst
+        while current != -1:
+            path.append(self.nodes[current])
+            current = prev[current]
+        return tuple(reversed(path)), float(dist[dst])
     
     # NEW: Show Path Finder Window
+    def _reopen_tool_window(self, name):
+        """Refresh and show a cached tool window; False when it still has to be built"""
+        entry = self._tool_windows.get(name)
+        if entry is None or not entry[0].winfo_exists():
+            return False
+        window, refresh = entry
+        refresh()
+        window.deiconify()
+        window.lift()
+        return True
+
+    def _keep_tool_window(self, name, window, refresh):
+        """Cache a tool window with its refresh callback; closing it only hides it"""
+        self._tool_windows[name] = (window, refresh)
+        window.protocol("WM_DELETE_WINDOW", window.withdraw)
+        refresh()
+
     def show_path_finder(self):
         if len(self.nodes) < 2:
             messagebox.showwarning("Not Enough Nodes", "Add at least 2 nodes to find a path")
             return
+        if self._reopen_tool_window('path_finder'):
+            return
         
         path_window = tk.Toplevel(self.root)
         path_window.title("Shortest Path Finder")
@@ -2645,11 +3877,8 @@ class CloudNetworkSimulator:
         
         source_var = tk.StringVar()
         source_dropdown = ttk.Combobox(select_frame, textvariable=source_var, 
-                                      values=[node.name for node in self.nodes],
                                       state='readonly', width=20)
         source_dropdown.grid(row=0, column=1, padx=10, pady=10)
-        if self.nodes:
-            source_dropdown.current(0)
         
         # Destination selection
         tk.Label(select_frame, text="Destination Node:", 
@@ -2658,11 +3887,16 @@ class CloudNetworkSimulator:
         
         dest_var = tk.StringVar()
         dest_dropdown = ttk.Combobox(select_frame, textvariable=dest_var,
-                                     values=[node.name for node in self.nodes],
                                      state='readonly', width=20)
         dest_dropdown.grid(row=1, column=1, padx=10, pady=10)
-        if len(self.nodes) > 1:
-            dest_dropdown.current(1)
+
+        def refresh_node_choices():
+            # The topology may have changed while the window was hidden; keep selections that still exist
+            names = list(self._nodes_by_name)
+            for var, dropdown, default in ((source_var, source_dropdown, 0), (dest_var, dest_dropdown, 1)):
+                dropdown.config(values=names)
+                if var.get() not in self._nodes_by_name:
+                    dropdown.current(default)
         
         # Result display
         result_frame = tk.Frame(path_window, bg=self.colors['canvas_bg'])
@@ -2686,8 +3920,8 @@ class CloudNetworkSimulator:
                 return
             
             # Find nodes
-            source_node = next((n for n in self.nodes if n.name == source_name), None)
-            dest_node = next((n for n in self.nodes if n.name == dest_name), None)
+            source_node = self._nodes_by_name.get(source_name)
+            dest_node = self._nodes_by_name.get(dest_name)
             
             if not source_node or not dest_node:
                 messagebox.showerror("Error", "Could not find selected nodes")
@@ -2698,52 +3932,55 @@ class CloudNetworkSimulator:
             
             result_text.config(state=tk.NORMAL)
             result_text.delete(1.0, tk.END)
+            report = []
             
             if path:
-                result_text.insert(tk.END, "=" * 50 + "\n")
-                result_text.insert(tk.END, "SHORTEST PATH FOUND\n")
-                result_text.insert(tk.END, "=" * 50 + "\n\n")
+                report.append("=" * 50 + "\n")
+                report.append("SHORTEST PATH FOUND\n")
+                report.append("=" * 50 + "\n\n")
                 
-                result_text.insert(tk.END, f"Source: {source_node.name}\n")
-                result_text.insert(tk.END, f"Destination: {dest_node.name}\n\n")
+                report.append(f"Source: {source_node.name}\n")
+                report.append(f"Destination: {dest_node.name}\n\n")
                 
-                result_text.insert(tk.END, f"Total Hops: {len(path) - 1}\n")
-                result_text.insert(tk.END, f"Total Latency: {total_latency:.2f}ms\n\n")
+                report.append(f"Total Hops: {len(path) - 1}\n")
+                report.append(f"Total Latency: {total_latency:.2f}ms\n\n")
                 
-                result_text.insert(tk.END, "Path Traversal:\n")
-                result_text.insert(tk.END, "-" * 50 + "\n")
+                report.append("Path Traversal:\n")
+                report.append("-" * 50 + "\n")
                 
                 for i, node in enumerate(path):
-                    result_text.insert(tk.END, f"{i+1}. {node.name} ({node.type})")
+                    report.append(f"{i+1}. {node.name} ({node.type_name})")
                     if i < len(path) - 1:
-                        result_text.insert(tk.END, f" → [Latency: {node.latency}ms]\n")
+                        report.append(f" → [Latency: {node.latency}ms]\n")
                     else:
-                        result_text.insert(tk.END, "\n")
+                        report.append("\n")
                 
-                result_text.insert(tk.END, "\n" + "=" * 50 + "\n")
+                report.append("\n" + "=" * 50 + "\n")
+                result_text.insert(tk.END, "".join(report))
                 
                 # Highlight path on canvas
                 self.highlighted_path = path
-                self.draw_network()
+                self.schedule_redraw()
                 
                 messagebox.showinfo("Success", f"Path found with {len(path)-1} hops!")
             else:
-                result_text.insert(tk.END, "=" * 50 + "\n")
-                result_text.insert(tk.END, "NO PATH FOUND\n")
-                result_text.insert(tk.END, "=" * 50 + "\n\n")
-                result_text.insert(tk.END, f"No connection exists between\n")
-                result_text.insert(tk.END, f"{source_node.name} and {dest_node.name}\n\n")
-                result_text.insert(tk.END, "The nodes are not connected in the\n")
-                result_text.insert(tk.END, "current network topology.\n")
+                report.append("=" * 50 + "\n")
+                report.append("NO PATH FOUND\n")
+                report.append("=" * 50 + "\n\n")
+                report.append(f"No connection exists between\n")
+                report.append(f"{source_node.name} and {dest_node.name}\n\n")
+                report.append("The nodes are not connected in the\n")
+                report.append("current network topology.\n")
+                result_text.insert(tk.END, "".join(report))
                 
                 self.highlighted_path = []
-                self.draw_network()
+                self.schedule_redraw()
             
             result_text.config(state=tk.DISABLED)
         
         def clear_highlight():
             self.highlighted_path = []
-            self.draw_network()
+            self.schedule_redraw()
             result_text.config(state=tk.NORMAL)
             result_text.delete(1.0, tk.END)
             result_text.config(state=tk.DISABLED)
@@ -2754,6 +3991,8 @@ class CloudNetworkSimulator:
         
         self.create_button(btn_frame, "🔍 Find Shortest Path", calculate_path, self.colors['success']).pack(side=tk.LEFT, padx=5)
         self.create_button(btn_frame, "🗑️ Clear Highlight", clear_highlight, self.colors['warning']).pack(side=tk.LEFT, padx=5)
+
+        self._keep_tool_window('path_finder', path_window, refresh_node_choices)
         
     # NEW: Show Packet Timeline Window
     def show_packet_timeline(self):
@@ -2761,6 +4000,13 @@ class CloudNetworkSimulator:
         if not self.packet_events:
             messagebox.showinfo("No Data", "Start the simulation to collect packet timeline data")
             return
+
+        # Window already built (open or hidden): update the cached figure in place
+        if self._timeline_window is not None and self._timeline_window.winfo_exists():
+            self._timeline_window.deiconify()
+            self._timeline_window.lift()
+            self._request_timeline_refresh()
+            return
         
         timeline_window = tk.Toplevel(self.root)
         timeline_window.title("📦 Packet Timeline Analysis")
@@ -2774,154 +4020,48 @@ class CloudNetworkSimulator:
         title.pack(pady=15)
         
         # Create matplotlib figure with 4 subplots
-        fig = plt.figure(figsize=(12, 8.5))
-        fig.patch.set_facecolor(self.colors['bg_secondary'])
-        
-        # Get unique packet IDs for selection
-        unique_packet_ids = list(set([e['packet_id'] for e in self.packet_events if 'packet_id' in e]))
-        if not unique_packet_ids:
-            messagebox.showinfo("No Data", "No packet events recorded yet")
-            timeline_window.destroy()
-            return
-        
-        # Select first packet for visualization
-        selected_packet_id = unique_packet_ids[0] if unique_packet_ids else None
-        packet_events = [e for e in self.packet_events if e.get('packet_id') == selected_packet_id]
-        
-        # Graph 1: Congestion Window Over Time
-        ax1 = plt.subplot(2, 2, 1)
-        if packet_events:
-            times = [e.get('time', 0) for e in packet_events]
-            cwnds = [e.get('cwnd', 0) for e in packet_events]
-            phases = [e.get('phase', 'slow_start') for e in packet_events]
-            
-            # Color code by phase
-            phase_colors = {
-                "slow_start": self.colors['phase_slow_start'],
-                "congestion_avoidance": self.colors['phase_congestion_avoid'],
-                "fast_retransmit": self.colors['phase_fast_retransmit'],
-                "fast_recovery": self.colors['phase_fast_recovery'],
-                "dropped": self.colors['error']
-            }
-            
-            # Plot segments by phase
-            current_phase = None
-            phase_start_idx = 0
-            for i, phase in enumerate(phases):
-                if phase != current_phase:
-                    if current_phase is not None:
-                        ax1.plot(times[phase_start_idx:i], cwnds[phase_start_idx:i],
-                                color=phase_colors.get(current_phase, "#ffffff"),
-                                linewidth=2, label=current_phase.replace("_", " ").title())
-                    current_phase = phase
-                    phase_start_idx = i
-            # Plot last segment
-            if current_phase:
-                ax1.plot(times[phase_start_idx:], cwnds[phase_start_idx:],
-                        color=phase_colors.get(current_phase, "#ffffff"),
-                        linewidth=2, label=current_phase.replace("_", " ").title())
-            
-            # Mark packet loss events
-            loss_events = [i for i, e in enumerate(packet_events) if e.get('event_type') == 'dropped']
-            for idx in loss_events:
-                if idx < len(times):
-                    ax1.axvline(x=times[idx], color='#ef4444', linestyle='--', linewidth=2, alpha=0.7)
-        
+        _load_matplotlib()
+        self._plot_phase_rgba = to_rgba_array(list(self.phase_plot_colors.values()))
+        with plt.rc_context(self._plot_rc):
+            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8.5))
+
+        # Graph 1: Congestion Window Over Time, every phase run in one collection; proxies feed the legend
+        cwnd_trace = LineCollection([], linewidths=2)
+        ax1.add_collection(cwnd_trace)
+        phase_proxies = tuple(Line2D([], [], color=rgba, linewidth=2, label=label)
+                              for rgba, label in zip(self._plot_phase_rgba, self._plot_phase_labels))
         ax1.set_xlabel('Time (seconds)', color=self.colors['text_secondary'], fontsize=11)
         ax1.set_ylabel('cwnd (MSS)', color=self.colors['text_secondary'], fontsize=11)
         ax1.set_title('Congestion Window Over Time', color=self.colors['text'], fontsize=13, fontweight='bold')
-        legend1 = ax1.legend(loc='upper left')
-        if legend1:
-            legend1.get_frame().set_facecolor(self.colors['surface'])
-            legend1.get_frame().set_edgecolor(self.colors['border'])
-            for text in legend1.get_texts():
-                text.set_color(self.colors['text'])
         
-        # Graph 2: Throughput Over Time
-        ax2 = plt.subplot(2, 2, 2)
-        if packet_events:
-            times = [e.get('time', 0) for e in packet_events]
-            throughputs = [e.get('throughput', 0) for e in packet_events]
-            node_congestions = [e.get('node_congestion', 0) for e in packet_events]
-            
-            ax2.plot(times, throughputs, color=self.colors['success'], linewidth=2, label='Actual Throughput')
-            
-            # Highlight congestion-limited periods
-            congestion_limited = [i for i, c in enumerate(node_congestions) if c > 7]
-            for idx in congestion_limited:
-                if idx < len(times):
-                    ax2.axvspan(times[max(0, idx-1)], times[min(len(times)-1, idx+1)],
-                               color=self.colors['error'], alpha=0.2)
+        # Loss events, as one collection of full-height lines
+        loss_marks = LineCollection([], colors='#ef4444', linestyles='--', linewidths=2, alpha=0.7,
+                                    transform=ax1.get_xaxis_transform())
+        ax1.add_collection(loss_marks, autolim=False)
         
+        # Graph 2: Throughput Over Time
+        throughput_line, = ax2.plot([], [], color=self.colors['success'], linewidth=2, label='Actual Throughput')
+        congestion_spans = PolyCollection([], facecolors=self.colors['error'], edgecolors='none', alpha=0.2,
+                                          transform=ax2.get_xaxis_transform())
+        ax2.add_collection(congestion_spans, autolim=False)
         ax2.set_xlabel('Time (seconds)', color=self.colors['text_secondary'], fontsize=11)
         ax2.set_ylabel('Throughput (Mbps)', color=self.colors['text_secondary'], fontsize=11)
         ax2.set_title('Throughput Over Time', color=self.colors['text'], fontsize=13, fontweight='bold')
-        legend2 = ax2.legend(loc='upper left')
-        if legend2:
-            legend2.get_frame().set_facecolor(self.colors['surface'])
-            legend2.get_frame().set_edgecolor(self.colors['border'])
-            for text in legend2.get_texts():
-                text.set_color(self.colors['text'])
-        
-        # Graph 3: Packet Delivery Timeline (Gantt chart)
-        ax3 = plt.subplot(2, 2, 3)
-        # Get all packets
-        all_packet_ids = list(set([e.get('packet_id') for e in self.packet_events if 'packet_id' in e]))
-        y_positions = {}
-        for i, pid in enumerate(all_packet_ids[:20]):  # Limit to 20 packets
-            y_positions[pid] = i
-            packet_evts = [e for e in self.packet_events if e.get('packet_id') == pid]
-            if packet_evts:
-                start_time = min(e.get('time', 0) for e in packet_evts)
-                end_time = max(e.get('time', 0) for e in packet_evts)
-                status = packet_evts[-1].get('event_type', 'in_transit')
-                
-                # Color by status
-                if status == 'delivered':
-                    color = self.colors['success']
-                elif status == 'dropped':
-                    color = self.colors['error']
-                else:
-                    color = self.colors['accent']
-                
-                if end_time > start_time:
-                    ax3.barh(i, end_time - start_time, left=start_time, height=0.6,
-                            color=color, edgecolor=self.colors['surface'], linewidth=1)
         
+        # Graph 3: Packet Delivery Timeline (Gantt chart), all bars in one collection
+        gantt_bars = PolyCollection([], edgecolors=self.colors['surface'], linewidths=1)
+        ax3.add_collection(gantt_bars)
         ax3.set_xlabel('Time (seconds)', color=self.colors['text_secondary'], fontsize=11)
         ax3.set_ylabel('Packet ID', color=self.colors['text_secondary'], fontsize=11)
         ax3.set_title('Packet Delivery Timeline', color=self.colors['text'], fontsize=13, fontweight='bold')
-        ax3.set_yticks(range(len(all_packet_ids[:20])))
-        ax3.set_yticklabels([str(pid) for pid in all_packet_ids[:20]], color=self.colors['text'])
         ax3.grid(True, alpha=0.3, color=self.colors['border'], axis='x')
         
         # Graph 4: RTT Variation
-        ax4 = plt.subplot(2, 2, 4)
-        if packet_events:
-            times = [e.get('time', 0) for e in packet_events]
-            rtts = [e.get('rtt', 0) for e in packet_events]
-            
-            ax4.plot(times, rtts, color='#8b5cf6', linewidth=2, marker='o', markersize=4, label='RTT')
-            
-            # Moving average (window size = 5)
-            if len(rtts) > 5:
-                moving_avg = []
-                for i in range(len(rtts)):
-                    window = rtts[max(0, i-2):min(len(rtts), i+3)]
-                    moving_avg.append(sum(window) / len(window))
-                ax4.plot(times, moving_avg, color='#fbbf24', linewidth=2, linestyle='--', label='Moving Avg')
-        
+        rtt_line, = ax4.plot([], [], color='#8b5cf6', linewidth=2, marker='o', markersize=4, label='RTT')
+        rtt_avg_line, = ax4.plot([], [], color='#fbbf24', linewidth=2, linestyle='--', label='Moving Avg')
         ax4.set_xlabel('Time (seconds)', color=self.colors['text_secondary'], fontsize=11)
         ax4.set_ylabel('RTT (milliseconds)', color=self.colors['text_secondary'], fontsize=11)
         ax4.set_title('RTT Variation', color=self.colors['text'], fontsize=13, fontweight='bold')
-        legend4 = ax4.legend(loc='upper left')
-        if legend4:
-            legend4.get_frame().set_facecolor(self.colors['surface'])
-            legend4.get_frame().set_edgecolor(self.colors['border'])
-            for text in legend4.get_texts():
-                text.set_color(self.colors['text'])
-
-        self._style_axes([ax1, ax2, ax3, ax4])
         
         fig.subplots_adjust(hspace=0.32, wspace=0.28, left=0.08, right=0.97, top=0.92, bottom=0.08)
         
@@ -2930,8 +4070,23 @@ class CloudNetworkSimulator:
         canvas_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         canvas = FigureCanvasTkAgg(fig, master=canvas_frame)
-        canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        self._timeline_window = timeline_window
+        self._timeline_fig = fig
+        self._timeline_canvas = canvas
+        self._timeline_axes = (ax1, ax2, ax3, ax4)
+        self._timeline_artists = {
+            'cwnd_trace': cwnd_trace,
+            'phase_proxies': phase_proxies,
+            'throughput': throughput_line,
+            'rtt': rtt_line,
+            'rtt_avg': rtt_avg_line,
+            'gantt_bars': gantt_bars,
+            'loss_marks': loss_marks,
+            'congestion_spans': congestion_spans,
+        }
+        timeline_window.protocol("WM_DELETE_WINDOW", timeline_window.withdraw)
         
         # Buttons
         btn_frame = tk.Frame(timeline_window, bg=self.colors['bg'])
@@ -2943,22 +4098,150 @@ class CloudNetworkSimulator:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"packet_trace_{timestamp}.csv"
             try:
-                with open(filename, 'w', newline='') as csvfile:
-                    writer = csv.DictWriter(
-                        csvfile,
-                        fieldnames=['time', 'packet_id', 'cwnd', 'phase', 'rtt', 'event_type', 'throughput']
-                    )
-                    writer.writeheader()
-                    writer.writerows(self.packet_events)
+                fieldnames = ('time', 'packet_id', 'cwnd', 'phase', 'rtt', 'event_type', 'throughput')
+                # One large buffer so the rows reach the disk in a few big writes
+                with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(fieldnames)
+                    # Zip the exported columns into rows; the row loop stays inside the csv module
+                    writer.writerows(zip(*(self.packet_events[name].tolist() for name in fieldnames)))
                 messagebox.showinfo("Export Complete", f"Packet trace exported to:\n{filename}")
             except Exception as exc:
                 messagebox.showerror("Export Failed", f"Unable to export data:\n{exc}")
         
+        self.create_button(btn_frame, "🔄 Refresh", self._request_timeline_refresh, self.colors['accent']).pack(side=tk.LEFT, padx=5)
         self.create_button(btn_frame, "💾 Export Trace", export_trace, self.colors['success']).pack(side=tk.LEFT, padx=5)
+
+        self._refresh_packet_timeline()
+
+    def _request_timeline_refresh(self):
+        """Debounce refresh clicks and reopens into a single timeline rebuild"""
+        if self._timeline_refresh_after_id is not None:
+            self.root.after_cancel(self._timeline_refresh_after_id)
+        self._timeline_refresh_after_id = self.root.after(50, self._do_timeline_refresh)
+
+    def _do_timeline_refresh(self):
+        self._timeline_refresh_after_id = None
+        self._refresh_packet_timeline()
+
+    def _timeline_legend(self, ax, handles):
+        """Themed legend over the given handles, or none when there is nothing to label"""
+        if not handles:
+            if ax.get_legend() is not None:
+                ax.get_legend().remove()
+            return
+        legend = ax.legend(handles=handles, loc='upper left')
+        legend.get_frame().set_facecolor(self.colors['surface'])
+        legend.get_frame().set_edgecolor(self.colors['border'])
+        for text in legend.get_texts():
+            text.set_color(self.colors['text'])
+
+    def _refresh_packet_timeline(self):
+        """Push the current event log into the cached timeline figure"""
+        ax1, ax2, ax3, ax4 = self._timeline_axes
+        artists = self._timeline_artists
+
+        # Select first packet for visualization
+        events = self.packet_events
+        unique_packet_ids = events.packet_ids()
+        rows = events.rows_for(unique_packet_ids[0]) if len(unique_packet_ids) else np.zeros(0, dtype=np.intp)
+
+        # Every column graphs 1, 2 and 4 plot, gathered straight from the event log's columns
+        times, cwnds, phases, throughputs, node_congestions, rtts = (
+            events[name][rows] for name in ('time', 'cwnd', 'phase', 'throughput', 'node_congestion', 'rtt'))
+        loss_events = np.flatnonzero(events['event_type'][rows] == 'dropped')
+        # Samples drawn by the line plots; the loss/congestion markers and the moving average use every event
+        shown = _plot_points(rows.size)
+        
+        # Graph 1: split the trace where the phase changes; each run is one colored segment of the collection
+        breaks = np.concatenate(([0], np.flatnonzero(phases[1:] != phases[:-1]) + 1, [len(phases)])).tolist()
+        points = np.column_stack((times, cwnds))
+        run_starts = breaks[:-1] if rows.size else []
+        phase_code = self._plot_phase_code
+        run_codes = np.fromiter((phase_code[phase] for phase in phases[run_starts]), dtype=np.intp, count=len(run_starts))
+        # Long runs are thinned like the other traces; each keeps its first and last point
+        artists['cwnd_trace'].set_segments([points[start:end + 1][_plot_points(end + 1 - start)]
+                                            for start, end in zip(run_starts, breaks[1:])])
+        artists['cwnd_trace'].set_color(self._plot_phase_rgba[run_codes])
+        # Mark packet loss events
+        artists['loss_marks'].set_segments(_full_height_lines(times[loss_events]))
+        # relim() skips collections, so the trace points are added to the data limits by hand
+        ax1.relim()
+        ax1.update_datalim(points)
+        ax1.autoscale_view()
+        self._timeline_legend(ax1, [artists['phase_proxies'][code] for code in dict.fromkeys(run_codes.tolist())])
+        
+        # Graph 2: Throughput Over Time
+        artists['throughput'].set_data(times[shown], throughputs[shown])
+        # Highlight congestion-limited periods, each reaching out to its neighbouring samples; samples
+        # whose spans would overlap or touch (index gap <= 2) are merged into one rectangle
+        congestion_limited = np.flatnonzero(node_congestions > 7)
+        first = congestion_limited[np.diff(congestion_limited, prepend=-3) > 2]
+        last = congestion_limited[np.diff(congestion_limited, append=len(times) + 2) > 2]
+        span_starts = times[np.maximum(first - 1, 0)]
+        span_ends = times[np.minimum(last + 1, len(times) - 1)]
+        artists['congestion_spans'].set_verts(_full_height_spans(span_starts, span_ends))
+        ax2.relim()
+        ax2.autoscale_view()
+        self._timeline_legend(ax2, [artists['throughput']] if rows.size else [])
+        
+        # Graph 3: Packet Delivery Timeline (Gantt chart)
+        gantt_ids = unique_packet_ids[:20]  # Limit to 20 packets
+        status_colors = {'delivered': self.colors['success'], 'dropped': self.colors['error']}
+        if len(events):
+            # Group the log by packet id with one stable sort (events of a packet keep their order),
+            # then reduce each group's times in C and take its last event type
+            order = np.argsort(events['packet_id'], kind='stable')
+            pid_s = events['packet_id'][order]
+            t_s = events['time'][order]
+            boundaries = np.flatnonzero(np.diff(pid_s) != 0) + 1
+            group_starts = np.r_[0, boundaries]
+            group_lasts = np.r_[boundaries - 1, len(pid_s) - 1]
+            # Groups are in id order; look up the first-seen ids shown on the chart
+            groups = np.searchsorted(pid_s[group_starts], gantt_ids)
+            starts = np.minimum.reduceat(t_s, group_starts)[groups]
+            ends = np.maximum.reduceat(t_s, group_starts)[groups]
+            last_types = events['event_type'][order[group_lasts[groups]]]
+        else:
+            starts = ends = np.empty(0)
+            last_types = ()
+        # Color by status
+        bar_colors = [status_colors.get(t, self.colors['accent']) for t in last_types]
+        # One rectangle per packet in a single collection; packets with a single timestamp have no extent
+        drawn = np.flatnonzero(ends > starts)
+        x0, x1 = starts[drawn], ends[drawn]
+        y0, y1 = drawn - 0.3, drawn + 0.3
+        boxes = np.stack((np.column_stack((x0, y0)), np.column_stack((x1, y0)),
+                          np.column_stack((x1, y1)), np.column_stack((x0, y1))), axis=1)
+        artists['gantt_bars'].set_verts(boxes)
+        artists['gantt_bars'].set_facecolor([bar_colors[i] for i in drawn])
+        ax3.set_yticks(range(len(gantt_ids)))
+        ax3.set_yticklabels([str(pid) for pid in gantt_ids], color=self.colors['text'])
+        # relim() skips collections, so the bar corners are added to the data limits by hand
+        ax3.relim()
+        ax3.update_datalim(boxes.reshape(-1, 2))
+        ax3.autoscale_view()
+        
+        # Graph 4: RTT Variation
+        artists['rtt'].set_data(times[shown], rtts[shown])
+        # Centered moving average (window size = 5), averaging over fewer samples at the edges
+        if len(rtts) > 5:
+            artists['rtt_avg'].set_data(times[shown], _centered_mean(rtts, 5)[shown])
+            rtt_handles = [artists['rtt'], artists['rtt_avg']]
+        else:
+            artists['rtt_avg'].set_data([], [])
+            rtt_handles = [artists['rtt']] if rows.size else []
+        ax4.relim()
+        ax4.autoscale_view()
+        self._timeline_legend(ax4, rtt_handles)
+
+        self._timeline_canvas.draw_idle()
     
     # NEW: Show Algorithm Settings Window
     def show_algorithm_settings(self):
         """Display algorithm settings configuration window"""
+        if self._reopen_tool_window('settings'):
+            return
         settings_window = tk.Toplevel(self.root)
         settings_window.title("⚙️ Algorithm Settings")
         settings_window.geometry("500x600")
@@ -3027,14 +4310,22 @@ class CloudNetworkSimulator:
         def apply_settings():
             self.packet_loss_rate = loss_var.get()
             self.learn_mode = learn_var.get()
-            settings_window.destroy()
+            settings_window.withdraw()
             messagebox.showinfo("Settings Applied", "Algorithm settings updated successfully")
         
         self.create_button(settings_window, "✓ Apply Settings", apply_settings, self.colors['success']).pack(pady=20)
+
+        def load_current_settings():
+            # Unapplied edits from a previous opening are discarded
+            loss_var.set(self.packet_loss_rate)
+            learn_var.set(self.learn_mode)
+            update_loss_label(self.packet_loss_rate)
+
+        self._keep_tool_window('settings', settings_window, load_current_settings)
         
     def show_node_info(self, node):
         info = f"Node: {node.name}\n"
-        info += f"Type: {node.type.upper()}\n"
+        info += f"Type: {node.type_name.upper()}\n"
         info += f"Latency: {node.latency}ms\n"
         info += f"Throughput: {node.throughput}Mbps\n"
         info += f"Connections: {len(node.connections)}\n"
@@ -3046,6 +4337,8 @@ class CloudNetworkSimulator:
         if not self.nodes:
             messagebox.showwarning("No Data", "Add nodes to view metrics")
             return
+        if self._reopen_tool_window('metrics'):
+            return
             
         metrics_window = tk.Toplevel(self.root)
         metrics_window.title("TCP Congestion Metrics")
@@ -3060,27 +4353,17 @@ class CloudNetworkSimulator:
         info_frame = tk.Frame(metrics_window, bg=self.colors['surface'], highlightbackground=self.colors['border'], highlightthickness=1)
         info_frame.pack(fill=tk.X, padx=20, pady=10)
         
-        algo_name = "Reno" if self.congestion_algorithm == "reno" else "Tahoe"
-        phase_counts = self.get_phase_counts()
-        avg_latency = sum(n.latency for n in self.nodes) / len(self.nodes)
-        avg_throughput = sum(self.throughput_history) / len(self.throughput_history) if self.throughput_history else 0
-        
-        metrics = [
-            ("Current Algorithm", f"TCP {algo_name}"),
-            ("Traffic Load", self.traffic_load.title()),
-            ("Active Packets", len(self.packets)),
-            ("Avg cwnd", f"{(sum(p.cwnd for p in self.packets)/len(self.packets)):.1f} MSS" if self.packets else "0 MSS"),
-            ("Avg Latency", f"{avg_latency:.1f} ms"),
-            ("Avg Throughput", f"{avg_throughput:.2f} Mbps")
-        ]
-        
-        for idx, (label, value) in enumerate(metrics):
-            row = tk.Frame(info_frame, bg=self.colors['surface'])
-            row.pack(fill=tk.X, padx=15, pady=4)
-            tk.Label(row, text=label, fg=self.colors['text_secondary'], bg=self.colors['surface'],
-                     font=("Segoe UI", 10)).pack(side=tk.LEFT)
-            tk.Label(row, text=value, fg=self.colors['text'], bg=self.colors['surface'],
-                     font=("Segoe UI", 11, "bold")).pack(side=tk.RIGHT)
+        # Metric name/value rows as one Treeview instead of a frame and two labels per row
+        metric_names = ("Current Algorithm", "Traffic Load", "Active Packets", "Avg cwnd", "Avg Latency", "Avg Throughput")
+        style = ttk.Style(metrics_window)
+        style.configure("Metrics.Treeview", background=self.colors['surface'], fieldbackground=self.colors['surface'],
+                        foreground=self.colors['text'], font=("Segoe UI", 10), rowheight=26, borderwidth=0)
+        metric_tree = ttk.Treeview(info_frame, columns=('value',), show='tree', height=len(metric_names),
+                                   selectmode='none', style="Metrics.Treeview")
+        metric_tree.column('#0', anchor='w', stretch=True)
+        metric_tree.column('value', anchor='e', width=160, stretch=False)
+        metric_tree.pack(fill=tk.X, padx=15, pady=4)
+        metric_rows = [metric_tree.insert('', tk.END, text=name, values=("",)) for name in metric_names]
         
         phase_frame = tk.Frame(metrics_window, bg=self.colors['bg'])
         phase_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
@@ -3088,26 +4371,49 @@ class CloudNetworkSimulator:
         tk.Label(phase_frame, text="Phase Distribution", font=("Segoe UI", 13, "bold"),
                  bg=self.colors['bg'], fg=self.colors['text']).pack(anchor='w', pady=5)
         
-        for phase_key, meta in self.phase_definitions.items():
-            bar_frame = tk.Frame(phase_frame, bg=self.colors['bg'])
-            bar_frame.pack(fill=tk.X, pady=4)
-            phase_name = meta["name"]
-            count = phase_counts.get(phase_key, 0)
-            tk.Label(bar_frame, text=f"{phase_name}", width=18, anchor='w',
-                     bg=self.colors['bg'], fg=meta["color"],
-                     font=("Segoe UI", 10, "bold")).pack(side=tk.LEFT)
-            progress = tk.Canvas(bar_frame, height=16, bg=self.colors['panel_bg'], highlightthickness=0)
-            progress.pack(fill=tk.X, expand=True, padx=8)
-            width = min(200, 20 * count)
-            progress.create_rectangle(0, 0, width, 16, fill=meta["color"], outline="")
-            progress.create_text(5, 8, text=f"{count} packet(s)", anchor='w',
-                                 fill=self.colors['text'], font=("Segoe UI", 9))
+        # Every phase row (name, bar track, bar, count) drawn on one canvas
+        row_height, bar_x = 24, 150
+        phase_canvas = tk.Canvas(phase_frame, height=row_height * len(self.phase_definitions),
+                                 bg=self.colors['bg'], highlightthickness=0)
+        phase_canvas.pack(fill=tk.X)
+        phase_bars = []  # (phase key, bar item, text item, row top)
+        for row, (phase_key, meta) in enumerate(self.phase_definitions.items()):
+            top = row * row_height + 4
+            phase_canvas.create_text(0, top + 8, anchor='w', text=meta["name"], fill=meta["color"],
+                                     font=("Segoe UI", 10, "bold"))
+            phase_canvas.create_rectangle(bar_x, top, bar_x + 200, top + 16, fill=self.colors['panel_bg'], outline="")
+            bar = phase_canvas.create_rectangle(bar_x, top, bar_x, top + 16, fill=meta["color"], outline="")
+            text = phase_canvas.create_text(bar_x + 5, top + 8, anchor='w', fill=self.colors['text'],
+                                            font=("Segoe UI", 9))
+            phase_bars.append((phase_key, bar, text, top))
         
         summary = tk.Label(metrics_window,
                            text="Slow Start → Congestion Avoidance → Fast Retransmit → Fast Recovery",
                            bg=self.colors['bg'], fg=self.colors['text_secondary'],
                            font=("Segoe UI", 9, "italic"))
         summary.pack(pady=10)
+
+        def refresh_metrics():
+            algo_name = "Reno" if self.congestion_algorithm == "reno" else "Tahoe"
+            avg_latency = self._mean_node_latency
+            avg_throughput = self.perf_history.mean_throughput()
+            values = (
+                f"TCP {algo_name}",
+                self.traffic_load.title(),
+                len(self.packets),
+                f"{(self._tally.cwnd_sum / len(self.packets)):.1f} MSS" if self.packets else "0 MSS",
+                f"{avg_latency:.1f} ms",
+                f"{avg_throughput:.2f} Mbps",
+            )
+            for item, value in zip(metric_rows, values):
+                metric_tree.item(item, values=(value,))
+            phase_counts = self.get_phase_counts()
+            for phase_key, bar, text, top in phase_bars:
+                count = phase_counts.get(phase_key, 0)
+                phase_canvas.coords(bar, bar_x, top, bar_x + min(200, 20 * count), top + 16)
+                phase_canvas.itemconfigure(text, text=f"{count} packet(s)")
+
+        self._keep_tool_window('metrics', metrics_window, refresh_metrics)
         
     def reset_network(self, confirm=True):
         if confirm and not messagebox.askyesno("Reset", "Clear all nodes and connections?"):
@@ -3115,16 +4421,20 @@ class CloudNetworkSimulator:
             
         self.nodes.clear()
         self.connections.clear()
+        self._link_set.clear()
+        self._recycle_packets(self.packets)
         self.packets.clear()
+        self._clear_packet_positions()
+        self._packets_dirty = True
+        self.canvas.delete("packet")
+        self.invalidate_topology()
         self.simulation_running = False
         self.manual_packet_mode = False
         self.active_manual_packet_ids.clear()
         self.stop_packet_details_updates()
         self.sim_button.config(text="▶ Start Simulation", bg=self.colors['accent'])
         # NEW: Clear performance data
-        self.latency_history.clear()
-        self.throughput_history.clear()
-        self.time_stamps.clear()
+        self.perf_history.clear()
         self.performance_start_time = time.time()
          # NEW: Clear routing statistics
         self.routing_stats = {
@@ -3132,19 +4442,20 @@ class CloudNetworkSimulator:
             'avg_hop_count': 0,
             'min_hops': float('inf'),
             'max_hops': 0,
-            'path_history': []
+            'path_history': deque(maxlen=PATH_HISTORY_LIMIT)
         }
         # NEW: Clear packet events and reset counter
         self.packet_events.clear()
+        self._event_tally = EventTally()
+        self._sampled_event_accum.clear()
         self.packet_counter = 0
         # Clear tooltip if exists
         self.hide_tooltip()
-        # Stop status updates
-        if self.status_update_timer:
-            self.root.after_cancel(self.status_update_timer)
-        self.draw_network()
-        self.status_label.config(text="Network reset")
-        self.update_real_time_stats()
+        # Stop generation/decay/status updates
+        self._stop_sim_tick()
+        self.schedule_redraw()
+        self.set_status("Network reset")
+        self._request_stats_update()
         self.populate_node_options()
 
 if __name__ == "__main__":
@@ -0,0 +1,42 @@
+import random
+
+import numpy as np
+import pytest
+
+import main
+
+
+def random_csr(n, edges, seed):
+    """Random undirected graph as int32 CSR arrays, weighted like CloudNetworkSimulator's CSR (by sender latency)"""
+    rng = random.Random(seed)
+    adj = {i: set() for i in range(n)}
+    for _ in range(edges):
+        a, b = rng.sample(range(n), 2)
+        adj[a].add(b)
+        adj[b].add(a)
+    latency = np.array([rng.randint(5, 50) for _ in range(n)], dtype=np.float64)
+    degree = np.array([len(adj[i]) for i in range(n)])
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(degree, out=indptr[1:])
+    neighbors = np.array([v for i in range(n) for v in sorted(adj[i])], dtype=np.int32)
+    return indptr, neighbors, np.repeat(latency, degree)
+
+
+def test_numba_heap_dijkstra_matches_python():
+    numba = pytest.importorskip("numba")
+    kernel = numba.njit(main._dijkstra_csr_heap)
+    for seed in range(20):
+        n = 2 + seed
+        indptr, neighbors, weights = random_csr(n, 2 * n, seed)
+        edge_weight = {(u, int(neighbors[k])): weights[k]
+                       for u in range(n) for k in range(indptr[u], indptr[u + 1])}
+        for src in range(n):
+            dist, prev = kernel(indptr, neighbors, weights, src, n)
+            expected_dist, _ = main._dijkstra_csr_py(indptr, neighbors, weights, src, n)
+            np.testing.assert_allclose(dist, expected_dist)
+            # Equal-cost routes may tie-break differently; every predecessor must still lie on a shortest path
+            for v in range(n):
+                if v == src or np.isinf(dist[v]):
+                    assert prev[v] == -1
+                else:
+                    assert dist[prev[v]] + edge_weight[(int(prev[v]), v)] == pytest.approx(dist[v])